@@ -28,6 +28,7 @@ setup(
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.10",
+    extras_require={"numpy": ["numpy"]},
     include_package_data=True,
     package_data={"": ["*.ttf", "*.png", "*.pdf", "*.jar", "*.json", "*.ini"]}
 
@@ -1,22 +1,36 @@
-from typing import TypeVar, Type
+from typing import Any, Callable, TypeVar, Type, get_type_hints
+
+from tython.src.main.data_holder.validators import compile_validator
 
 T = TypeVar("T")
 
 
 class AbstractKey:
     _delegated_attrs = dict()
+    _validators = dict()
 
     @classmethod
     def delegate(cls, delegated_class: Type[T]) -> T:
         """
         Use this decorator to delegate attributes from the delegated_class to the Key class.
+        Each key gets a validator compiled from its annotation once, here.
         """
         class_items = dict(delegated_class.__dict__).get("__annotations__")
+        try:
+            # Resolves annotations written as strings, falling back to them as they are
+            class_items = {key: annotation for key, annotation in get_type_hints(delegated_class).items() if key in class_items}
+        except (NameError, TypeError):
+            pass
         for key in class_items.keys():
             setattr(delegated_class, key, key)
         cls._delegated_attrs.update(class_items)
+        cls._validators.update((key, compile_validator(annotation)) for key, annotation in class_items.items())
         return delegated_class()
 
     @classmethod
     def get_type(cls, key):
         return cls._delegated_attrs.get(key)
+
+    @classmethod
+    def get_validator(cls, key) -> Callable[[Any], bool]:
+        return cls._validators.get(key)
@@ -2,20 +2,49 @@ import copy
 from typing import TypeVar
 
 from tython.src.main.data_holder.abstract_key import AbstractKey
+from tython.src.main.data_holder.validators import type_name
+from tython.src.main.data_structures.freezing import freeze
 
 T = TypeVar("T")
 
+FREEZE_ON_WRITE = "freeze_on_write"
+COPY_ON_READ = "copy_on_read"
+
+
+class _CopiedOnRead:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
 
 class DataHolder:
+    """
+    By default values are frozen once when written (see freeze) and reads return them without copying.
+    Set copy_mode = COPY_ON_READ on a subclass to keep values as given and deep copy them on every read instead.
+    Values freeze cannot make immutable, such as instances of your own classes or lists holding them,
+    are always kept as given and deep copied on every read.
+
+    This changes what reads return compared to deep copying: lists come back as PersistentLists, dicts as
+    FrozenDicts, sets as FrozenSets and bytearrays as bytes. They are not list or dict instances, in place
+    mutators such as append or update raise AttributeError, and json.dumps needs thaw(value) first.
+    They can be written back to the same key as is. Use COPY_ON_READ where callers rely on the old types.
+    """
+    copy_mode: str = FREEZE_ON_WRITE
+
     def __getitem__(self, item: T, default: T = None) -> T:
-        return copy.deepcopy(self.__dict__.get(item, default))
+        return self.get(item, default)
 
     def get(self, item: T, default: T = None) -> T:
-        return copy.deepcopy(self.__dict__.get(item, default))
+        value = self.__dict__.get(item, default)
+        if value.__class__ is _CopiedOnRead:
+            return copy.deepcopy(value.value)
+        return value
 
     def offer(self, *pairs: tuple[T, T]):
         """
         Offer pairs of key and value to the data holder.
+        The whole batch is validated before anything is written, so a bad pair leaves the holder unchanged.
 
         Example:
          data_holder.offer(
@@ -26,12 +55,28 @@ class DataHolder:
         if not isinstance(next(iter(pairs)), tuple):
             pairs = (pairs,)
         for key, value in pairs:
-            self.__setitem__(key, value)
+            self._validate(key, value)
+        for key, value in pairs:
+            self._store(key, value)
 
     def __setitem__(self, key: T, value: T):
-        key_type = AbstractKey.get_type(key)
-        required_type = key_type.__name__.lower()
-        if required_type not in {"any", "optional"} and required_type != type(value).__name__.lower():
-            raise TypeError(
-                f"Value provided for key {key} must be of type {key_type.__name__} not {type(value).__name__}")
-        self.__dict__[key] = value
+        self._validate(key, value)
+        self._store(key, value)
+
+    @staticmethod
+    def _validate(key: T, value: T):
+        validator = AbstractKey.get_validator(key)
+        if validator is None:
+            raise KeyError(f"Key {key} was not declared with AbstractKey.delegate")
+        if not validator(value):
+            raise TypeError(f"Value provided for key {key} must be of type {type_name(AbstractKey.get_type(key))} "
+                            f"not {type(value).__name__}")
+
+    def _store(self, key: T, value: T):
+        if self.copy_mode != COPY_ON_READ:
+            try:
+                self.__dict__[key] = freeze(value)
+                return
+            except TypeError:
+                pass
+        self.__dict__[key] = _CopiedOnRead(value)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from functools import partial
+from types import UnionType
+from typing import Any, Callable, Literal, TypeVar, Union, get_args, get_origin
+
+from tython.src.main.data_structures.freezing import FROZEN_TYPES
+from tython.src.main.nullable.nullable import Nullable
+
+Validator = Callable[[Any], bool]
+
+
+def compile_validator(annotation) -> Validator:
+    """
+    Fast callable telling whether a value matches annotation, built once per key.
+    Classes accept their subclasses and the type they are frozen into, so a list key accepts a PersistentList
+    read back from a DataHolder. Optional, Union and X | Y any of their members, Nullable[X] None,
+    a Nullable or an X, and generics such as list[int], tuple[str, ...] or dict[str, list[int]] check their
+    container then every element. Annotations left as strings match on the lowercased type name,
+    and Any, TypeVars and unsupported forms accept everything.
+    """
+    if annotation is Any or annotation is object or annotation is Nullable or isinstance(annotation, TypeVar):
+        return _accept
+    if annotation is None or annotation is type(None):
+        return _is_none
+    if isinstance(annotation, str):
+        return _named(annotation)
+    origin = get_origin(annotation)
+    arguments = get_args(annotation)
+    if origin is Union or origin is UnionType:
+        return _union(arguments)
+    if origin is Literal:
+        return lambda value: value in arguments
+    if origin is Nullable:
+        contained = compile_validator(arguments[0]) if arguments else _accept
+        return lambda value: value is None or isinstance(value, Nullable) or contained(value)
+    if isinstance(origin, type):
+        return _generic(origin, arguments)
+    if isinstance(annotation, type):
+        accepted = _accepted(annotation)
+        return lambda value: isinstance(value, accepted)
+    return _accept
+
+
+def type_name(annotation) -> str:
+    if isinstance(annotation, type) and not get_args(annotation):
+        return annotation.__name__
+    return str(annotation).replace("typing.", "")
+
+
+def _accept(value) -> bool:
+    return True
+
+
+def _is_none(value) -> bool:
+    return value is None
+
+
+def _accepted(annotation: type) -> tuple:
+    for base in annotation.__mro__:
+        if base in FROZEN_TYPES:
+            return annotation, FROZEN_TYPES[base]
+    return annotation,
+
+
+def _named(name: str) -> Validator:
+    name = name.lower()
+    if name == "any" or name.startswith("optional"):
+        return _accept
+    names = {name} | {frozen.__name__.lower() for mutable, frozen in FROZEN_TYPES.items() if mutable.__name__ == name}
+    return lambda value: type(value).__name__.lower() in names
+
+
+def _union(arguments: tuple) -> Validator:
+    if all(isinstance(argument, type) and not get_args(argument) for argument in arguments):
+        # Plain classes and NoneType are checked in a single isinstance call
+        accepted = tuple(accepted for argument in arguments for accepted in _accepted(argument))
+        return lambda value: isinstance(value, accepted)
+    validators = tuple(map(compile_validator, arguments))
+    return lambda value: any(validator(value) for validator in validators)
+
+
+def _generic(origin: type, arguments: tuple) -> Validator:
+    accepted = _accepted(origin)
+    if not arguments:
+        return lambda value: isinstance(value, accepted)
+    if issubclass(origin, Mapping) and len(arguments) == 2:
+        key_validator, value_validator = map(compile_validator, arguments)
+        return lambda value: isinstance(value, accepted) and all(
+            key_validator(key) and value_validator(item) for key, item in value.items())
+    if issubclass(origin, tuple) and not (len(arguments) == 2 and arguments[1] is Ellipsis):
+        validators = tuple(map(compile_validator, arguments))
+        return lambda value: isinstance(value, accepted) and len(value) == len(validators) and all(
+            validator(item) for validator, item in zip(validators, value))
+    if issubclass(origin, Iterable) and not issubclass(origin, Iterator):
+        element_validator = compile_validator(arguments[0])
+        if element_validator is _accept:
+            return lambda value: isinstance(value, accepted)
+        return partial(_elements, accepted, element_validator)
+    return lambda value: isinstance(value, accepted)
+
+
+def _elements(accepted: tuple, element_validator: Validator, value) -> bool:
+    if isinstance(value, Iterator):
+        # Iterators are not checked element by element, as that would consume them
+        return isinstance(value, accepted)
+    return isinstance(value, accepted) and all(map(element_validator, value))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, Optional, Sized
+
+
+async def gather_bounded(fun: Callable[..., Awaitable], arguments: Iterable[tuple], concurrency: int = None,
+                         timeout: float = None) -> list:
+    """
+    Awaits fun(*arguments) for every argument tuple and returns the results in input order.
+    At most concurrency calls run at once, and a call running longer than timeout seconds raises asyncio.TimeoutError.
+    When a call fails, or the caller is cancelled, every call still running is cancelled before the error propagates.
+    """
+    arguments = arguments if isinstance(arguments, Sized) else list(arguments)
+    results: list = [None] * len(arguments)
+    pending = iter(enumerate(arguments))
+
+    async def worker():
+        # Workers share one iterator, so each argument tuple is taken exactly once and at most
+        # concurrency calls are in flight, without a task per element
+        for index, args in pending:
+            results[index] = await _call(fun, args, timeout)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(_worker_count(len(arguments), concurrency))]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+    return results
+
+
+def _worker_count(length: int, concurrency: Optional[int]) -> int:
+    if concurrency is not None and concurrency < 1:
+        raise ValueError(f"Concurrency must be at least 1, not {concurrency}")
+    return length if concurrency is None else min(length, concurrency)
+
+
+async def _call(fun: Callable[..., Awaitable], args: tuple, timeout: Optional[float]) -> Any:
+    if timeout is None:
+        return await fun(*args)
+    return await asyncio.wait_for(fun(*args), timeout)
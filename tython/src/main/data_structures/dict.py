@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import ItemsView, KeysView, Mapping, ValuesView
 from functools import reduce
-from itertools import chain
-from typing import Callable, Any, TypeVar
+from itertools import chain, starmap
+from operator import itemgetter
+from typing import Callable, Any, TypeVar, TYPE_CHECKING, Iterable, Iterator, Tuple
 
-from tython.src.main.data_structures.placeholder import Placeholder
+from tython.src.main.data_structures import kernels, joins
+from tython.src.main.data_structures.asynchronous import gather_bounded
+from tython.src.main.data_structures.memo import MemoCache
+from tython.src.main.data_structures.placeholder import Placeholder, compile_placeholder
+
+if TYPE_CHECKING:
+    from tython.src.main.data_structures.dict_view import DictView
+    from tython.src.main.data_structures.grouping import Grouping
+    from tython.src.main.data_structures.persistent_dict import PersistentDict
+    from tython.src.main.data_structures.sequence import Sequence
 
 T = TypeVar("T")
 
@@ -14,16 +25,26 @@ class Dict(dict):
     @staticmethod
     def eval(fun) -> Callable:
         if isinstance(fun, Placeholder):
-            return fun.eval
+            return compile_placeholder(fun)
         return fun
 
     # Base functions =============================================
     def map_keys(self, fun: Callable[[T], Any]) -> Dict:
         return Dict({self.eval(fun)(key, value): value for key, value in self.items()})
 
-    def map_values(self, fun: Callable[[T], Any]) -> Dict:
+    def map_values(self, fun: Callable[[T], Any], cache: MemoCache = None) -> Dict:
+        """
+        With a MemoCache shared across calls, results are cached per (key, value) entry,
+        so mapping the same entries again with the same function reuses them. Keys are unique within one call.
+        """
+        if cache is not None:
+            memoized = cache.memoized(self.eval(fun), spread=True)
+            return Dict({entry[0]: memoized(entry) for entry in self.items()})
         return Dict({key: self.eval(fun)(key, value) for key, value in self.items()})
 
+    async def amap_values(self, fun: Callable[[T], Any], concurrency: int = None, timeout: float = None) -> Dict:
+        return Dict(zip(self, await gather_bounded(self.eval(fun), self.items(), concurrency, timeout)))
+
     def map(self, fun: Callable[[T], Any]) -> Dict:
         return Dict((self.eval(fun)(key, value) for key, value in self.items()))
 
@@ -39,16 +60,22 @@ class Dict(dict):
         return reduce(self.eval(fun), self, initial_value)
 
     def flatten(self) -> Dict:
-        return Dict(chain(*self))
+        """
+        Entries of every value, each a mapping or an iterable of (key, value) pairs
+        """
+        return Dict(kernels.flatten_entries(self.values()))
 
     def flat_map_values(self, fun: Callable[[T], Any]) -> Dict:
-        return self.map_values(self.eval(fun)).flatten()
+        return self.flat_map(fun)
 
     def flat_map_keys(self, fun: Callable[[T], Any]) -> Dict:
-        return self.map_keys(self.eval(fun)).flatten()
+        return self.flat_map(fun)
 
     def flat_map(self, fun: Callable[[T], Any]) -> Dict:
-        return self.map(self.eval(fun)).flatten()
+        """
+        Entries of every fun(key, value), each a mapping or an iterable of (key, value) pairs
+        """
+        return Dict(kernels.flatten_entries(starmap(self.eval(fun), self.items())))
 
     def nested_map(self, fun: Callable[[T], Any]) -> Dict:
         return self.map(lambda it: it.map(self.eval(fun)))
@@ -60,118 +87,191 @@ class Dict(dict):
         return self.map_keys(lambda it: it.map_keys(self.eval(fun)))
 
     def map_indexed(self, fun: Callable[[int, T], Any]) -> Dict:
-        return Dict((self.eval(fun)(index, key, value) for index, (key, value) in enumerate(self)))
+        return Dict(starmap(self.eval(fun), kernels.indexed_entries(self.items())))
 
     def map_indexed_values(self, fun: Callable[[int, T], Any]) -> Dict:
-        return Dict({key: self.eval(fun)(index, key, value) for index, (key, value) in enumerate(self)})
+        evaluated = self.eval(fun)
+        indexed = kernels.indexed_entries(self.items())
+        return Dict({key: evaluated(index, key, value) for index, key, value in indexed})
 
     def map_indexed_keys(self, fun: Callable[[int, T], Any]) -> Dict:
-        return Dict({self.eval(fun)(index, key, value): value for index, (key, value) in enumerate(self)})
+        evaluated = self.eval(fun)
+        indexed = kernels.indexed_entries(self.items())
+        return Dict({evaluated(index, key, value): value for index, key, value in indexed})
 
     def all(self, fun: Callable[[T], Any]) -> bool:
-        return all((self.eval(fun)(key, value) for key, value in self.items()))
+        return all(starmap(self.eval(fun), self.items()))
 
     def none(self, fun: Callable[[T], Any]) -> bool:
-        return not any((self.eval(fun)(key, value) for key, value in self.items()))
+        return not any(starmap(self.eval(fun), self.items()))
 
     def any(self, fun: Callable[[T], Any]) -> bool:
-        return any((self.eval(fun)(key, value) for key, value in self.items()))
+        return any(starmap(self.eval(fun), self.items()))
 
     def reverse(self) -> Dict:
-        return Dict(reversed(self))
+        return Dict(reversed(self.items()))
 
     def first(self, fun: Callable[[T], bool] = None) -> T:
-        try:
-            if fun:
-                return next(filter(lambda it: self.eval(fun)(it[0], it[1]), self.items()))
-            return next(iter(self.items()), Dict())
-        except StopIteration:
-            return Dict()
+        return kernels.first_entry(self.items(), self.eval(fun), Dict())
 
     def last(self, fun: Callable[[T], bool] = None) -> T:
-        return self.reverse().first(self.eval(fun))
+        return kernels.first_entry(reversed(self.items()), self.eval(fun), Dict())
 
     def length(self) -> int:
         return len(self)
 
+    def freeze(self) -> FrozenDict:
+        return FrozenDict(self)
+
+    def to_persistent(self) -> "PersistentDict":
+        from tython.src.main.data_structures.persistent_dict import PersistentDict
+        return PersistentDict(self)
+
+    def as_sequence(self) -> "Sequence":
+        from tython.src.main.data_structures.sequence import Sequence
+        return Sequence(self.items())
+
+    lazy = as_sequence
+
+    def view(self) -> "DictView":
+        """
+        Lazy read only Mapping over this dict, see DictView
+        """
+        from tython.src.main.data_structures.dict_view import DictView
+        return DictView(self)
+
     # Composite funs ========================================
 
     def map_not_none(self, fun: Callable[[T], Any]) -> Dict:
-        return self.filter_none().map(self.eval(fun)).filter_none()
+        return Dict(kernels.entries_not_none(starmap(self.eval(fun), kernels.entries_not_none(self.items()))))
 
     def map_not_none_values(self, fun: Callable[[T], Any]) -> Dict:
-        return self.filter_none().map_values(self.eval(fun)).filter_none()
+        mapped = ((key, self.eval(fun)(key, value)) for key, value in kernels.entries_not_none(self.items()))
+        return Dict(kernels.entries_not_none(mapped))
 
     def map_not_none_keys(self, fun: Callable[[T], Any]) -> Dict:
-        return self.filter_none().map_keys(self.eval(fun)).filter_none()
+        return Dict((self.eval(fun)(key, value), value) for key, value in kernels.entries_not_none(self.items()))
 
     def map_not_none_indexed(self, fun: Callable[[int, T], Any]) -> Dict:
-        filtered_indexed = Dict(enumerate(self)).filter(lambda it: it[1] is not None)
-        return filtered_indexed.map(lambda value: self.eval(fun)(value[0], value[1])).filter_none()
+        return Dict(kernels.entries_not_none(starmap(self.eval(fun), kernels.indexed_entries_not_none(self.items()))))
 
     def map_not_none_indexed_values(self, fun: Callable[[int, T], Any]) -> Dict:
-        filtered_indexed = Dict(enumerate(self)).filter(lambda it: it[1] is not None)
-        return filtered_indexed.map_values(lambda value: self.eval(fun)(value[0], value[1])).filter_none()
+        indexed = kernels.indexed_entries_not_none(self.items())
+        return Dict(kernels.entries_not_none((key, self.eval(fun)(index, key, value)) for index, key, value in indexed))
 
     def map_not_none_indexed_keys(self, fun: Callable[[int, T], Any]) -> Dict:
-        filtered_indexed = Dict(enumerate(self)).filter(lambda it: it[1] is not None)
-        return filtered_indexed.map_keys(lambda value: self.eval(fun)(value[0], value[1])).filter_none()
+        indexed = kernels.indexed_entries_not_none(self.items())
+        return Dict((self.eval(fun)(index, key, value), value) for index, key, value in indexed)
 
     def flat_map_not_none(self, fun: Callable[[T], Any]) -> Dict:
-        return self.map_not_none(self.eval(fun)).flatten()
+        mapped = starmap(self.eval(fun), kernels.entries_not_none(self.items()))
+        return Dict(kernels.flatten_entries(kernels.not_none(mapped)))
 
     def flat_map_not_none_values(self, fun: Callable[[T], Any]) -> Dict:
-        return self.map_not_none_values(self.eval(fun)).flatten()
+        return self.flat_map_not_none(fun)
 
     def flat_map_not_none_keys(self, fun: Callable[[T], Any]) -> Dict:
-        return self.map_not_none_keys(self.eval(fun)).flatten()
+        return self.flat_map_not_none(fun)
 
     def flat_map_indexed(self, fun: Callable[[int, T], Any]) -> Dict:
-        return self.map_indexed_values(self.eval(fun)).flatten()
+        return Dict(kernels.flatten_entries(starmap(self.eval(fun), kernels.indexed_entries(self.items()))))
 
     def flat_map_indexed_values(self, fun: Callable[[int, T], Any]) -> Dict:
-        return self.map_indexed_keys(self.eval(fun)).flatten()
+        return self.flat_map_indexed(fun)
 
     def flat_map_indexed_keys(self, fun: Callable[[int, T], Any]) -> Dict:
-        return self.map_indexed(self.eval(fun)).flatten()
+        return self.flat_map_indexed(fun)
 
     def flat_map_not_none_indexed(self, fun: Callable[[int, T], Any]) -> Dict:
-        return self.map_not_none_indexed(self.eval(fun)).flatten()
+        indexed = kernels.indexed_entries_not_none(self.items())
+        return Dict(kernels.flatten_entries(kernels.not_none(starmap(self.eval(fun), indexed))))
 
     def nested_map_not_none(self, fun: Callable[[T], Any]) -> Dict:
-        return self.map_not_none(self.eval(fun)).nested_map(lambda it: it)
+        mapped = starmap(self.eval(fun), kernels.entries_not_none(self.items()))
+        return Dict(kernels.nested_entries(kernels.entries_not_none(mapped)))
 
     def nested_map_indexed(self, fun: Callable[[int, T], Any]) -> Dict:
-        return self.map_indexed(self.eval(fun)).nested_map(lambda it: it)
+        return Dict(kernels.nested_entries(starmap(self.eval(fun), kernels.indexed_entries(self.items()))))
 
     def nested_map_not_none_indexed(self, fun: Callable[[int, T], Any]) -> Dict:
-        return self.map_not_none_indexed(self.eval(fun)).nested_map(lambda it: it)
+        mapped = starmap(self.eval(fun), kernels.indexed_entries_not_none(self.items()))
+        return Dict(kernels.nested_entries(kernels.entries_not_none(mapped)))
 
     def first_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().first(self.eval(fun))
+        return kernels.first_entry(kernels.entries_not_none(self.items()), self.eval(fun), Dict())
 
     def last_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().last(self.eval(fun))
+        return kernels.first_entry(kernels.entries_not_none(reversed(self.items())), self.eval(fun), Dict())
 
     def first_indexed(self, fun: Callable[[int, T], Any] = None):
-        return self.map_indexed(self.eval(fun)).first()
+        return self._indexed_entry(0, kernels.first_entry(self.items()), fun)
 
     def last_indexed(self, fun: Callable[[int, T], Any] = None):
-        return self.map_indexed(self.eval(fun)).last()
+        return self._indexed_entry(len(self) - 1, kernels.first_entry(reversed(self.items())), fun)
 
     def first_indexed_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().first_indexed(self.eval(fun))
+        return self._indexed_entry(0, kernels.first_entry(kernels.entries_not_none(self.items())), fun)
 
     def last_indexed_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().last_indexed(self.eval(fun))
+        entry = kernels.first_entry(kernels.entries_not_none(reversed(self.items())))
+        if entry is None:
+            return Dict()
+        return self._indexed_entry(kernels.count_not_none(self.values()) - 1, entry, fun)
+
+    def _indexed_entry(self, index: int, entry, fun: Callable[[int, T], Any] = None):
+        if entry is None:
+            return Dict()
+        return entry if fun is None else self.eval(fun)(index, *entry)
 
     # Specific funs ========================================
 
     def group_by(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.map(lambda it: (self.eval(fun)(it), it))
+        """
+        Entries grouped in Dicts by fun(key, value)
+        """
+        return kernels.grouped(Dict(), kernels.keyed(_spread(self.eval(fun)), self.items()), Dict, _put_entry)
 
     def group_by_not_none(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.map_not_none(lambda it: (self.eval(fun)(it), it))
+        entries = kernels.entries_not_none(self.items())
+        return kernels.grouped(Dict(), kernels.keyed_not_none(_spread(self.eval(fun)), entries), Dict, _put_entry)
+
+    def grouping_by(self, fun: Callable[[T], Any]) -> "Grouping":
+        """
+        Values grouped by fun(key, value), for aggregation
+        """
+        from tython.src.main.data_structures.grouping import Grouping
+        return Grouping(self.items(), _spread(self.eval(fun)), itemgetter(1))
+
+    def join(self, other: dict, how: str = "inner") -> Dict:
+        """
+        key -> (value, other value), for keys of both dicts, of this one with how="left" or of either with how="outer",
+        None standing in for a missing value. Keys follow this dict's order, then the other's for how="outer"
+        """
+        if how not in joins.JOIN_TYPES:
+            raise ValueError(f"Join type must be one of {list(joins.JOIN_TYPES)}, not {how}")
+        if how == "inner":
+            keys = filter(other.__contains__, self)
+        elif how == "left":
+            keys = iter(self)
+        else:
+            keys = chain(self, (key for key in other if key not in self))
+        return Dict((key, (self.get(key), other.get(key))) for key in keys)
+
+    def merge_with(self, *others: dict, combine: Callable[[Any, Any], Any] = None) -> Dict:
+        """
+        New Dict of these entries and the others', combine(existing, new) resolving shared keys,
+        or the last value winning when combine is None
+        """
+        from tython.src.main.data_structures.merging import merge_all
+        return merge_all((self, *others), combine)
+
+    @staticmethod
+    def reduce_by_key(pairs: Iterable[Tuple[Any, Any]], fun: Callable[[Any, Any], Any]) -> Dict:
+        """
+        Dict of the values of each key in a stream of (key, value) pairs, reduced with fun as they arrive
+        """
+        from tython.src.main.data_structures.merging import reduce_by_key
+        return reduce_by_key(pairs, fun)
 
     def associate(self, fun: Callable[[T], Any]) -> "Dict":
         return self.map(self.eval(fun))
@@ -207,6 +307,100 @@ class Dict(dict):
         return self.map_not_none_indexed_values(lambda index, value: self.eval(fun)(index, value))
 
 
+class FrozenDict(Mapping):
+    """
+    Immutable mapping over a private dict, keeping its insertion order, for values shared without copying.
+    Lookups and iteration run at dict speed. put, remove and their bulk versions return new FrozenDicts,
+    the rest of Dict's functional API works on a Dict.
+    """
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Mapping | Iterable[tuple] = (), **kwargs):
+        self._values = dict(values, **kwargs)
+
+    def put(self, key, value) -> FrozenDict:
+        return self.put_all(((key, value),))
+
+    def put_all(self, values: Mapping | Iterable[tuple]) -> FrozenDict:
+        frozen = FrozenDict(self._values)
+        frozen._values.update(values)
+        return frozen
+
+    def remove(self, key) -> FrozenDict:
+        return self.remove_all((key,)) if key in self._values else self
+
+    def remove_all(self, keys: Iterable) -> FrozenDict:
+        removed = set(keys)
+        return FrozenDict((key, value) for key, value in self._values.items() if key not in removed)
+
+    def get(self, key, default=None) -> Any:
+        return self._values.get(key, default)
+
+    def keys(self) -> KeysView:
+        return self._values.keys()
+
+    def values(self) -> ValuesView:
+        return self._values.values()
+
+    def items(self) -> ItemsView:
+        return self._values.items()
+
+    def length(self) -> int:
+        return len(self._values)
+
+    def to_dict(self) -> Dict:
+        return Dict(self._values)
+
+    def __add__(self, other: Mapping | Iterable[tuple]) -> FrozenDict:
+        return self.put_all(other)
+
+    def __sub__(self, keys: Iterable) -> FrozenDict:
+        return self.remove_all(keys)
+
+    def __getitem__(self, key) -> Any:
+        return self._values[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._values
+
+    def __iter__(self) -> Iterator:
+        return iter(self._values)
+
+    def __reversed__(self) -> Iterator:
+        return reversed(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FrozenDict):
+            return self._values == other._values
+        return self._values == other if isinstance(other, Mapping) else NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({self._values})"
+
+    def __getattr__(self, name: str) -> Any:
+        # The rest of the functional API, map_values, filter, fold, group_by..., runs over a Dict of the entries
+        if name not in FUNCTIONAL_API:
+            raise AttributeError(f"'FrozenDict' object has no attribute '{name}'")
+        return getattr(self.to_dict(), name)
+
+
+# Dict's non-mutating API, which immutable mappings delegate to a Dict of their entries.
+# Every method Dict defines returns a new value; dict's own in place methods, update, setdefault..., are left out
+FUNCTIONAL_API = (frozenset(name for name in vars(Dict) if not name.startswith("_"))
+                  | {"copy", "get", "items", "keys", "values"})
+
+
+def _spread(fun: Callable) -> Callable:
+    return lambda entry: fun(*entry)
+
+
+def _put_entry(group: Dict, entry) -> None:
+    group[entry[0]] = entry[1]
+
+
 def dict_of(**kwargs):
     return Dict(**kwargs)
 
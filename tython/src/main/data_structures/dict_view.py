@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from itertools import chain, filterfalse
+from typing import Any, TYPE_CHECKING, Callable, Iterator, TypeVar
+
+from tython.src.main.data_structures.placeholder import Placeholder, compile_placeholder
+
+if TYPE_CHECKING:
+    from tython.src.main.data_structures.dict import Dict
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class DictView(Mapping):
+    """
+    Read only lazy Mapping over a dict, built with Dict.view().
+    Transformations stack further views instead of copying: nothing is computed until a key is read or the view
+    is iterated, and to_dict() materializes the result. Views read the live source, so they follow its changes.
+    """
+
+    def __init__(self, source: Mapping):
+        self._source = source
+
+    @staticmethod
+    def eval(fun) -> Callable:
+        if isinstance(fun, Placeholder):
+            return compile_placeholder(fun)
+        return fun
+
+    def mapped_values(self, fun: Callable[[Any, T], Any], cache: bool = False) -> MappedValuesView:
+        return MappedValuesView(self, self.eval(fun), cache)
+
+    def mapped_keys(self, fun: Callable[[Any, T], Any]) -> MappedKeysView:
+        return MappedKeysView(self, self.eval(fun))
+
+    def filtered(self, fun: Callable[[Any, T], bool]) -> FilteredView:
+        return FilteredView(self, self.eval(fun))
+
+    def with_defaults(self, defaults: Mapping) -> DefaultsView:
+        return DefaultsView(self, defaults)
+
+    def to_dict(self) -> "Dict":
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(self.items())
+
+    def __getitem__(self, key) -> Any:
+        return self._source[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._source
+
+    def __iter__(self) -> Iterator:
+        return iter(self._source)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())})"
+
+
+class MappedValuesView(DictView):
+    """
+    Values computed as fun(key, value) when read. With cache=True each key is computed once,
+    and later changes to its source value are not seen.
+    """
+
+    def __init__(self, source: Mapping, fun: Callable, cache: bool = False):
+        super().__init__(source)
+        self._fun = fun
+        self._cache = {} if cache else None
+
+    def __getitem__(self, key) -> Any:
+        if self._cache is None:
+            return self._fun(key, self._source[key])
+        result = self._cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = self._cache[key] = self._fun(key, self._source[key])
+        return result
+
+
+class MappedKeysView(DictView):
+    """
+    Keys computed as fun(key, value), all indexed on first use, the last source key winning on collisions
+    as in Dict.map_keys. The index is not rebuilt when the source changes.
+    """
+
+    def __init__(self, source: Mapping, fun: Callable):
+        super().__init__(source)
+        self._fun = fun
+        self._index = None
+
+    def _indexed(self) -> dict:
+        if self._index is None:
+            self._index = {self._fun(source_key, value): source_key for source_key, value in self._source.items()}
+        return self._index
+
+    def __getitem__(self, key) -> Any:
+        return self._source[self._indexed()[key]]
+
+    def __contains__(self, key) -> bool:
+        return key in self._indexed()
+
+    def __iter__(self) -> Iterator:
+        return iter(self._indexed())
+
+    def __len__(self) -> int:
+        return len(self._indexed())
+
+
+class FilteredView(DictView):
+    """
+    Entries for which fun(key, value) holds, only testing the keys read or iterated
+    """
+
+    def __init__(self, source: Mapping, fun: Callable):
+        super().__init__(source)
+        self._fun = fun
+
+    def __getitem__(self, key) -> Any:
+        value = self._source[key]
+        if not self._fun(key, value):
+            raise KeyError(key)
+        return value
+
+    __contains__ = Mapping.__contains__
+
+    def __iter__(self) -> Iterator:
+        return (key for key, value in self._source.items() if self._fun(key, value))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class DefaultsView(DictView):
+    """
+    The source layered over defaults: keys missing from the source are read from the defaults
+    """
+
+    def __init__(self, source: Mapping, defaults: Mapping):
+        super().__init__(source)
+        self._defaults = defaults
+
+    def __getitem__(self, key) -> Any:
+        try:
+            return self._source[key]
+        except KeyError:
+            return self._defaults[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._source or key in self._defaults
+
+    def __iter__(self) -> Iterator:
+        return chain(self._source, filterfalse(self._source.__contains__, self._defaults))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import date, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+from tython.src.main.data_structures.dict import FrozenDict
+from tython.src.main.data_structures.persistent_dict import PersistentDict
+from tython.src.main.data_structures.persistent_list import PersistentList
+from tython.src.main.data_structures.persistent_set import PersistentSet
+from tython.src.main.data_structures.set import FrozenSet
+
+# The type each mutable builtin is frozen into
+FROZEN_TYPES = {list: PersistentList, dict: FrozenDict, set: FrozenSet, frozenset: FrozenSet, bytearray: bytes}
+
+_IMMUTABLE = (type(None), bool, int, float, complex, str, bytes, range, Decimal, Fraction, date, time, timedelta,
+              timezone, UUID, Enum, PurePath, PersistentList, PersistentSet, PersistentDict, FrozenDict, FrozenSet)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Deeply immutable equivalent of value, built once so it can then be shared without copying:
+    lists become PersistentLists, dicts FrozenDicts keeping their order, sets FrozenSets, bytearrays bytes,
+    and tuples and named tuples are rebuilt from frozen elements. Immutable scalars are returned as is.
+    Raises TypeError for any other object, or a container holding one, as it cannot be made immutable.
+    """
+    if isinstance(value, _IMMUTABLE):
+        return value
+    if isinstance(value, list):
+        return PersistentList(map(freeze, value))
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return FrozenSet(value)
+    if isinstance(value, bytearray):
+        return bytes(value)
+    if type(value) is tuple:
+        return tuple(map(freeze, value))
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)._make(map(freeze, value))
+    raise TypeError(f"Cannot freeze a value of type {type(value).__name__}")
+
+
+def thaw(value: Any) -> Any:
+    """
+    Plain mutable copy of a frozen value, built from lists, dicts and sets, for instance to serialize it to JSON
+    """
+    if isinstance(value, (PersistentList, list)):
+        return list(map(thaw, value))
+    if isinstance(value, (FrozenDict, PersistentDict, dict)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset, PersistentSet)):
+        return set(value)
+    if type(value) is tuple:
+        return tuple(map(thaw, value))
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)._make(map(thaw, value))
+    return value
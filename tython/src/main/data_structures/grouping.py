@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import copy
+import heapq
+from itertools import count
+from typing import Any, TYPE_CHECKING, TypeVar, Callable, Iterable
+
+from tython.src.main.data_structures.placeholder import Placeholder, compile_placeholder
+
+if TYPE_CHECKING:
+    from tython.src.main.data_structures.dict import Dict
+
+T = TypeVar("T")
+
+
+class Grouping:
+    """
+    Groups of a collection by key, in the spirit of Kotlin's Grouping, aggregated in a single pass.
+    Only one accumulator per key is kept, updated as elements stream by, so the groups are never stored.
+    """
+
+    def __init__(self, source: Iterable, key_fun: Callable, value_fun: Callable = None):
+        self._source = source
+        self._key_fun = key_fun
+        self._value_fun = value_fun
+
+    @staticmethod
+    def eval(fun) -> Callable:
+        if isinstance(fun, Placeholder):
+            return compile_placeholder(fun)
+        return fun
+
+    def count(self) -> "Dict":
+        return self._aggregate(lambda _: 1, lambda accumulator, _: accumulator + 1, _identity)
+
+    def sum(self, fun: Callable[[T], Any] = None) -> "Dict":
+        return self._aggregate(_identity, lambda accumulator, value: accumulator + value, self._selector(fun))
+
+    def min(self, fun: Callable[[T], Any] = None) -> "Dict":
+        return self._aggregate(_identity, lambda accumulator, value: min(accumulator, value), self._selector(fun))
+
+    def max(self, fun: Callable[[T], Any] = None) -> "Dict":
+        return self._aggregate(_identity, lambda accumulator, value: max(accumulator, value), self._selector(fun))
+
+    def average(self, fun: Callable[[T], Any] = None) -> "Dict":
+        def update(accumulator: list, value) -> list:
+            accumulator[0] += value
+            accumulator[1] += 1
+            return accumulator
+
+        totals = self._aggregate(lambda value: [value, 1], update, self._selector(fun))
+        return totals.map_values(lambda _, total: total[0] / total[1])
+
+    def fold(self, fun: Callable[[Any, T], Any], initial_value=None) -> "Dict":
+        """
+        Folds each group. Without an initial value, each group starts from its first element.
+        The initial value is copied for every group, so mutable accumulators are not shared.
+        """
+        fun = self.eval(fun)
+        if initial_value is None:
+            return self._aggregate(_identity, fun, self._selector())
+        return self._aggregate(lambda element: fun(copy.copy(initial_value), element), fun, self._selector())
+
+    def top_k(self, k: int, fun: Callable[[T], Any] = None) -> "Dict":
+        """
+        The k largest elements of each group by fun, largest first, earlier elements first on ties.
+        Each group keeps a min heap of at most k elements.
+        """
+        order = self.eval(fun) or _identity
+        counter = count()
+
+        def entry(element) -> tuple:
+            return order(element), -next(counter), element
+
+        def update(heap: list, element) -> list:
+            if len(heap) < k:
+                heapq.heappush(heap, entry(element))
+            else:
+                heapq.heappushpop(heap, entry(element))
+            return heap
+
+        from tython.src.main.data_structures.list import List
+        heaps = self._aggregate(lambda element: update([], element), update, self._selector())
+        return heaps.map_values(lambda _, heap: List(element for *_, element in sorted(heap, reverse=True)))
+
+    def _selector(self, fun: Callable = None) -> Callable:
+        fun = self.eval(fun)
+        if self._value_fun is None:
+            return fun if fun is not None else _identity
+        if fun is None:
+            return self._value_fun
+        return lambda element: fun(self._value_fun(element))
+
+    def _aggregate(self, start: Callable, update: Callable, select: Callable) -> "Dict":
+        """
+        Runs start on the first selected value of each key and update(accumulator, value) on the next ones
+        """
+        from tython.src.main.data_structures.dict import Dict
+        accumulators = Dict()
+        key_fun = self._key_fun
+        for element in self._source:
+            key = key_fun(element)
+            value = select(element)
+            if key in accumulators:
+                accumulators[key] = update(accumulators[key], value)
+            else:
+                accumulators[key] = start(value)
+        return accumulators
+
+
+def _identity(value):
+    return value
@@ -0,0 +1,179 @@
+"""
+Hash array mapped trie shared by PersistentSet and PersistentDict.
+Leaves are (hash, key, value) tuples. Bitmap nodes keep only the children that exist, indexed by the popcount
+of their bitmap below each 5 bit slice of the hash, and keys whose whole hash collides share a collision node.
+Updates copy the path from the root down to the change, unless the node is owned by the edit token of the
+transient doing the update, in which case it is changed in place.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Optional, Tuple
+
+BITS = 5
+MASK = (1 << BITS) - 1
+HASH_MASK = (1 << 64) - 1
+
+
+class BitmapNode:
+    __slots__ = ("bitmap", "entries", "edit")
+
+    def __init__(self, bitmap: int, entries: list, edit: object = None):
+        self.bitmap = bitmap
+        self.entries = entries
+        self.edit = edit
+
+
+class CollisionNode:
+    __slots__ = ("hash", "entries", "edit")
+
+    def __init__(self, key_hash: int, entries: list, edit: object = None):
+        self.hash = key_hash
+        self.entries = entries
+        self.edit = edit
+
+
+Node = Optional[BitmapNode | CollisionNode]
+
+
+def hash_of(key) -> int:
+    return hash(key) & HASH_MASK
+
+
+def find(node: Node, key_hash: int, key, default=None) -> Any:
+    shift = 0
+    while node is not None:
+        if type(node) is CollisionNode:
+            if node.hash == key_hash:
+                for entry in node.entries:
+                    if entry[1] is key or entry[1] == key:
+                        return entry[2]
+            return default
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not node.bitmap & bit:
+            return default
+        entry = node.entries[(node.bitmap & (bit - 1)).bit_count()]
+        if type(entry) is tuple:
+            if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+                return entry[2]
+            return default
+        node = entry
+        shift += BITS
+    return default
+
+
+def assoc(node: Node, edit: object, shift: int, leaf: tuple) -> Tuple[Node, bool]:
+    """
+    Node with leaf added or its value replaced, and whether the key is new.
+    An equal key already present is kept, like dict does.
+    """
+    key_hash, key, value = leaf
+    if node is None:
+        return BitmapNode(1 << ((key_hash >> shift) & MASK), [leaf], edit), True
+    if type(node) is CollisionNode:
+        if node.hash != key_hash:
+            return assoc(BitmapNode(1 << ((node.hash >> shift) & MASK), [node], edit), edit, shift, leaf)
+        for index, entry in enumerate(node.entries):
+            if entry[1] is key or entry[1] == key:
+                if entry[2] is value:
+                    return node, False
+                return _replaced(node, edit, index, (key_hash, entry[1], value)), False
+        edited = _edited(node, edit)
+        edited.entries.append(leaf)
+        return edited, True
+    bit = 1 << ((key_hash >> shift) & MASK)
+    index = (node.bitmap & (bit - 1)).bit_count()
+    if not node.bitmap & bit:
+        edited = _edited(node, edit)
+        edited.entries.insert(index, leaf)
+        edited.bitmap |= bit
+        return edited, True
+    entry = node.entries[index]
+    if type(entry) is tuple:
+        if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+            if entry[2] is value:
+                return node, False
+            return _replaced(node, edit, index, (key_hash, entry[1], value)), False
+        return _replaced(node, edit, index, _branch(edit, shift + BITS, entry, leaf)), True
+    child, added = assoc(entry, edit, shift + BITS, leaf)
+    if child is entry:
+        return node, added
+    return _replaced(node, edit, index, child), added
+
+
+def without(node: Node, edit: object, shift: int, key_hash: int, key) -> Tuple[Node, bool]:
+    """
+    Node without key, None once it is empty, and whether the key was there
+    """
+    if node is None:
+        return None, False
+    if type(node) is CollisionNode:
+        if node.hash == key_hash:
+            for index, entry in enumerate(node.entries):
+                if entry[1] is key or entry[1] == key:
+                    edited = _edited(node, edit)
+                    del edited.entries[index]
+                    return edited, True
+        return node, False
+    bit = 1 << ((key_hash >> shift) & MASK)
+    if not node.bitmap & bit:
+        return node, False
+    index = (node.bitmap & (bit - 1)).bit_count()
+    entry = node.entries[index]
+    if type(entry) is tuple:
+        if entry[0] != key_hash or not (entry[1] is key or entry[1] == key):
+            return node, False
+        child = None
+    else:
+        child, removed = without(entry, edit, shift + BITS, key_hash, key)
+        if not removed:
+            return node, False
+    if child is None:
+        if len(node.entries) == 1:
+            return None, True
+        edited = _edited(node, edit)
+        del edited.entries[index]
+        edited.bitmap ^= bit
+        return edited, True
+    # A child left with a single leaf is replaced by that leaf, keeping the trie as shallow as possible
+    if len(child.entries) == 1 and type(child.entries[0]) is tuple:
+        child = child.entries[0]
+    return _replaced(node, edit, index, child), True
+
+
+def leaves(node: Node) -> Iterator[tuple]:
+    if node is None:
+        return
+    for entry in node.entries:
+        if type(entry) is tuple:
+            yield entry
+        else:
+            yield from leaves(entry)
+
+
+def _edited(node: BitmapNode | CollisionNode, edit: object) -> BitmapNode | CollisionNode:
+    """
+    The node itself when the transient holding edit owns it, otherwise a copy owned by edit
+    """
+    if edit is not None and node.edit is edit:
+        return node
+    if type(node) is CollisionNode:
+        return CollisionNode(node.hash, list(node.entries), edit)
+    return BitmapNode(node.bitmap, list(node.entries), edit)
+
+
+def _replaced(node: BitmapNode | CollisionNode, edit: object, index: int, entry) -> BitmapNode | CollisionNode:
+    edited = _edited(node, edit)
+    edited.entries[index] = entry
+    return edited
+
+
+def _branch(edit: object, shift: int, first: tuple, second: tuple) -> BitmapNode | CollisionNode:
+    if first[0] == second[0]:
+        return CollisionNode(first[0], [first, second], edit)
+    first_slot = (first[0] >> shift) & MASK
+    second_slot = (second[0] >> shift) & MASK
+    if first_slot == second_slot:
+        return BitmapNode(1 << first_slot, [_branch(edit, shift + BITS, first, second)], edit)
+    entries = [first, second] if first_slot < second_slot else [second, first]
+    return BitmapNode((1 << first_slot) | (1 << second_slot), entries, edit)
@@ -0,0 +1,119 @@
+"""
+Hash joins between collections.
+The smaller side is indexed in a dict by key and the larger one streamed through it, so joins are O(n + m)
+instead of the O(n * m) of nested filters.
+"""
+
+from __future__ import annotations
+
+from itertools import compress
+from typing import Any, Callable, Iterator, Sequence, Tuple
+
+from tython.src.main.data_structures import kernels
+
+JOIN_TYPES = ("inner", "left", "outer")
+
+
+def hash_join(left: Sequence, right: Sequence, left_key: Callable, right_key: Callable,
+              how: str = "inner") -> Iterator[Tuple[Any, Any]]:
+    """
+    (left, right) pairs of rows with equal keys, None standing in for the missing side of unmatched rows
+    kept by left and outer joins.
+    Whichever side is indexed, pairs follow the order of the left rows, the matches of each in right order,
+    and unmatched right rows of outer joins come last.
+    """
+    if how not in JOIN_TYPES:
+        raise ValueError(f"Join type must be one of {list(JOIN_TYPES)}, not {how}")
+    if len(left) <= len(right):
+        return _collect(left, left_key, right, right_key, how != "inner", how == "outer")
+    return _probe(right, right_key, left, left_key, how == "outer", how != "inner")
+
+
+def cogroup(left: Sequence, right: Sequence, left_key: Callable, right_key: Callable, new_group: Callable) -> dict:
+    """
+    Every key of either side, with the rows of each side having it: key -> (left rows, right rows)
+    """
+    groups = kernels.grouped({}, kernels.keyed(left_key, left), lambda: (new_group(), new_group()), _add_left)
+    return kernels.grouped(groups, kernels.keyed(right_key, right), lambda: (new_group(), new_group()), _add_right)
+
+
+def semi_join(left: Sequence, right: Sequence, left_key: Callable, right_key: Callable,
+              anti: bool = False) -> Iterator:
+    """
+    Left rows whose key is on the right side, or is not with anti=True
+    """
+    if len(left) <= len(right):
+        keys = list(map(left_key, left))
+        wanted = set(keys)
+        found = set()
+        for key in map(right_key, right):
+            if key in wanted:
+                found.add(key)
+                if len(found) == len(wanted):
+                    break
+        return compress(left, ((key in found) != anti for key in keys))
+    right_keys = set(map(right_key, right))
+    return (row for row in left if (left_key(row) in right_keys) != anti)
+
+
+def _probe(indexed: Sequence, indexed_key: Callable, streamed: Sequence, streamed_key: Callable,
+           keep_indexed: bool, keep_streamed: bool) -> Iterator[Tuple[Any, Any]]:
+    """
+    (streamed, indexed) pairs of rows with equal keys, keeping unmatched rows of either side as asked
+    """
+    positioned = ((indexed_key(row), (position, row)) for position, row in enumerate(indexed))
+    index = kernels.grouped({}, positioned, list, list.append)
+    matched = bytearray(len(indexed)) if keep_indexed else None
+    for row in streamed:
+        entries = index.get(streamed_key(row))
+        if entries is None:
+            if keep_streamed:
+                yield row, None
+            continue
+        for position, other in entries:
+            if matched is not None:
+                matched[position] = 1
+            yield row, other
+    if matched is not None:
+        for seen, other in zip(matched, indexed):
+            if not seen:
+                yield None, other
+
+
+def _collect(left: Sequence, left_key: Callable, right: Sequence, right_key: Callable,
+             keep_left: bool, keep_right: bool) -> Iterator[Tuple[Any, Any]]:
+    """
+    (left, right) pairs with the left side indexed: right rows are streamed and collected per left row,
+    so the pairs can still be emitted in left order
+    """
+    positioned = ((left_key(row), position) for position, row in enumerate(left))
+    index = kernels.grouped({}, positioned, list, list.append)
+    matches = [None] * len(left)
+    unmatched = []
+    for row in right:
+        positions = index.get(right_key(row))
+        if positions is None:
+            if keep_right:
+                unmatched.append(row)
+            continue
+        for position in positions:
+            if matches[position] is None:
+                matches[position] = [row]
+            else:
+                matches[position].append(row)
+    for row, rows in zip(left, matches):
+        if rows is not None:
+            for other in rows:
+                yield row, other
+        elif keep_left:
+            yield row, None
+    for other in unmatched:
+        yield None, other
+
+
+def _add_left(group: tuple, row) -> None:
+    group[0].append(row)
+
+
+def _add_right(group: tuple, row) -> None:
+    group[1].append(row)
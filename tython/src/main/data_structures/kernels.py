@@ -0,0 +1,176 @@
+"""
+Lazy building blocks for the composite functions.
+Each composite chains these iterators and feeds them straight into its target container,
+so None filtering, indexing, mapping and flattening happen in a single pass with no intermediate container.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from itertools import chain, starmap
+from operator import is_not
+from collections.abc import Collection, Mapping
+from typing import Any, Callable, Iterable, Iterator, Tuple
+
+is_not_none = partial(is_not, None)
+
+flatten = chain.from_iterable
+
+
+def first(iterable: Iterable, fun: Callable = None, default=None) -> Any:
+    """
+    First element matching fun, or the first element when fun is None, stopping as soon as it is found
+    """
+    if fun is None:
+        return next(iter(iterable), default)
+    return next(filter(fun, iterable), default)
+
+
+def count_not_none(iterable: Iterable) -> int:
+    return sum(1 for _ in filter(is_not_none, iterable))
+
+
+def not_none(iterable: Iterable) -> Iterator:
+    return filter(is_not_none, iterable)
+
+
+def map_not_none(fun: Callable, iterable: Iterable) -> Iterator:
+    return filter(is_not_none, map(fun, filter(is_not_none, iterable)))
+
+
+def map_indexed(fun: Callable, iterable: Iterable) -> Iterator:
+    return starmap(fun, enumerate(iterable))
+
+
+def indexed_not_none(iterable: Iterable) -> Iterator[Tuple[int, Any]]:
+    return ((index, value) for index, value in enumerate(iterable) if value is not None)
+
+
+def map_not_none_indexed(fun: Callable, iterable: Iterable) -> Iterator:
+    return filter(is_not_none, starmap(fun, indexed_not_none(iterable)))
+
+
+def nested(iterable: Iterable) -> Iterator:
+    """
+    Shallow copies of each nested container, keeping its type
+    """
+    return (type(inner)(inner) for inner in iterable)
+
+
+def membership(elements: Iterable) -> Callable[[Any], bool]:
+    """
+    Fast `in` test against elements: hashed when they are hashable, a linear scan for the ones that are not
+    """
+    if isinstance(elements, (set, frozenset, dict)):
+        hashed, unhashable = elements, []
+    else:
+        hashed, unhashable = set(), []
+        for element in elements:
+            try:
+                hashed.add(element)
+            except TypeError:
+                unhashable.append(element)
+
+    def contains(value) -> bool:
+        try:
+            if value in hashed:
+                return True
+        except TypeError:
+            pass
+        return bool(unhashable) and value in unhashable
+
+    return contains
+
+
+def distinct_by(fun: Callable, iterable: Iterable) -> Iterator:
+    """
+    Elements whose key was not seen before, in order, so the first occurrence of each key is kept
+    """
+    seen = set()
+    seen_unhashable = []
+    for element in iterable:
+        key = fun(element)
+        try:
+            if key in seen:
+                continue
+            seen.add(key)
+        except TypeError:
+            if key in seen_unhashable:
+                continue
+            seen_unhashable.append(key)
+        yield element
+
+
+def distinct(iterable: Iterable) -> Iterator:
+    if not isinstance(iterable, Collection):
+        # The fallback reads the elements again, so one shot iterators are materialized first
+        iterable = list(iterable)
+    try:
+        # Ordered dict keys deduplicate in C when every element is hashable
+        return iter(dict.fromkeys(iterable))
+    except TypeError:
+        return distinct_by(_identity, iterable)
+
+
+def _identity(value):
+    return value
+
+
+# Dict entries
+
+def entries_not_none(items: Iterable[Tuple[Any, Any]]) -> Iterator[Tuple[Any, Any]]:
+    return ((key, value) for key, value in items if value is not None)
+
+
+def first_entry(items: Iterable[Tuple[Any, Any]], fun: Callable = None, default=None) -> Any:
+    """
+    First (key, value) entry for which fun(key, value) holds, stopping as soon as it is found
+    """
+    if fun is None:
+        return next(iter(items), default)
+    return next((entry for entry in items if fun(*entry)), default)
+
+
+def indexed_entries(items: Iterable[Tuple[Any, Any]]) -> Iterator[Tuple[int, Any, Any]]:
+    return ((index, key, value) for index, (key, value) in enumerate(items))
+
+
+def indexed_entries_not_none(items: Iterable[Tuple[Any, Any]]) -> Iterator[Tuple[int, Any, Any]]:
+    return ((index, key, value) for index, (key, value) in enumerate(items) if value is not None)
+
+
+def entries(pairs) -> Iterable[Tuple[Any, Any]]:
+    """
+    (key, value) entries of a mapping, or the pairs themselves for any other iterable
+    """
+    return pairs.items() if isinstance(pairs, Mapping) else pairs
+
+
+def flatten_entries(results: Iterable) -> Iterator[Tuple[Any, Any]]:
+    return chain.from_iterable(map(entries, results))
+
+
+def nested_entries(items: Iterable[Tuple[Any, Any]]) -> Iterator[Tuple[Any, Any]]:
+    return ((key, type(value)(value)) for key, value in items)
+
+
+# Grouping
+
+def grouped(groups: dict, keyed: Iterable[Tuple[Any, Any]], new_group: Callable, add: Callable) -> dict:
+    """
+    Adds each (key, element) pair to the group of its key in groups, creating groups as keys first appear
+    """
+    for key, element in keyed:
+        group = groups.get(key)
+        if group is None:
+            groups[key] = group = new_group()
+        add(group, element)
+    return groups
+
+
+def keyed(fun: Callable, iterable: Iterable) -> Iterator[Tuple[Any, Any]]:
+    return ((fun(element), element) for element in iterable)
+
+
+def keyed_not_none(fun: Callable, iterable: Iterable) -> Iterator[Tuple[Any, Any]]:
+    return ((key, element) for key, element in keyed(fun, not_none(iterable)) if key is not None)
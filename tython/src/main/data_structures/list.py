@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import heapq
 from functools import reduce
-from itertools import chain
+from itertools import chain, compress, filterfalse
 from typing import Any, TYPE_CHECKING, TypeVar, Callable, Type
 
-from tython.src.main.data_structures.placeholder import Placeholder
+from tython.src.main.data_structures import kernels, joins
+from tython.src.main.data_structures.asynchronous import gather_bounded
+from tython.src.main.data_structures.memo import MemoCache, memo_cache
+from tython.src.main.data_structures.placeholder import Placeholder, compile_placeholder
+from tython.src.main.data_structures.vectorized import vectorized_eval, vectorized_sum
+from tython.src.main.data_structures.windows import zip_with_next
 
 if TYPE_CHECKING:
+    from tython.src.main.data_structures.sorting import SortedList
+    from tython.src.main.data_structures.grouping import Grouping
+    from tython.src.main.data_structures.parallel import Parallel
+    from tython.src.main.data_structures.persistent_list import PersistentList
+    from tython.src.main.data_structures.sequence import Sequence
+    from tython.src.main.data_structures.typed_list import TypedList
     from tython.src.main.data_structures.dict import Dict
     from tython.src.main.data_structures.set import Set
 
@@ -19,14 +31,27 @@ class List(list):
     @staticmethod
     def eval(fun) -> Callable:
         if isinstance(fun, Placeholder):
-            return fun.eval
+            return compile_placeholder(fun)
         return fun
 
     # Base functions =============================================
-    def map(self, fun: Callable[[T], Any]) -> List:
+    def map(self, fun: Callable[[T], Any], memoize: bool = False, cache: MemoCache = None) -> List:
+        """
+        With memoize=True, or a MemoCache shared across calls, results are cached per element and function,
+        for expensive pure functions over repetitive values. Placeholders NumPy can vectorize skip the cache.
+        """
+        vectorized = vectorized_eval(fun, self, self.list_type)
+        if vectorized is not None:
+            return List(vectorized.tolist())
+        memo = memo_cache(memoize, cache)
+        if memo is not None:
+            return List(map(memo.memoized(self.eval(fun)), self))
         return List(map(self.eval(fun), self))
 
     def filter(self, fun: Callable[[T], Any]) -> List:
+        vectorized = vectorized_eval(fun, self, self.list_type)
+        if vectorized is not None:
+            return List(compress(self, vectorized.astype(bool).tolist()))
         return List(filter(self.eval(fun), self))
 
     def filter_none(self) -> List[T]:
@@ -41,36 +66,31 @@ class List(list):
         return List(chain(*self))
 
     def flat_map(self, fun: Callable[[T], Any]) -> List:
-        return self.map(self.eval(fun)).flatten()
+        return List(kernels.flatten(map(self.eval(fun), self)))
 
     def nested_map(self, fun: Callable[[T], Any]) -> List:
         return self.map(lambda it: it.map(self.eval(fun)))
 
     def map_indexed(self, fun: Callable[[int, T], Any]) -> List:
-        return List(map(lambda it: self.eval(fun)(it[0], it[1]), enumerate(self)))
+        return List(kernels.map_indexed(self.eval(fun), self))
 
     def all(self, fun: Callable[[T], Any]) -> bool:
-        return all(self.map(self.eval(fun)))
+        return all(map(self.eval(fun), self))
 
     def none(self, fun: Callable[[T], Any]) -> bool:
-        return not any(self.map(self.eval(fun)))
+        return not any(map(self.eval(fun), self))
 
     def any(self, fun: Callable[[T], Any]) -> bool:
-        return any(self.map(self.eval(fun)))
+        return any(map(self.eval(fun), self))
 
     def reverse(self) -> List:
         return List(reversed(self))
 
     def first(self, fun: Callable[[T], bool] = None) -> T:
-        try:
-            if fun:
-                return next(filter(self.eval(fun), self), List())
-            return next(iter(self), List())
-        except StopIteration:
-            return List()
+        return kernels.first(self, self.eval(fun), List())
 
     def last(self, fun: Callable[[T], bool] = None) -> T:
-        return self.reverse().first(self.eval(fun))
+        return kernels.first(reversed(self), self.eval(fun), List())
 
     def add(self, element) -> List:
         return List(self + [element])
@@ -82,113 +102,278 @@ class List(list):
         return List(filter(lambda it: it != element, self))
 
     def remove_all(self, elements) -> List:
-        return List(filter(lambda it: it not in elements, self))
+        return List(filterfalse(kernels.membership(elements), self))
+
+    def retain_all(self, elements) -> List:
+        return List(filter(kernels.membership(elements), self))
+
+    def distinct(self) -> List:
+        return List(kernels.distinct(self))
+
+    def distinct_by(self, fun: Callable[[T], Any]) -> List:
+        return List(kernels.distinct_by(self.eval(fun), self))
+
+    def union(self, elements) -> List:
+        """
+        Distinct elements of both, in order of first occurrence, like Kotlin's union
+        """
+        return List(kernels.distinct(chain(self, elements)))
+
+    def intersect(self, elements) -> List:
+        return List(kernels.distinct(filter(kernels.membership(elements), self)))
+
+    def subtract(self, elements) -> List:
+        return List(kernels.distinct(filterfalse(kernels.membership(elements), self)))
 
     def length(self) -> int:
         return len(self)
 
+    def sum(self, fun: Callable[[T], Any] = None) -> Any:
+        if fun is None:
+            return sum(self)
+        vectorized = vectorized_eval(fun, self, self.list_type)
+        if vectorized is not None:
+            return vectorized_sum(vectorized)
+        return sum(map(self.eval(fun), self))
+
+    def min(self, fun: Callable[[T], Any] = None) -> Any:
+        return min(self if fun is None else map(self.eval(fun), self))
+
+    def max(self, fun: Callable[[T], Any] = None) -> Any:
+        return max(self if fun is None else map(self.eval(fun), self))
+
+    def average(self, fun: Callable[[T], Any] = None) -> float:
+        if not self:
+            raise ValueError("average() arg is an empty sequence")
+        return self.sum(fun) / len(self)
+
+    def sorted_by(self, fun: Callable[[T], Any]) -> "SortedList":
+        from tython.src.main.data_structures.sorting import sorted_by
+        return sorted_by(self, ((self.eval(fun), False),))
+
+    def sorted_by_descending(self, fun: Callable[[T], Any]) -> "SortedList":
+        from tython.src.main.data_structures.sorting import sorted_by
+        return sorted_by(self, ((self.eval(fun), True),))
+
+    def top_k(self, k: int, fun: Callable[[T], Any] = None) -> "List":
+        """
+        The k largest elements, largest first, with a heap of k elements: O(n log k)
+        """
+        return List(heapq.nlargest(k, self, key=self.eval(fun)))
+
+    def bottom_k(self, k: int, fun: Callable[[T], Any] = None) -> "List":
+        return List(heapq.nsmallest(k, self, key=self.eval(fun)))
+
+    def nth_smallest(self, n: int, fun: Callable[[T], Any] = None) -> T:
+        from tython.src.main.data_structures.sorting import nth_smallest
+        return nth_smallest(self, n, self.eval(fun))
+
+    def sorted_sequence(self, fun: Callable[[T], Any] = None, descending: bool = False) -> "Sequence":
+        """
+        Lazy Sequence of the elements in sorted order, only ordering as many as are consumed
+        """
+        from tython.src.main.data_structures.sequence import Sequence
+        from tython.src.main.data_structures.sorting import HeapSorted
+        return Sequence(HeapSorted(self, self.eval(fun), descending))
+
+    def as_sequence(self) -> "Sequence":
+        from tython.src.main.data_structures.sequence import Sequence
+        return Sequence(self)
+
+    lazy = as_sequence
+
+    def windowed(self, size: int, step: int = 1, partial: bool = False) -> "Sequence":
+        """
+        Lazy Sequence of the windows of size elements every step elements, as zero copy views of the list
+        """
+        return self.as_sequence().windowed(size, step, partial)
+
+    def chunked(self, size: int) -> "Sequence":
+        return self.as_sequence().chunked(size)
+
+    def batched(self, size: int) -> "Sequence":
+        return self.as_sequence().batched(size)
+
+    def zip_with_next(self, fun: Callable[[T, T], Any] = None) -> List:
+        return List(zip_with_next(self, self.eval(fun)))
+
+    def pairwise(self) -> List:
+        return self.zip_with_next()
+
+    def to_persistent(self) -> "PersistentList":
+        from tython.src.main.data_structures.persistent_list import PersistentList
+        return PersistentList(self)
+
+    def parallel(self, workers: int = None, backend: str = "process", chunk_size: int = None) -> "Parallel":
+        from tython.src.main.data_structures.parallel import Parallel
+        return Parallel(self, workers, backend, chunk_size)
+
+    # Async functions ========================================
+
+    async def amap(self, fun: Callable[[T], Any], concurrency: int = None, timeout: float = None) -> List:
+        return List(await gather_bounded(self.eval(fun), zip(self), concurrency, timeout))
+
+    async def afilter(self, fun: Callable[[T], Any], concurrency: int = None, timeout: float = None) -> List:
+        return List(compress(self, await gather_bounded(self.eval(fun), zip(self), concurrency, timeout)))
+
+    async def aflat_map(self, fun: Callable[[T], Any], concurrency: int = None, timeout: float = None) -> List:
+        return List(kernels.flatten(await gather_bounded(self.eval(fun), zip(self), concurrency, timeout)))
+
     # Composite funs ========================================
 
     def map_to_dict(self, fun: Callable[[T], Any]) -> "Dict":
         from tython.src.main.data_structures.dict import Dict
-        return Dict(self.map(self.eval(fun)))
+        return Dict(map(self.eval(fun), self))
 
     def map_to_set(self, fun: Callable[[T], Any]) -> "Set":
         from tython.src.main.data_structures.set import Set
-        return Set(self.map(self.eval(fun)))
+        return Set(map(self.eval(fun), self))
 
     def map_not_none(self, fun: Callable[[T], Any]) -> List:
-        return self.filter_none().map(self.eval(fun)).filter_none()
+        return List(kernels.map_not_none(self.eval(fun), self))
 
     def map_not_none_to_dict(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.map_not_none(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.map_not_none(self.eval(fun), self))
 
     def map_not_none_to_set(self, fun: Callable[[T], Any]) -> "Set":
-        return self.map_not_none(self.eval(fun)).map_to_set(lambda it: it)
+        from tython.src.main.data_structures.set import Set
+        return Set(kernels.map_not_none(self.eval(fun), self))
 
     def map_not_none_indexed(self, fun: Callable[[int, T], Any]) -> List:
-        filtered_indexed = List(enumerate(self)).filter(lambda it: it[1] is not None)
-        return filtered_indexed.map(lambda value: self.eval(fun)(value[0], value[1])).filter_none()
+        return List(kernels.map_not_none_indexed(self.eval(fun), self))
 
     def map_not_none_indexed_to_dict(self, fun: Callable[[int, T], Any]) -> "Dict":
-        return self.map_not_none_indexed(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.map_not_none_indexed(self.eval(fun), self))
 
     def map_not_none_indexed_to_set(self, fun: Callable[[int, T], Any]) -> "Set":
-        return self.map_not_none_indexed(self.eval(fun)).map_to_set(lambda it: it)
+        from tython.src.main.data_structures.set import Set
+        return Set(kernels.map_not_none_indexed(self.eval(fun), self))
 
     def map_indexed_to_dict(self, fun: Callable[[int, T], Any]) -> "Dict":
-        return self.map_indexed(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.map_indexed(self.eval(fun), self))
 
     def map_indexed_to_set(self, fun: Callable[[int, T], Any]) -> "Set":
-        return self.map_indexed(self.eval(fun)).map_to_set(lambda it: it)
+        from tython.src.main.data_structures.set import Set
+        return Set(kernels.map_indexed(self.eval(fun), self))
 
     def flat_map_not_none(self, fun: Callable[[T], Any]) -> List:
-        return self.map_not_none(self.eval(fun)).flatten()
+        return List(kernels.flatten(kernels.map_not_none(self.eval(fun), self)))
 
     def flat_map_not_none_to_dict(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.flat_map_not_none(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.flatten(kernels.map_not_none(self.eval(fun), self)))
 
     def flat_map_not_none_to_set(self, fun: Callable[[T], Any]) -> "Set":
-        return self.flat_map_not_none(self.eval(fun)).map_to_set(lambda it: it)
+        from tython.src.main.data_structures.set import Set
+        return Set(kernels.flatten(kernels.map_not_none(self.eval(fun), self)))
 
     def flat_map_indexed(self, fun: Callable[[int, T], Any]) -> List:
-        return self.map_indexed(self.eval(fun)).flatten()
+        return List(kernels.flatten(kernels.map_indexed(self.eval(fun), self)))
 
     def flat_map_not_none_indexed(self, fun: Callable[[int, T], Any]) -> List:
-        return self.map_not_none_indexed(self.eval(fun)).flatten()
+        return List(kernels.flatten(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def flat_map_not_none_indexed_to_dict(self, fun: Callable[[int, T], Any]) -> "Dict":
-        return self.flat_map_not_none_indexed(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.flatten(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def flat_map_not_none_indexed_to_set(self, fun: Callable[[int, T], Any]) -> "Set":
-        return self.flat_map_not_none_indexed(self.eval(fun)).map_to_set(lambda it: it)
+        from tython.src.main.data_structures.set import Set
+        return Set(kernels.flatten(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def nested_map_not_none(self, fun: Callable[[T], Any]) -> List:
-        return self.map_not_none(self.eval(fun)).nested_map(lambda it: it)
+        return List(kernels.nested(kernels.map_not_none(self.eval(fun), self)))
 
     def nested_map_not_none_to_dict(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.nested_map_not_none(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.nested(kernels.map_not_none(self.eval(fun), self)))
 
     def nested_map_not_none_to_set(self, fun: Callable[[T], Any]) -> "Set":
-        return self.nested_map_not_none(self.eval(fun)).map_to_set(lambda it: it)
+        from tython.src.main.data_structures.set import Set
+        return Set(kernels.nested(kernels.map_not_none(self.eval(fun), self)))
 
     def nested_map_indexed(self, fun: Callable[[int, T], Any]) -> List:
-        return self.map_indexed(self.eval(fun)).nested_map(lambda it: it)
+        return List(kernels.nested(kernels.map_indexed(self.eval(fun), self)))
 
     def nested_map_not_none_indexed(self, fun: Callable[[int, T], Any]) -> List:
-        return self.map_not_none_indexed(self.eval(fun)).nested_map(lambda it: it)
+        return List(kernels.nested(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def nested_map_not_none_indexed_to_dict(self, fun: Callable[[int, T], Any]) -> "Dict":
-        return self.nested_map_not_none_indexed(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.nested(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def nested_map_not_none_indexed_to_set(self, fun: Callable[[int, T], Any]) -> "Set":
-        return self.nested_map_not_none_indexed(self.eval(fun)).map_to_set(lambda it: it)
+        from tython.src.main.data_structures.set import Set
+        return Set(kernels.nested(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def first_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().first(self.eval(fun))
+        return kernels.first(kernels.not_none(self), self.eval(fun), List())
 
     def last_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().last(self.eval(fun))
+        return kernels.first(kernels.not_none(reversed(self)), self.eval(fun), List())
 
     def first_indexed(self, fun: Callable[[int, T], Any] = None):
-        return self.map_indexed(self.eval(fun)).first()
+        if not self:
+            return List()
+        return self[0] if fun is None else self.eval(fun)(0, self[0])
 
     def last_indexed(self, fun: Callable[[int, T], Any] = None):
-        return self.map_indexed(self.eval(fun)).last()
+        if not self:
+            return List()
+        return self[-1] if fun is None else self.eval(fun)(len(self) - 1, self[-1])
 
     def first_indexed_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().first_indexed(self.eval(fun))
+        value = kernels.first(kernels.not_none(self))
+        if value is None:
+            return List()
+        return value if fun is None else self.eval(fun)(0, value)
 
     def last_indexed_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().last_indexed(self.eval(fun))
+        value = kernels.first(kernels.not_none(reversed(self)))
+        if value is None:
+            return List()
+        return value if fun is None else self.eval(fun)(kernels.count_not_none(self) - 1, value)
 
     # Specific funs ========================================
 
     def group_by(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.map_to_dict(lambda it: (self.eval(fun)(it), it))
+        from tython.src.main.data_structures.dict import Dict
+        return kernels.grouped(Dict(), kernels.keyed(self.eval(fun), self), List, List.append)
 
     def group_by_not_none(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.map_not_none_to_dict(lambda it: (self.eval(fun)(it), it))
+        from tython.src.main.data_structures.dict import Dict
+        return kernels.grouped(Dict(), kernels.keyed_not_none(self.eval(fun), self), List, List.append)
+
+    def grouping_by(self, fun: Callable[[T], Any]) -> "Grouping":
+        from tython.src.main.data_structures.grouping import Grouping
+        return Grouping(self, self.eval(fun))
+
+    def join(self, other: List, left_key: Callable[[T], Any], right_key: Callable[[Any], Any] = None,
+             how: str = "inner") -> List:
+        """
+        (left, right) pairs of elements with equal keys, by hash join, right_key defaulting to left_key.
+        how is inner, left or outer, unmatched elements being paired with None.
+        Pairs are in the order of this list, the matches of each element in the order of other,
+        and unmatched elements of other come last in outer joins.
+        """
+        right_key = left_key if right_key is None else right_key
+        return List(joins.hash_join(self, other, self.eval(left_key), self.eval(right_key), how))
+
+    def cogroup(self, other: List, left_key: Callable[[T], Any], right_key: Callable[[Any], Any] = None) -> "Dict":
+        from tython.src.main.data_structures.dict import Dict
+        right_key = left_key if right_key is None else right_key
+        return Dict(joins.cogroup(self, other, self.eval(left_key), self.eval(right_key), List))
+
+    def semi_join(self, other: List, left_key: Callable[[T], Any], right_key: Callable[[Any], Any] = None) -> List:
+        right_key = left_key if right_key is None else right_key
+        return List(joins.semi_join(self, other, self.eval(left_key), self.eval(right_key)))
+
+    def anti_join(self, other: List, left_key: Callable[[T], Any], right_key: Callable[[Any], Any] = None) -> List:
+        right_key = left_key if right_key is None else right_key
+        return List(joins.semi_join(self, other, self.eval(left_key), self.eval(right_key), anti=True))
 
     def associate(self, fun: Callable[[T], Any]) -> "Dict":
         return self.map_to_dict(self.eval(fun))
@@ -223,14 +408,30 @@ class List(list):
     def associate_with_indexed_not_none(self, fun: Callable[[int, T], Any]) -> "Dict":
         return self.map_not_none_indexed_to_dict(lambda index, value: (value, self.eval(fun)(index, value)))
 
-    def of_type(self, list_type: Type[T], check: bool = True) -> List[T]:
+    def of_type(self, list_type: Type[T], check: bool = True, compact: bool = False) -> List[T] | "TypedList":
+        """
+        With compact=True, ints, floats and bools are copied into an array backed TypedList.
+        Ints too large for 64 bits keep the regular List.
+        """
         self.list_type = list_type
         if check:
             if self.any(lambda it: not isinstance(it, list_type)):
                 raise TypeError(f"List contains elements that are not of type {list_type}")
+        if compact:
+            from tython.src.main.data_structures.typed_list import TypedList, TYPECODES
+            if list_type in TYPECODES:
+                try:
+                    return TypedList(self, list_type)
+                except OverflowError:
+                    pass
         return self
 
 
+# List's non-mutating API, which immutable lists delegate to a List of their elements.
+# Every method List defines returns a new value; list's own in place methods, append, sort..., are left out
+FUNCTIONAL_API = frozenset(name for name in vars(List) if not name.startswith("_")) | {"copy", "count", "index"}
+
+
 # Instantiation
 
 def list_of(*args: T) -> List[T]:
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+# Large enough to hold the distinct values of most repetitive columns, small enough to stay bounded
+DEFAULT_MEMO_SIZE = 4096
+
+_MISSING = object()
+_UNHASHABLE = object()
+
+
+class MemoCache:
+    """
+    Bounded LRU cache of function results keyed by function and argument, with an optional time to live in seconds.
+    Arguments are keyed with their type, and so are the items of tuple arguments, so 1, 1.0 and True are cached apart.
+    Unhashable arguments bypass the cache.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MEMO_SIZE, ttl: float = None):
+        if max_size < 1:
+            raise ValueError(f"Memo cache size must be positive, not {max_size}")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+        self._entries: OrderedDict[Any, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def memoized(self, fun: Callable[..., Any], spread: bool = False) -> Callable[[Any], Any]:
+        """
+        fun cached through this cache, called with the items of its tuple argument as arguments when spread is True
+        """
+        return lambda argument: self.call(fun, argument, spread)
+
+    def call(self, fun: Callable[..., Any], argument, spread: bool = False) -> Any:
+        key = fun, _typed(argument)
+        result = self._lookup(key)
+        if result is _UNHASHABLE or result is _MISSING:
+            computed = fun(*argument) if spread else fun(argument)
+            if result is _MISSING:
+                self._store(key, computed)
+            return computed
+        return result
+
+    def _lookup(self, key) -> Any:
+        with self._lock:
+            try:
+                entry = self._entries.get(key)
+            except TypeError:
+                self.bypassed += 1
+                return _UNHASHABLE
+            if entry is not None:
+                result, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return result
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return _MISSING
+
+    def _store(self, key, result):
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (result, expires)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "bypassed": self.bypassed,
+                "size": len(self), "max_size": self.max_size, "ttl": self.ttl}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.bypassed = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _typed(argument) -> tuple:
+    if argument.__class__ is tuple:
+        return tuple, tuple((item.__class__, item) for item in argument)
+    return argument.__class__, argument
+
+
+def memo_cache(memoize: bool, cache: Optional[MemoCache]) -> Optional[MemoCache]:
+    """
+    Cache to use for a memoized call: the shared one when given, a fresh one per call with memoize=True, or None
+    """
+    if cache is not None:
+        return cache
+    return MemoCache() if memoize else None
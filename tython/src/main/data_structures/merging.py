@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+from functools import partial, reduce
+from typing import Any, Callable, Iterable, Mapping, Tuple
+
+from tython.src.main.data_structures.dict import Dict
+from tython.src.main.data_structures.parallel import BACKENDS
+
+_MISSING = object()
+
+
+def merge_all(dicts: Iterable[Mapping], combine: Callable[[Any, Any], Any] = None, parallel: bool = False,
+              workers: int = None, backend: str = "process") -> Dict:
+    """
+    Merges every dict into a single new Dict in one pass, combine(existing, new) resolving keys seen before,
+    or the last value winning when combine is None. None of the dicts is modified.
+    With parallel=True, slices of the dicts are merged on a concurrent.futures pool, then their results are folded
+    into the first one in order, inserting each entry once, so combine must be associative,
+    and picklable with the process backend.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend must be one of {list(BACKENDS)}, not {backend}")
+    dicts = list(dicts)
+    workers = workers or os.cpu_count() or 1
+    if not parallel or workers < 2 or len(dicts) < 2:
+        return _merged(combine, dicts)
+    size = -(-len(dicts) // workers)
+    slices = [dicts[offset:offset + size] for offset in range(0, len(dicts), size)]
+    with BACKENDS[backend](max_workers=workers) as executor:
+        partials = list(executor.map(partial(_merged, combine), slices))
+    # The partials are fresh Dicts, so the first one can be merged into in place
+    return reduce(partial(merge_into, combine=combine), partials[1:], partials[0])
+
+
+def merge_into(target: dict, other: Mapping, combine: Callable[[Any, Any], Any] = None) -> dict:
+    """
+    Merges other into target in place, hashing each of its keys once
+    """
+    if combine is None:
+        target.update(other)
+        return target
+    for key, value in other.items():
+        existing = target.get(key, _MISSING)
+        target[key] = value if existing is _MISSING else combine(existing, value)
+    return target
+
+
+def reduce_by_key(pairs: Iterable[Tuple[Any, Any]], fun: Callable[[Any, Any], Any]) -> Dict:
+    result = Dict()
+    for key, value in pairs:
+        existing = result.get(key, _MISSING)
+        result[key] = value if existing is _MISSING else fun(existing, value)
+    return result
+
+
+def _merged(combine: Callable, dicts: Iterable[Mapping]) -> Dict:
+    result = Dict()
+    for other in dicts:
+        merge_into(result, other, combine)
+    return result
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import reduce
+from itertools import chain, islice, starmap
+from typing import Any, TYPE_CHECKING, TypeVar, Callable, Iterable, Optional
+
+from tython.src.main.data_structures.placeholder import Placeholder, compile_placeholder
+
+if TYPE_CHECKING:
+    from tython.src.main.data_structures.list import List
+
+T = TypeVar("T")
+
+BACKENDS = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+# Below this estimated total run time a pool costs more than it saves
+MIN_PARALLEL_SECONDS = 0.05
+# Chunks are sized to run about this long, long enough to hide the cost of shipping them to a worker
+TARGET_CHUNK_SECONDS = 0.01
+SAMPLE_SECONDS = 0.002
+MAX_SAMPLE_SIZE = 64
+
+
+class Parallel:
+    """
+    Runs map, filter, flat_map, map_indexed and fold of a List over a concurrent.futures pool, preserving order.
+    Unless chunk_size is given, the per item cost is measured on a few leading items first:
+    lists whose estimated run time is too short to pay for a pool are processed serially.
+    With the process backend, functions and elements must be picklable.
+    """
+
+    def __init__(self, values: "List", workers: int = None, backend: str = "process", chunk_size: int = None):
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend must be one of {list(BACKENDS)}, not {backend}")
+        self.values = values
+        self.workers = workers or os.cpu_count() or 1
+        self.backend = backend
+        self.chunk_size = chunk_size
+
+    def map(self, fun: Callable[[T], Any]) -> "List":
+        return self._flat_run(_map_chunk, fun)
+
+    def filter(self, fun: Callable[[T], Any]) -> "List":
+        return self._flat_run(_filter_chunk, fun)
+
+    def flat_map(self, fun: Callable[[T], Any]) -> "List":
+        return self._flat_run(_flat_map_chunk, fun)
+
+    def map_indexed(self, fun: Callable[[int, T], Any]) -> "List":
+        return self._flat_run(_map_indexed_chunk, fun)
+
+    def fold(self, fun: Callable, initial_value=None, associative: bool = False) -> Any:
+        """
+        With associative=True, chunks are reduced in parallel and their partial results combined as a tree.
+        Otherwise the fold runs serially, as the order of application matters.
+        """
+        if not associative or not self.values:
+            return self.values.fold(fun, initial_value)
+        partials = self._run(_fold_chunk, fun)
+        result = _tree_reduce(_resolve(fun), partials)
+        return result if initial_value is None else _resolve(fun)(initial_value, result)
+
+    def _run(self, worker: Callable, fun: Callable) -> list:
+        """
+        Chunk results in order: the timed leading batches, then either the serial remainder
+        or the pooled chunks.
+        """
+        results, processed, chunk_size = self._sample(worker, fun)
+        if processed == len(self.values):
+            return results
+        if chunk_size is None:
+            return results + [worker(fun, processed, islice(self.values, processed, None))]
+        return results + self._submit(worker, fun, processed, chunk_size)
+
+    def _flat_run(self, worker: Callable, fun: Callable) -> "List":
+        from tython.src.main.data_structures.list import List
+        return List(chain.from_iterable(self._run(worker, fun)))
+
+    def _sample(self, worker: Callable, fun: Callable) -> tuple[list, int, Optional[int]]:
+        """
+        Processes leading items serially, in doubling batches, while timing them.
+        Returns their chunk results, how many items they covered, and the chunk size for the remaining items,
+        which is None when they are not worth a pool.
+        """
+        if self.chunk_size:
+            return [], 0, self.chunk_size
+        results = []
+        processed = 0
+        batch = 1
+        started = time.perf_counter()
+        while processed < min(MAX_SAMPLE_SIZE, len(self.values)) and time.perf_counter() - started < SAMPLE_SECONDS:
+            results.append(worker(fun, processed, self.values[processed:processed + batch]))
+            processed = min(processed + batch, len(self.values))
+            batch *= 2
+        per_item = (time.perf_counter() - started) / max(processed, 1)
+        remaining = len(self.values) - processed
+        if self.workers < 2 or per_item * remaining < MIN_PARALLEL_SECONDS:
+            return results, processed, None
+        balanced = -(-remaining // (self.workers * 4))
+        return results, processed, max(1, min(balanced, int(TARGET_CHUNK_SECONDS / max(per_item, 1e-9))))
+
+    def _submit(self, worker: Callable, fun: Callable, start: int, chunk_size: int) -> list:
+        offsets = range(start, len(self.values), chunk_size)
+        chunks = [self.values[offset:offset + chunk_size] for offset in offsets]
+        with self._executor() as executor:
+            return list(executor.map(worker, [fun] * len(chunks), offsets, chunks))
+
+    def _executor(self) -> Executor:
+        return BACKENDS[self.backend](max_workers=self.workers)
+
+
+def _resolve(fun):
+    if isinstance(fun, Placeholder):
+        return compile_placeholder(fun)
+    return fun
+
+
+def _map_chunk(fun: Callable, start: int, chunk: Iterable) -> list:
+    return list(map(_resolve(fun), chunk))
+
+
+def _filter_chunk(fun: Callable, start: int, chunk: Iterable) -> list:
+    return list(filter(_resolve(fun), chunk))
+
+
+def _flat_map_chunk(fun: Callable, start: int, chunk: Iterable) -> list:
+    return list(chain.from_iterable(map(_resolve(fun), chunk)))
+
+
+def _map_indexed_chunk(fun: Callable, start: int, chunk: Iterable) -> list:
+    return list(starmap(_resolve(fun), enumerate(chunk, start)))
+
+
+def _fold_chunk(fun: Callable, start: int, chunk: Iterable) -> Any:
+    return reduce(_resolve(fun), chunk)
+
+
+def _tree_reduce(fun: Callable, partials: list) -> Any:
+    while len(partials) > 1:
+        paired = [fun(left, right) for left, right in zip(partials[::2], partials[1::2])]
+        partials = paired + partials[len(paired) * 2:]
+    return partials[0]
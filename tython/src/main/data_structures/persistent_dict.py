@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from collections.abc import ItemsView, KeysView, Mapping, ValuesView
+from typing import Any, Iterable, Iterator, TypeVar
+
+from tython.src.main.data_structures import hamt
+from tython.src.main.data_structures.dict import FUNCTIONAL_API, Dict
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class PersistentDict(Mapping):
+    """
+    Immutable mapping backed by a hash array mapped trie: put and remove copy one path, O(log32 n),
+    and every version shares the untouched nodes.
+    Bulk updates and construction go through a TransientDict. The rest of Dict's functional API works on a Dict.
+    """
+    __slots__ = ("_root", "_count")
+
+    def __init__(self, values: Mapping[K, V] | Iterable[tuple[K, V]] = (), **kwargs: V):
+        transient = TransientDict().put_all(values).put_all(kwargs)
+        self._root = transient._root
+        self._count = transient._count
+
+    @classmethod
+    def _of(cls, root: hamt.Node, count: int) -> PersistentDict:
+        persistent = cls.__new__(cls)
+        persistent._root = root
+        persistent._count = count
+        return persistent
+
+    def put(self, key: K, value: V) -> PersistentDict:
+        root, added = hamt.assoc(self._root, None, 0, (hamt.hash_of(key), key, value))
+        return self if root is self._root else self._of(root, self._count + added)
+
+    def put_all(self, values: Mapping[K, V] | Iterable[tuple[K, V]]) -> PersistentDict:
+        return self.transient().put_all(values).persistent()
+
+    def remove(self, key) -> PersistentDict:
+        root, removed = hamt.without(self._root, None, 0, hamt.hash_of(key), key)
+        return self._of(root, self._count - 1) if removed else self
+
+    def remove_all(self, keys: Iterable) -> PersistentDict:
+        return self.transient().remove_all(keys).persistent()
+
+    def transient(self) -> TransientDict:
+        return TransientDict(self)
+
+    def get(self, key, default=None) -> V:
+        return hamt.find(self._root, hamt.hash_of(key), key, default)
+
+    def length(self) -> int:
+        return self._count
+
+    def to_dict(self) -> Dict[K, V]:
+        return Dict(self.items())
+
+    def keys(self) -> KeysView:
+        return KeysView(self)
+
+    def values(self) -> ValuesView:
+        return _ValuesView(self)
+
+    def items(self) -> ItemsView:
+        return _ItemsView(self)
+
+    def __add__(self, other: Mapping[K, V] | Iterable[tuple[K, V]]) -> PersistentDict:
+        return self.put_all(other)
+
+    def __sub__(self, keys: Iterable) -> PersistentDict:
+        return self.remove_all(keys)
+
+    def __getitem__(self, key) -> V:
+        value = hamt.find(self._root, hamt.hash_of(key), key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return hamt.find(self._root, hamt.hash_of(key), key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[K]:
+        return (leaf[1] for leaf in hamt.leaves(self._root))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"PersistentDict({dict(self.items())})"
+
+    def __getattr__(self, name: str) -> Any:
+        # The rest of the functional API, map_values, filter, fold, group_by..., runs over a Dict of the entries
+        if name not in FUNCTIONAL_API:
+            raise AttributeError(f"'PersistentDict' object has no attribute '{name}'")
+        return getattr(self.to_dict(), name)
+
+
+class _ItemsView(ItemsView):
+
+    def __iter__(self) -> Iterator[tuple]:
+        return (leaf[1:] for leaf in hamt.leaves(self._mapping._root))
+
+
+class _ValuesView(ValuesView):
+
+    def __iter__(self) -> Iterator:
+        return (leaf[2] for leaf in hamt.leaves(self._mapping._root))
+
+
+class TransientDict:
+    """
+    Mutable builder sharing the nodes of the PersistentDict it starts from.
+    Nodes it copies are owned by its edit token and changed in place from then on,
+    until persistent() hands them over to a new PersistentDict and ends the transient.
+    """
+
+    def __init__(self, persistent: PersistentDict = None):
+        self._edit = object()
+        self._root = persistent._root if persistent is not None else None
+        self._count = persistent._count if persistent is not None else 0
+
+    def put(self, key: K, value: V) -> TransientDict:
+        self._root, added = hamt.assoc(self._root, self._owner(), 0, (hamt.hash_of(key), key, value))
+        self._count += added
+        return self
+
+    def put_all(self, values: Mapping[K, V] | Iterable[tuple[K, V]]) -> TransientDict:
+        for key, value in values.items() if isinstance(values, Mapping) else values:
+            self.put(key, value)
+        return self
+
+    def remove(self, key) -> TransientDict:
+        self._root, removed = hamt.without(self._root, self._owner(), 0, hamt.hash_of(key), key)
+        self._count -= removed
+        return self
+
+    def remove_all(self, keys: Iterable) -> TransientDict:
+        for key in keys:
+            self.remove(key)
+        return self
+
+    def persistent(self) -> PersistentDict:
+        self._owner()
+        self._edit = None
+        return PersistentDict._of(self._root, self._count)
+
+    def get(self, key, default=None) -> V:
+        return hamt.find(self._root, hamt.hash_of(key), key, default)
+
+    def __contains__(self, key) -> bool:
+        return hamt.find(self._root, hamt.hash_of(key), key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _owner(self) -> object:
+        if self._edit is None:
+            raise RuntimeError("Transient used after persistent()")
+        return self._edit
+
+
+_MISSING = object()
+
+
+# Instantiation
+
+def persistent_dict_of(**kwargs: V) -> PersistentDict:
+    return PersistentDict(kwargs)
+
+
+def persistent_dict_from(args: Mapping[K, V] | Iterable[tuple[K, V]]) -> PersistentDict:
+    return PersistentDict(args)
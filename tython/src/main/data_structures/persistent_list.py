@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from itertools import chain, islice
+from operator import eq
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from tython.src.main.data_structures import kernels
+from tython.src.main.data_structures.list import FUNCTIONAL_API, List
+from tython.src.main.data_structures.placeholder import Placeholder, compile_placeholder
+
+T = TypeVar("T")
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+
+class PersistentList:
+    """
+    Immutable list with structural sharing: a 32-way trie of tuples plus a tail of up to 32 elements,
+    like Clojure's PersistentVector.
+    add, set and removing the last element copy one path of the trie, so they are O(log32 n),
+    while concatenation and remove_at append the elements after the change, O(len(other)) and O(n - index).
+    The rest of List's functional API works on a List of the elements.
+    """
+    __slots__ = ("_count", "_shift", "_root", "_tail", "_hash")
+
+    def __init__(self, values: Iterable[T] = ()):
+        self._count = 0
+        self._shift = BITS
+        self._root = ()
+        self._tail = ()
+        self._hash = None
+        self._count, self._shift, self._root, self._tail = _appended(self, values)
+
+    @staticmethod
+    def eval(fun) -> Callable:
+        if isinstance(fun, Placeholder):
+            return compile_placeholder(fun)
+        return fun
+
+    @classmethod
+    def _of(cls, count: int, shift: int, root: tuple, tail: tuple) -> PersistentList:
+        persistent = cls.__new__(cls)
+        persistent._count = count
+        persistent._shift = shift
+        persistent._root = root
+        persistent._tail = tail
+        persistent._hash = None
+        return persistent
+
+    # Persistent updates =============================================
+
+    def add(self, element: T) -> PersistentList:
+        if len(self._tail) < WIDTH:
+            return self._of(self._count + 1, self._shift, self._root, self._tail + (element,))
+        root, shift = _pushed(self._root, self._shift, self._tail_offset(), self._tail)
+        return self._of(self._count + 1, shift, root, (element,))
+
+    def add_all(self, elements: Iterable[T]) -> PersistentList:
+        return self._of(*_appended(self, elements))
+
+    def set(self, index: int, element: T) -> PersistentList:
+        index = self._index(index)
+        if index >= self._tail_offset():
+            tail_index = index - self._tail_offset()
+            return self._of(self._count, self._shift, self._root,
+                            self._tail[:tail_index] + (element,) + self._tail[tail_index + 1:])
+        return self._of(self._count, self._shift, _with_value(self._root, self._shift, index, element), self._tail)
+
+    def take(self, count: int) -> PersistentList:
+        """
+        First count elements, sharing every full leaf of the trie
+        """
+        if count >= self._count:
+            return self
+        if count <= 0:
+            return PersistentList()
+        tail_offset = self._tail_offset()
+        if count > tail_offset:
+            return self._of(count, self._shift, self._root, self._tail[:count - tail_offset])
+        leaf_start = (count - 1) & ~MASK
+        tail = self._leaf(leaf_start)[:count - leaf_start]
+        root = _truncated(self._root, self._shift, leaf_start) if leaf_start else ()
+        shift = self._shift if leaf_start else BITS
+        while shift > BITS and len(root) == 1:
+            root = root[0]
+            shift -= BITS
+        return self._of(count, shift, root, tail)
+
+    def pop(self) -> PersistentList:
+        if not self._count:
+            raise IndexError("pop from empty list")
+        return self.take(self._count - 1)
+
+    def remove_at(self, index: int) -> PersistentList:
+        index = self._index(index)
+        return self.take(index).add_all(islice(self, index + 1, None))
+
+    def remove(self, element) -> PersistentList:
+        return self._without(lambda it: it != element)
+
+    def remove_all(self, elements) -> PersistentList:
+        return self._without(lambda it: it not in elements)
+
+    def _without(self, keep: Callable[[T], bool]) -> PersistentList:
+        # Everything before the first removed element is shared as is
+        for index, value in enumerate(self):
+            if not keep(value):
+                return self.take(index).add_all(filter(keep, islice(self, index + 1, None)))
+        return self
+
+    # Access =============================================
+
+    def get(self, index: int) -> T:
+        index = self._index(index)
+        if index >= self._tail_offset():
+            return self._tail[index - self._tail_offset()]
+        return self._leaf(index)[index & MASK]
+
+    def first(self, fun: Callable[[T], bool] = None) -> T:
+        return kernels.first(self, self.eval(fun), List())
+
+    def last(self, fun: Callable[[T], bool] = None) -> T:
+        return kernels.first(reversed(self), self.eval(fun), List())
+
+    def length(self) -> int:
+        return self._count
+
+    def to_list(self) -> List[T]:
+        return List(self)
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("list index out of range")
+        return index
+
+    def _tail_offset(self) -> int:
+        return self._count - len(self._tail)
+
+    def _leaf(self, index: int) -> tuple:
+        node = self._root
+        for level in range(self._shift, 0, -BITS):
+            node = node[(index >> level) & MASK]
+        return node
+
+    # Protocols =============================================
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[T]:
+        return chain(chain.from_iterable(_leaves(self._root, self._shift)), self._tail)
+
+    def __reversed__(self) -> Iterator[T]:
+        return chain(reversed(self._tail), chain.from_iterable(map(reversed, _leaves(self._root, self._shift, True))))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if start == 0 and step == 1:
+                return self.take(stop)
+            return PersistentList(islice(self, start, stop, step) if step > 0 else list(self)[index])
+        return self.get(index)
+
+    def __add__(self, other: Iterable[T]) -> PersistentList:
+        return self.add_all(other)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (PersistentList, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(map(eq, self, other))
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"PersistentList({list(self)})"
+
+    def __getattr__(self, name: str) -> Any:
+        # The rest of the functional API, map, filter, fold, group_by..., runs over a List of the elements
+        if name not in FUNCTIONAL_API:
+            raise AttributeError(f"'PersistentList' object has no attribute '{name}'")
+        return getattr(List(self), name)
+
+
+def _appended(persistent: PersistentList, elements: Iterable) -> tuple[int, int, tuple, tuple]:
+    """
+    Appends in bulk, filling a private tail and pushing it into the trie once per 32 elements
+    """
+    count, shift, root, tail = persistent._count, persistent._shift, persistent._root, list(persistent._tail)
+    for element in elements:
+        if len(tail) == WIDTH:
+            root, shift = _pushed(root, shift, count - WIDTH, tuple(tail))
+            tail = []
+        tail.append(element)
+        count += 1
+    return count, shift, root, tuple(tail)
+
+
+def _pushed(root: tuple, shift: int, index: int, leaf: tuple) -> tuple[tuple, int]:
+    """
+    Root after inserting the full leaf starting at index, growing the trie by one level when it is full
+    """
+    if index == 1 << (shift + BITS):
+        root = (root,)
+        shift += BITS
+    return _with_leaf(root, shift, index, leaf), shift
+
+
+def _with_leaf(node: Optional[tuple], shift: int, index: int, leaf: tuple) -> tuple:
+    node = node or ()
+    slot = (index >> shift) & MASK
+    child = leaf if shift == BITS else _with_leaf(node[slot] if slot < len(node) else None, shift - BITS, index, leaf)
+    return node[:slot] + (child,) + node[slot + 1:]
+
+
+def _with_value(node: tuple, shift: int, index: int, value) -> tuple:
+    slot = (index >> shift) & MASK
+    child = value if shift == 0 else _with_value(node[slot], shift - BITS, index, value)
+    return node[:slot] + (child,) + node[slot + 1:]
+
+
+def _truncated(node: tuple, shift: int, end: int) -> tuple:
+    """
+    Node keeping the leaves before end, a multiple of 32
+    """
+    slot = ((end - 1) >> shift) & MASK
+    if shift == BITS:
+        return node[:slot + 1]
+    return node[:slot] + (_truncated(node[slot], shift - BITS, end),)
+
+
+def _leaves(node: tuple, shift: int, backwards: bool = False) -> Iterator[tuple]:
+    children = reversed(node) if backwards else node
+    if shift == BITS:
+        return iter(children)
+    return chain.from_iterable(_leaves(child, shift - BITS, backwards) for child in children)
+
+
+# Instantiation
+
+def persistent_list_of(*args: T) -> PersistentList:
+    return PersistentList(args)
+
+
+def persistent_list_from(iterable: Iterable[T]) -> PersistentList:
+    return PersistentList(iterable)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Set as AbstractSet
+from typing import Any, Iterable, Iterator, TypeVar
+
+from tython.src.main.data_structures import hamt
+from tython.src.main.data_structures.set import FUNCTIONAL_API, Set
+
+T = TypeVar("T")
+
+
+class PersistentSet(AbstractSet):
+    """
+    Immutable set backed by a hash array mapped trie: add and remove copy one path, O(log32 n),
+    and every version shares the untouched nodes.
+    Bulk updates and construction go through a TransientSet. The rest of Set's functional API works on a Set.
+    The hash is maintained incrementally, so it costs O(1) for every version.
+    """
+    __slots__ = ("_root", "_count", "_hashes")
+
+    def __init__(self, values: Iterable[T] = ()):
+        transient = TransientSet().add_all(values)
+        self._root = transient._root
+        self._count = transient._count
+        self._hashes = transient._hashes
+
+    @classmethod
+    def _of(cls, root: hamt.Node, count: int, hashes: int) -> PersistentSet:
+        persistent = cls.__new__(cls)
+        persistent._root = root
+        persistent._count = count
+        persistent._hashes = hashes
+        return persistent
+
+    def add(self, element: T) -> PersistentSet:
+        key_hash = hamt.hash_of(element)
+        root, added = hamt.assoc(self._root, None, 0, (key_hash, element, None))
+        return self._of(root, self._count + 1, self._hashes ^ _mixed(key_hash)) if added else self
+
+    def add_all(self, elements: Iterable[T]) -> PersistentSet:
+        return self.transient().add_all(elements).persistent()
+
+    def remove(self, element) -> PersistentSet:
+        key_hash = hamt.hash_of(element)
+        root, removed = hamt.without(self._root, None, 0, key_hash, element)
+        return self._of(root, self._count - 1, self._hashes ^ _mixed(key_hash)) if removed else self
+
+    def remove_all(self, elements) -> PersistentSet:
+        return self.transient().remove_all(elements).persistent()
+
+    def transient(self) -> TransientSet:
+        return TransientSet(self)
+
+    def length(self) -> int:
+        return self._count
+
+    def to_set(self) -> Set[T]:
+        return Set(self)
+
+    def __add__(self, other: Iterable[T]) -> PersistentSet:
+        if isinstance(other, PersistentSet) and len(other) > len(self):
+            return other.add_all(self)
+        return self.add_all(other)
+
+    def __sub__(self, other: Iterable) -> PersistentSet:
+        return self.remove_all(other)
+
+    def __contains__(self, element) -> bool:
+        return hamt.find(self._root, hamt.hash_of(element), element, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[T]:
+        return (leaf[1] for leaf in hamt.leaves(self._root))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __hash__(self) -> int:
+        return _finished(self._hashes, self._count)
+
+    def __repr__(self) -> str:
+        return f"PersistentSet({set(self)})"
+
+    def __getattr__(self, name: str) -> Any:
+        # The rest of the functional API, map, filter, fold, group_by..., runs over a Set of the elements
+        if name not in FUNCTIONAL_API:
+            raise AttributeError(f"'PersistentSet' object has no attribute '{name}'")
+        return getattr(Set(self), name)
+
+
+class TransientSet:
+    """
+    Mutable builder sharing the nodes of the PersistentSet it starts from.
+    Nodes it copies are owned by its edit token and changed in place from then on,
+    until persistent() hands them over to a new PersistentSet and ends the transient.
+    """
+
+    def __init__(self, persistent: PersistentSet = None):
+        self._edit = object()
+        self._root = persistent._root if persistent is not None else None
+        self._count = persistent._count if persistent is not None else 0
+        self._hashes = persistent._hashes if persistent is not None else 0
+
+    def add(self, element: T) -> TransientSet:
+        key_hash = hamt.hash_of(element)
+        self._root, added = hamt.assoc(self._root, self._owner(), 0, (key_hash, element, None))
+        if added:
+            self._count += 1
+            self._hashes ^= _mixed(key_hash)
+        return self
+
+    def add_all(self, elements: Iterable[T]) -> TransientSet:
+        for element in elements:
+            self.add(element)
+        return self
+
+    def remove(self, element) -> TransientSet:
+        key_hash = hamt.hash_of(element)
+        self._root, removed = hamt.without(self._root, self._owner(), 0, key_hash, element)
+        if removed:
+            self._count -= 1
+            self._hashes ^= _mixed(key_hash)
+        return self
+
+    def remove_all(self, elements) -> TransientSet:
+        for element in elements:
+            self.remove(element)
+        return self
+
+    def persistent(self) -> PersistentSet:
+        self._owner()
+        self._edit = None
+        return PersistentSet._of(self._root, self._count, self._hashes)
+
+    def __contains__(self, element) -> bool:
+        return hamt.find(self._root, hamt.hash_of(element), element, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _owner(self) -> object:
+        if self._edit is None:
+            raise RuntimeError("Transient used after persistent()")
+        return self._edit
+
+
+_MISSING = object()
+
+# The hash is frozenset's, as in collections.abc.Set._hash, so equal sets hash alike whatever their type.
+# Its per element terms are combined by XOR, so they are kept up to date on every add and remove.
+_MAX = sys.maxsize
+_WORD_MASK = 2 * _MAX + 1
+
+
+def _mixed(key_hash: int) -> int:
+    key_hash &= _WORD_MASK
+    return ((key_hash ^ (key_hash << 16) ^ 89869747) * 3644798167) & _WORD_MASK
+
+
+def _finished(hashes: int, count: int) -> int:
+    result = hashes ^ ((1927868237 * (count + 1)) & _WORD_MASK)
+    result ^= (result >> 11) ^ (result >> 25)
+    result = (result * 69069 + 907133923) & _WORD_MASK
+    if result > _MAX:
+        result -= _WORD_MASK + 1
+    return 590923713 if result == -1 else result
+
+
+# Instantiation
+
+def persistent_set_of(*args: T) -> PersistentSet:
+    return PersistentSet(args)
+
+
+def persistent_set_from(iterable: Iterable[T]) -> PersistentSet:
+    return PersistentSet(iterable)
@@ -1,184 +1,223 @@
 from __future__ import annotations
 
-from functools import reduce
+import keyword
+import threading
+from collections import OrderedDict
 from typing import Optional, List, Callable, TypeVar, Type
 
 T = TypeVar("T")
 
+_BINARY_OPERATORS = {
+    "add": "+", "sub": "-", "mul": "*", "truediv": "/", "floordiv": "//", "mod": "%", "pow": "**",
+    "lshift": "<<", "rshift": ">>", "and": "&", "xor": "^", "or": "|",
+    "lt": "<", "le": "<=", "eq": "==", "ne": "!=", "gt": ">", "ge": ">=",
+}
+_REFLECTED_OPERATORS = {
+    "radd": "+", "rsub": "-", "rmul": "*", "rtruediv": "/", "rfloordiv": "//", "rmod": "%", "rpow": "**",
+    "rlshift": "<<", "rrshift": ">>", "rand": "&", "rxor": "^", "ror": "|",
+}
+_UNARY_TEMPLATES = {
+    "neg": "(-{0})", "pos": "(+{0})", "abs": "abs({0})", "invert": "(~{0})", "bool": "bool({0})",
+    "iter": "iter({0})", "next": "next({0})", "len": "len({0})", "reversed": "reversed({0})",
+}
+_OPERATIONS_PER_STATEMENT = 32
+
 
 class Placeholder:
 
-    def __init__(self, operations: Optional[List[EvalPair]] = None, placeholder_type: [Type[T]] = None):
+    def __init__(self, tail: Optional[EvalPair] = None, placeholder_type: [Type[T]] = None):
         if placeholder_type:
             self.placeholder_type = placeholder_type
-        self.operations = operations
+        # Private, as any public attribute would shadow __getattr__ and stop it.<name> from building an expression
+        self._tail = tail
+        self._compiled = None
+
+    @property
+    def operations(self) -> List[EvalPair]:
+        """
+        Operations from the first to the last one applied, walked back from the shared tail
+        """
+        operations = []
+        operation = self._tail
+        while operation is not None:
+            operations.append(operation)
+            operation = operation.previous
+        operations.reverse()
+        return operations
 
     def eval(self, value):
-        if self.operations:
-            return reduce(lambda acc, operation: operation.eval(acc), self.operations, value)
-        return value
+        return compile_placeholder(self)(value)
 
-    def monad(self, operation, other=None):
-        if self.operations is None:
-            return Placeholder([EvalPair(operation, other)])
-        return Placeholder(self.operations + [EvalPair(operation, other)])
+    def monad(self, operation: str, other=None):
+        return Placeholder(EvalPair(operation, other, self._tail))
 
     def __add__(self, other):
-        return self.monad(lambda x: x + other, other)
+        return self.monad("add", other)
 
     def __radd__(self, other):
-        return self.monad(lambda x: other + x, other)
+        return self.monad("radd", other)
 
     def __sub__(self, other):
-        return self.monad(lambda x: x - other, other)
+        return self.monad("sub", other)
 
     def __rsub__(self, other):
-        return self.monad(lambda x: other - x, other)
+        return self.monad("rsub", other)
 
     def __mul__(self, other):
-        return self.monad(lambda x: x * other, other)
+        return self.monad("mul", other)
 
     def __rmul__(self, other):
-        return self.monad(lambda x: other * x, other)
+        return self.monad("rmul", other)
 
     def __truediv__(self, other):
-        return self.monad(lambda x: x / other, other)
+        return self.monad("truediv", other)
 
     def __rtruediv__(self, other):
-        return self.monad(lambda x: other / x, other)
+        return self.monad("rtruediv", other)
 
     def __floordiv__(self, other):
-        return self.monad(lambda x: x // other, other)
+        return self.monad("floordiv", other)
 
     def __rfloordiv__(self, other):
-        return self.monad(lambda x: other // x, other)
+        return self.monad("rfloordiv", other)
 
     def __mod__(self, other):
-        return self.monad(lambda x: x % other, other)
+        return self.monad("mod", other)
 
     def __rmod__(self, other):
-        return self.monad(lambda x: other % x, other)
+        return self.monad("rmod", other)
 
     def __pow__(self, other):
-        return self.monad(lambda x: x ** other, other)
+        return self.monad("pow", other)
 
     def __rpow__(self, other):
-        return self.monad(lambda x: other ** x, other)
+        return self.monad("rpow", other)
 
     def __lshift__(self, other):
-        return self.monad(lambda x: x << other, other)
+        return self.monad("lshift", other)
 
     def __rlshift__(self, other):
-        return self.monad(lambda x: other << x, other)
+        return self.monad("rlshift", other)
 
     def __rshift__(self, other):
-        return self.monad(lambda x: x >> other, other)
+        return self.monad("rshift", other)
 
     def __rrshift__(self, other):
-        return self.monad(lambda x: other >> x, other)
+        return self.monad("rrshift", other)
 
     def __and__(self, other):
-        return self.monad(lambda x: x & other, other)
+        return self.monad("and", other)
 
     def __rand__(self, other):
-        return self.monad(lambda x: other & x, other)
+        return self.monad("rand", other)
 
     def __xor__(self, other):
-        return self.monad(lambda x: x ^ other, other)
+        return self.monad("xor", other)
 
     def __rxor__(self, other):
-        return self.monad(lambda x: other ^ x, other)
+        return self.monad("rxor", other)
 
     def __or__(self, other):
-        return self.monad(lambda x: x | other, other)
+        return self.monad("or", other)
 
     def __ror__(self, other):
-        return self.monad(lambda x: other | x, other)
+        return self.monad("ror", other)
 
     def __neg__(self):
-        return self.monad(lambda x: -x)
+        return self.monad("neg")
 
     def __pos__(self):
-        return self.monad(lambda x: +x)
+        return self.monad("pos")
 
     def __abs__(self):
-        return self.monad(lambda x: abs(x))
+        return self.monad("abs")
 
     def __invert__(self):
-        return self.monad(lambda x: ~x)
+        return self.monad("invert")
 
     def __lt__(self, other):
-        return self.monad(lambda x: x < other, other)
+        return self.monad("lt", other)
 
     def __le__(self, other):
-        return self.monad(lambda x: x <= other, other)
+        return self.monad("le", other)
 
     def __eq__(self, other):
-        return self.monad(lambda x: x == other, other)
+        return self.monad("eq", other)
 
     def __ne__(self, other):
-        return self.monad(lambda x: x != other, other)
+        return self.monad("ne", other)
 
     def __gt__(self, other):
-        return self.monad(lambda x: x > other, other)
+        return self.monad("gt", other)
 
     def __ge__(self, other):
-        return self.monad(lambda x: x >= other, other)
+        return self.monad("ge", other)
 
     def __contains__(self, other):
-        return self.monad(lambda x: other in x, other)
+        return self.monad("contains", other)
 
     def __getitem__(self, other):
-        return self.monad(lambda x: x[other], other)
+        return self.monad("getitem", other)
 
     def __getattr__(self, other):
-        return self.monad(lambda x: getattr(x, other), other)
+        return self.monad("getattr", other)
 
     def __call__(self, *args, **kwargs):
-        return self.monad(lambda x: x(*args, **kwargs))
+        return self.monad("call", (args, kwargs))
 
     def __iter__(self):
-        return self.monad(lambda x: iter(x))
+        return self.monad("iter")
 
     def __next__(self):
-        return self.monad(lambda x: next(x))
+        return self.monad("next")
 
     def __len__(self):
-        return self.monad(lambda x: len(x))
+        return self.monad("len")
 
     @property
     def iter(self):
         """
         Callable iter() alternative
         """
-        return self.monad(lambda x: iter(x))
+        return self.monad("iter")
 
     @property
     def size(self):
         """
         Callable len() alternative
         """
-        return self.monad(lambda x: len(x))
+        return self.monad("len")
 
     @property
     def next(self):
         """
         Callable next() alternative
         """
-        return self.monad(lambda x: next(x))
+        return self.monad("next")
 
     @property
     def reversed(self):
         """
         Callable reversed() alternative
         """
-        return self.monad(lambda x: reversed(x))
+        return self.monad("reversed")
 
     def __bool__(self):
-        return self.monad(lambda x: bool(x))
+        return self.monad("bool")
+
+    def __reduce__(self):
+        # Pickled as opcodes only: the compiled function cannot be pickled and is rebuilt on first use
+        return from_opcodes, (opcodes_of(self), self.__dict__.get("placeholder_type"))
+
+    # Placeholders are immutable, and these must not fall through to __getattr__ as operations
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self):
-        if not self.operations:
+        if self._tail is None:
             return "self"
         operations_repr = ".".join(list(map(str, self.operations)))
         return f"self.{operations_repr}"
@@ -191,22 +230,249 @@ class Placeholder:
 
 
 class EvalPair:
-    def __init__(self, operation: Callable, value):
+    """
+    Immutable link of an operation chain, pointing back to the operation applied before it.
+    Derived placeholders append a new link, so common prefixes are shared instead of copied.
+    """
+    __slots__ = ("operation", "value", "previous", "cached_hash")
+
+    def __init__(self, operation: str, value, previous: Optional[EvalPair] = None):
         self.operation = operation
         self.value = value
+        self.previous = previous
+        self.cached_hash = None
 
     def __repr__(self):
-        value_repr = self.value or ""
+        if self.operation == "call":
+            args, kwargs = self.value
+            value_repr = ", ".join([*map(repr, args), *(f"{key}={value!r}" for key, value in kwargs.items())])
+        else:
+            value_repr = self.value or ""
         return f"{self.get_op_name()}({value_repr})"
 
     def eval(self, other):
-        try:
-            return self.operation(other)
-        except Exception:
-            raise Exception(f"Error evaluating {self.get_op_name()}({other})")
+        return compile_operations([self])(other)
+
+    @property
+    def shape(self):
+        """
+        What the rendered source depends on: the operation, plus the name of attributes inlined in it.
+        Operands are not part of it, they are bound as parameters.
+        """
+        if self.operation == "getattr" and _is_plain_attribute(self.value):
+            return self.operation, self.value
+        return self.operation
+
+    @property
+    def operands(self) -> tuple:
+        """
+        Values bound to the parameters render declares for this operation, in the same order
+        """
+        if self.operation in _UNARY_TEMPLATES or (self.operation == "getattr" and _is_plain_attribute(self.value)):
+            return ()
+        if self.operation == "call":
+            return self.value
+        return self.value,
 
     def get_op_name(self):
-        try:
-            return str(self.operation).split(".")[1]
-        except Exception:
-            str(self.operation)
+        return f"__{self.operation}__"
+
+    def render(self, expression: str, parameters: list) -> str:
+        """
+        Renders this operation as Python source applied over expression, declaring a parameter per operand.
+        """
+        if self.operation in _UNARY_TEMPLATES:
+            return _UNARY_TEMPLATES[self.operation].format(expression)
+        if self.operation == "call":
+            return f"{expression}(*{_parameter(parameters)}, **{_parameter(parameters)})"
+        if self.operation == "getattr" and _is_plain_attribute(self.value):
+            return f"{expression}.{self.value}"
+        operand = _parameter(parameters)
+        if self.operation in _BINARY_OPERATORS:
+            return f"({expression} {_BINARY_OPERATORS[self.operation]} {operand})"
+        if self.operation in _REFLECTED_OPERATORS:
+            return f"({operand} {_REFLECTED_OPERATORS[self.operation]} {expression})"
+        if self.operation == "contains":
+            return f"({operand} in {expression})"
+        if self.operation == "getitem":
+            return f"{expression}[{operand}]"
+        if self.operation == "getattr":
+            return f"getattr({expression}, {operand})"
+        raise ValueError(f"Unknown placeholder operation {self.operation}")
+
+
+class PlaceholderRegistry:
+    """
+    Bounded LRU registry of compiled placeholder shapes: the source of a chain only depends on its operations,
+    so placeholders that differ only by their operands share one compiled factory.
+    Each placeholder then binds its own operands, as operands comparing equal, such as 0.0 and -0.0
+    or Decimal("1.0") and Decimal("1.00"), may still behave differently.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, Callable] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def factory(self, operations: List[EvalPair]) -> Callable[..., Callable]:
+        shape = tuple(operation.shape for operation in operations)
+        with self._lock:
+            factory = self._entries.get(shape)
+            if factory is not None:
+                self.hits += 1
+                self._entries.move_to_end(shape)
+                return factory
+            self.misses += 1
+        factory = compile_factory(operations)
+        if self.max_size > 0:
+            with self._lock:
+                self._entries[shape] = factory
+                if len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return factory
+
+    def compiled(self, placeholder: Placeholder) -> Callable:
+        operations = placeholder.operations
+        return self.factory(operations)(*_operands(operations))
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self), "max_size": self.max_size}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+placeholder_registry = PlaceholderRegistry()
+
+
+def structural_hash(placeholder: Placeholder) -> int:
+    """
+    Hash of the operations and operands of the placeholder, cached on each link of its chain.
+    """
+    pending = []
+    link = placeholder._tail
+    while link is not None and link.cached_hash is None:
+        pending.append(link)
+        link = link.previous
+    current = hash(None) if link is None else link.cached_hash
+    for link in reversed(pending):
+        current = link.cached_hash = hash((current, link.operation, _operand_key(link.value)))
+    return current
+
+
+def structurally_equal(left: Placeholder, right: Placeholder) -> bool:
+    """
+    Whether both placeholders apply the same operations with the same operands.
+    Unhashable operands are only equal to themselves.
+    """
+    if structural_hash(left) != structural_hash(right):
+        return False
+    left_link, right_link = left._tail, right._tail
+    while left_link is not right_link:
+        if left_link is None or right_link is None:
+            return False
+        if left_link.operation != right_link.operation:
+            return False
+        if _operand_key(left_link.value) != _operand_key(right_link.value):
+            return False
+        left_link, right_link = left_link.previous, right_link.previous
+    return True
+
+
+def compile_placeholder(placeholder: Placeholder) -> Callable:
+    """
+    Returns the native function equivalent to the placeholder, built on first use
+    from the compiled factory of its shape in the registry.
+    """
+    compiled = placeholder._compiled
+    if compiled is None:
+        compiled = placeholder._compiled = placeholder_registry.compiled(placeholder)
+    return compiled
+
+
+def then(first: Placeholder, second: Placeholder) -> Placeholder:
+    """
+    Placeholder applying the operations of second over the result of first.
+    """
+    tail = first._tail
+    for operation in second.operations:
+        tail = EvalPair(operation.operation, operation.value, tail)
+    return Placeholder(tail)
+
+
+def opcodes_of(placeholder: Placeholder) -> tuple:
+    """
+    Compact (operation, operand) form of the chain, rebuilt by from_opcodes.
+    A function rather than a property, which would shadow it.opcodes as an expression.
+    """
+    return tuple((operation.operation, operation.value) for operation in placeholder.operations)
+
+
+def from_opcodes(opcodes: tuple, placeholder_type: Type[T] = None) -> Placeholder:
+    tail = None
+    for operation, value in opcodes:
+        tail = EvalPair(operation, value, tail)
+    return Placeholder(tail, placeholder_type)
+
+
+def compile_operations(operations: List[EvalPair]) -> Callable:
+    return compile_factory(operations)(*_operands(operations))
+
+
+def compile_factory(operations: List[EvalPair]) -> Callable[..., Callable]:
+    """
+    Flattens a chain of operations into the source of a single function and compiles it,
+    wrapped in a factory taking the operands of the chain and returning the function closed over them.
+    Long chains are split into one statement per _OPERATIONS_PER_STATEMENT operations,
+    so they never hit the parser nesting limit.
+    """
+    parameters = []
+    statements = []
+    expression = "x"
+    for index, operation in enumerate(operations, 1):
+        expression = operation.render(expression, parameters)
+        if index % _OPERATIONS_PER_STATEMENT == 0:
+            statements.append(f"        x = {expression}\n")
+            expression = "x"
+    source = (f"def factory({', '.join(parameters)}):\n"
+              f"    def placeholder(x):\n{''.join(statements)}        return {expression}\n"
+              f"    return placeholder\n")
+    namespace = dict()
+    exec(compile(source, "<placeholder>", "exec"), namespace)
+    return namespace["factory"]
+
+
+def _operands(operations: List[EvalPair]) -> list:
+    return [operand for operation in operations for operand in operation.operands]
+
+
+def _parameter(parameters: list) -> str:
+    name = f"_v{len(parameters)}"
+    parameters.append(name)
+    return name
+
+
+def _operand_key(value):
+    if isinstance(value, tuple):
+        return tuple, tuple(map(_operand_key, value))
+    if isinstance(value, dict):
+        return dict, tuple((key, _operand_key(item)) for key, item in value.items())
+    if isinstance(value, slice):
+        return slice, _operand_key((value.start, value.stop, value.step))
+    try:
+        hash(value)
+    except TypeError:
+        return id, id(value)
+    return type(value), value
+
+
+def _is_plain_attribute(name) -> bool:
+    return isinstance(name, str) and name.isidentifier() and not keyword.iskeyword(name)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from functools import reduce
+from itertools import chain, starmap
+from typing import Any, TYPE_CHECKING, TypeVar, Callable, Iterable, Iterator
+
+from tython.src.main.data_structures.placeholder import Placeholder, compile_placeholder, then
+from tython.src.main.data_structures.windows import Windows, batched, windowed, zip_with_next
+
+if TYPE_CHECKING:
+    from tython.src.main.data_structures.dict import Dict
+    from tython.src.main.data_structures.list import List
+    from tython.src.main.data_structures.set import Set
+
+T = TypeVar("T")
+
+
+class Sequence:
+    """
+    Lazy pipeline over an iterable, in the spirit of Kotlin's Sequence.
+    Intermediate operations only record a stage, terminal operations run every stage in a single pass
+    without building intermediate containers.
+    """
+
+    def __init__(self, source: Iterable[T], stages: tuple = ()):
+        self._source = source
+        self._stages = stages
+
+    @staticmethod
+    def eval(fun) -> Callable:
+        if isinstance(fun, Placeholder):
+            return compile_placeholder(fun)
+        return fun
+
+    def _stage(self, kind: str, fun: Callable = None) -> Sequence:
+        return Sequence(self._source, self._stages + ((kind, fun),))
+
+    def __iter__(self) -> Iterator:
+        iterator = iter(self._source)
+        for kind, fun in self._stages:
+            iterator = _STAGES[kind](self.eval(fun), iterator)
+        return iterator
+
+    # Intermediate operations =============================================
+
+    def map(self, fun: Callable[[T], Any]) -> Sequence:
+        if self._stages and isinstance(fun, Placeholder):
+            kind, previous = self._stages[-1]
+            if kind == "map" and isinstance(previous, Placeholder):
+                # Consecutive placeholder maps are fused into one compiled expression
+                return Sequence(self._source, self._stages[:-1] + (("map", then(previous, fun)),))
+        return self._stage("map", fun)
+
+    def filter(self, fun: Callable[[T], Any]) -> Sequence:
+        return self._stage("filter", fun)
+
+    def filter_none(self) -> Sequence:
+        return self._stage("filter_none")
+
+    def flat_map(self, fun: Callable[[T], Any]) -> Sequence:
+        return self._stage("flat_map", fun)
+
+    def map_indexed(self, fun: Callable[[int, T], Any]) -> Sequence:
+        return self._stage("map_indexed", fun)
+
+    def map_not_none(self, fun: Callable[[T], Any]) -> Sequence:
+        return self._stage("map_not_none", fun)
+
+    def windowed(self, size: int, step: int = 1, partial: bool = False) -> Sequence:
+        """
+        Windows as zero copy views when the source is a list or a buffer and nothing runs before them,
+        as tuples otherwise
+        """
+        windows = Windows(self._source, size, step, partial)
+        if not self._stages:
+            return Sequence(windows)
+        return self._stage("windowed", (size, step, partial))
+
+    def chunked(self, size: int) -> Sequence:
+        return self.windowed(size, size, partial=True)
+
+    def batched(self, size: int) -> Sequence:
+        """
+        Chunks copied into tuples, which stay valid when the source changes
+        """
+        if size < 1:
+            raise ValueError(f"Batch size must be positive, not {size}")
+        return self._stage("batched", size)
+
+    def zip_with_next(self, fun: Callable[[T, T], Any] = None) -> Sequence:
+        return self._stage("zip_with_next", fun)
+
+    def pairwise(self) -> Sequence:
+        return self.zip_with_next()
+
+    # Terminal operations =============================================
+
+    def to_list(self) -> "List":
+        from tython.src.main.data_structures.list import List
+        return List(self)
+
+    def to_set(self) -> "Set":
+        from tython.src.main.data_structures.set import Set
+        return Set(self)
+
+    def to_dict(self) -> "Dict":
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(self)
+
+    def fold(self, fun: Callable, initial_value=None) -> Any:
+        if initial_value is None:
+            return reduce(self.eval(fun), self)
+        return reduce(self.eval(fun), self, initial_value)
+
+    def first(self, fun: Callable[[T], bool] = None) -> T:
+        if fun is not None:
+            return next(filter(self.eval(fun), self), None)
+        return next(iter(self), None)
+
+    def count(self, fun: Callable[[T], bool] = None) -> int:
+        if fun is not None:
+            return sum(1 for _ in filter(self.eval(fun), self))
+        return sum(1 for _ in self)
+
+
+def _map_not_none(fun: Callable, iterator: Iterator) -> Iterator:
+    for item in iterator:
+        if item is not None:
+            result = fun(item)
+            if result is not None:
+                yield result
+
+
+_STAGES = {
+    "map": map,
+    "filter": filter,
+    "filter_none": lambda _, iterator: (item for item in iterator if item is not None),
+    "flat_map": lambda fun, iterator: chain.from_iterable(map(fun, iterator)),
+    "map_indexed": lambda fun, iterator: starmap(fun, enumerate(iterator)),
+    "map_not_none": _map_not_none,
+    "windowed": lambda arguments, iterator: windowed(iterator, *arguments),
+    "batched": lambda size, iterator: batched(iterator, size),
+    "zip_with_next": lambda fun, iterator: zip_with_next(iterator, fun),
+}
+
+
+def sequence_of(*args: T) -> Sequence:
+    return Sequence(args)
+
+
+def sequence_from(iterable: Iterable[T]) -> Sequence:
+    return Sequence(iterable)
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import heapq
+from collections.abc import Set as AbstractSet
 from functools import reduce
-from itertools import chain
+from itertools import chain, filterfalse
 from typing import Any, TYPE_CHECKING, TypeVar, Callable, Type, Iterable
 
-from tython.src.main.data_structures.placeholder import Placeholder
+from tython.src.main.data_structures import kernels
+from tython.src.main.data_structures.memo import MemoCache
+from tython.src.main.data_structures.placeholder import Placeholder, compile_placeholder
+from tython.src.main.data_structures.windows import zip_with_next
 
 if TYPE_CHECKING:
+    from tython.src.main.data_structures.sorting import SortedList
+    from tython.src.main.data_structures.grouping import Grouping
+    from tython.src.main.data_structures.persistent_set import PersistentSet
+    from tython.src.main.data_structures.sequence import Sequence
     from tython.src.main.data_structures.dict import Dict
     from tython.src.main.data_structures.list import List
 
@@ -17,10 +26,15 @@ class Set(set):
     set_type: T = Any
 
     def __hash__(self):
-        return str(self).__hash__()
+        # Same order independent hash as frozenset, so equal sets hash alike. Use freeze() to cache it
+        return frozenset.__hash__(frozenset(self))
 
     def __eq__(self, other):
-        return self.all(lambda it: it in other)
+        if isinstance(other, (set, frozenset)):
+            return set.__eq__(self, other)
+        if isinstance(other, AbstractSet):
+            return len(self) == len(other) and all(map(other.__contains__, self))
+        return NotImplemented
 
     def __add__(self, other):
         return Set(set(self).union(other))
@@ -28,10 +42,13 @@ class Set(set):
     def __sub__(self, other):
         return Set(set(self).difference(other))
 
+    # Set.add returns a new Set, this is set's own in place add
+    add_element = set.add
+
     @staticmethod
     def eval(fun) -> Callable:
         if isinstance(fun, Placeholder):
-            return fun.eval
+            return compile_placeholder(fun)
         return fun
 
     # Base functions =============================================
@@ -39,7 +56,13 @@ class Set(set):
     def zip(self, other: Set) -> Set:
         return Set(zip(self, other))
 
-    def map(self, fun: Callable[[T], Any]) -> Set:
+    def map(self, fun: Callable[[T], Any], cache: MemoCache = None) -> Set:
+        """
+        With a MemoCache shared across calls, results are cached per element and function.
+        Elements are unique within one call, so only a shared cache can be hit.
+        """
+        if cache is not None:
+            return Set(map(cache.memoized(self.eval(fun)), self))
         return Set(map(self.eval(fun), self))
 
     def filter(self, fun: Callable[[T], Any]) -> Set:
@@ -57,30 +80,25 @@ class Set(set):
         return Set(chain(*self))
 
     def flat_map(self, fun: Callable[[T], Any]) -> Set:
-        return self.map(self.eval(fun)).flatten()
+        return Set(kernels.flatten(map(self.eval(fun), self)))
 
     def nested_map(self, fun: Callable[[T], Any]) -> Set:
         return self.map(lambda it: it.map(self.eval(fun)))
 
     def map_indexed(self, fun: Callable[[int, T], Any]) -> Set:
-        return Set(map(lambda it: self.eval(fun)(it[0], it[1]), enumerate(self)))
+        return Set(kernels.map_indexed(self.eval(fun), self))
 
     def all(self, fun: Callable[[T], Any]) -> bool:
-        return all(self.map(self.eval(fun)))
+        return all(map(self.eval(fun), self))
 
     def none(self, fun: Callable[[T], Any]) -> bool:
-        return not any(self.map(self.eval(fun)))
+        return not any(map(self.eval(fun), self))
 
     def any(self, fun: Callable[[T], Any]) -> bool:
-        return any(self.map(self.eval(fun)))
+        return any(map(self.eval(fun), self))
 
     def first(self, fun: Callable[[T], bool] = None) -> T:
-        try:
-            if fun:
-                return next(filter(self.eval(fun), self), Set())
-            return next(iter(self), Set())
-        except StopIteration:
-            return Set()
+        return kernels.first(self, self.eval(fun), Set())
 
     def last(self, fun: Callable[[T], bool] = None) -> T:
         return self.first(self.eval(fun))
@@ -95,113 +113,204 @@ class Set(set):
         return Set(filter(lambda it: it != element, self))
 
     def remove_all(self, elements) -> Set:
-        return Set(filter(lambda it: it not in elements, self))
+        return Set(filterfalse(kernels.membership(elements), self))
+
+    def retain_all(self, elements) -> Set:
+        return Set(filter(kernels.membership(elements), self))
 
     def length(self) -> int:
         return len(self)
 
+    def freeze(self) -> FrozenSet[T]:
+        return FrozenSet(self)
+
+    def to_persistent(self) -> "PersistentSet":
+        from tython.src.main.data_structures.persistent_set import PersistentSet
+        return PersistentSet(self)
+
+    def sorted_by(self, fun: Callable[[T], Any]) -> "SortedList":
+        from tython.src.main.data_structures.sorting import sorted_by
+        return sorted_by(self, ((self.eval(fun), False),))
+
+    def sorted_by_descending(self, fun: Callable[[T], Any]) -> "SortedList":
+        from tython.src.main.data_structures.sorting import sorted_by
+        return sorted_by(self, ((self.eval(fun), True),))
+
+    def top_k(self, k: int, fun: Callable[[T], Any] = None) -> "List":
+        """
+        The k largest elements, largest first, with a heap of k elements: O(n log k)
+        """
+        from tython.src.main.data_structures.list import List
+        return List(heapq.nlargest(k, self, key=self.eval(fun)))
+
+    def bottom_k(self, k: int, fun: Callable[[T], Any] = None) -> "List":
+        from tython.src.main.data_structures.list import List
+        return List(heapq.nsmallest(k, self, key=self.eval(fun)))
+
+    def nth_smallest(self, n: int, fun: Callable[[T], Any] = None) -> T:
+        from tython.src.main.data_structures.sorting import nth_smallest
+        return nth_smallest(self, n, self.eval(fun))
+
+    def sorted_sequence(self, fun: Callable[[T], Any] = None, descending: bool = False) -> "Sequence":
+        """
+        Lazy Sequence of the elements in sorted order, only ordering as many as are consumed
+        """
+        from tython.src.main.data_structures.sequence import Sequence
+        from tython.src.main.data_structures.sorting import HeapSorted
+        return Sequence(HeapSorted(self, self.eval(fun), descending))
+
+    def as_sequence(self) -> "Sequence":
+        from tython.src.main.data_structures.sequence import Sequence
+        return Sequence(self)
+
+    lazy = as_sequence
+
+    def windowed(self, size: int, step: int = 1, partial: bool = False) -> "Sequence":
+        """
+        Lazy Sequence of the windows of size elements every step elements, as tuples in iteration order
+        """
+        return self.as_sequence().windowed(size, step, partial)
+
+    def chunked(self, size: int) -> "Sequence":
+        return self.as_sequence().chunked(size)
+
+    def batched(self, size: int) -> "Sequence":
+        return self.as_sequence().batched(size)
+
+    def zip_with_next(self, fun: Callable[[T, T], Any] = None) -> "List":
+        from tython.src.main.data_structures.list import List
+        return List(zip_with_next(self, self.eval(fun)))
+
+    def pairwise(self) -> "List":
+        return self.zip_with_next()
+
     # Composite funs ========================================
 
     def map_to_dict(self, fun: Callable[[T], Any]) -> "Dict":
         from tython.src.main.data_structures.dict import Dict
-        return Dict(self.map(self.eval(fun)))
+        return Dict(map(self.eval(fun), self))
 
     def map_to_list(self, fun: Callable[[T], Any]) -> "List":
         from tython.src.main.data_structures.list import List
-        return List(self.map(self.eval(fun)))
+        return List(map(self.eval(fun), self))
 
     def map_not_none(self, fun: Callable[[T], Any]) -> Set:
-        return self.filter_none().map(self.eval(fun)).filter_none()
+        return Set(kernels.map_not_none(self.eval(fun), self))
 
     def map_not_none_to_dict(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.map_not_none(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.map_not_none(self.eval(fun), self))
 
     def map_not_none_to_list(self, fun: Callable[[T], Any]) -> "List":
-        return self.map_not_none(self.eval(fun)).map_to_list(lambda it: it)
+        from tython.src.main.data_structures.list import List
+        return List(kernels.map_not_none(self.eval(fun), self))
 
     def map_not_none_indexed(self, fun: Callable[[int, T], Any]) -> Set:
-        filtered_indexed = Set(enumerate(self)).filter(lambda it: it[1] is not None)
-        return filtered_indexed.map(lambda value: self.eval(fun)(value[0], value[1])).filter_none()
+        return Set(kernels.map_not_none_indexed(self.eval(fun), self))
 
     def map_not_none_indexed_to_dict(self, fun: Callable[[int, T], Any]) -> "Dict":
-        return self.map_not_none_indexed(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.map_not_none_indexed(self.eval(fun), self))
 
     def map_not_none_indexed_to_list(self, fun: Callable[[int, T], Any]) -> "List":
-        return self.map_not_none_indexed(self.eval(fun)).map_to_list(lambda it: it)
+        from tython.src.main.data_structures.list import List
+        return List(kernels.map_not_none_indexed(self.eval(fun), self))
 
     def map_indexed_to_dict(self, fun: Callable[[int, T], Any]) -> "Dict":
-        return self.map_indexed(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.map_indexed(self.eval(fun), self))
 
     def map_indexed_to_list(self, fun: Callable[[int, T], Any]) -> "List":
-        return self.map_indexed(self.eval(fun)).map_to_list(lambda it: it)
+        from tython.src.main.data_structures.list import List
+        return List(kernels.map_indexed(self.eval(fun), self))
 
     def flat_map_not_none(self, fun: Callable[[T], Any]) -> Set:
-        return self.map_not_none(self.eval(fun)).flatten()
+        return Set(kernels.flatten(kernels.map_not_none(self.eval(fun), self)))
 
     def flat_map_not_none_to_dict(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.flat_map_not_none(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.flatten(kernels.map_not_none(self.eval(fun), self)))
 
     def flat_map_not_none_to_list(self, fun: Callable[[T], Any]) -> "List":
-        return self.flat_map_not_none(self.eval(fun)).map_to_list(lambda it: it)
+        from tython.src.main.data_structures.list import List
+        return List(kernels.flatten(kernels.map_not_none(self.eval(fun), self)))
 
     def flat_map_indexed(self, fun: Callable[[int, T], Any]) -> Set:
-        return self.map_indexed(self.eval(fun)).flatten()
+        return Set(kernels.flatten(kernels.map_indexed(self.eval(fun), self)))
 
     def flat_map_not_none_indexed(self, fun: Callable[[int, T], Any]) -> Set:
-        return self.map_not_none_indexed(self.eval(fun)).flatten()
+        return Set(kernels.flatten(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def flat_map_not_none_indexed_to_dict(self, fun: Callable[[int, T], Any]) -> "Dict":
-        return self.flat_map_not_none_indexed(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.flatten(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def flat_map_not_none_indexed_to_list(self, fun: Callable[[int, T], Any]) -> "List":
-        return self.flat_map_not_none_indexed(self.eval(fun)).map_to_list(lambda it: it)
+        from tython.src.main.data_structures.list import List
+        return List(kernels.flatten(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def nested_map_not_none(self, fun: Callable[[T], Any]) -> Set:
-        return self.map_not_none(self.eval(fun)).nested_map(lambda it: it)
+        return Set(kernels.nested(kernels.map_not_none(self.eval(fun), self)))
 
     def nested_map_not_none_to_dict(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.nested_map_not_none(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.nested(kernels.map_not_none(self.eval(fun), self)))
 
     def nested_map_not_none_to_list(self, fun: Callable[[T], Any]) -> "List":
-        return self.nested_map_not_none(self.eval(fun)).map_to_list(lambda it: it)
+        from tython.src.main.data_structures.list import List
+        return List(kernels.nested(kernels.map_not_none(self.eval(fun), self)))
 
     def nested_map_indexed(self, fun: Callable[[int, T], Any]) -> Set:
-        return self.map_indexed(self.eval(fun)).nested_map(lambda it: it)
+        return Set(kernels.nested(kernels.map_indexed(self.eval(fun), self)))
 
     def nested_map_not_none_indexed(self, fun: Callable[[int, T], Any]) -> Set:
-        return self.map_not_none_indexed(self.eval(fun)).nested_map(lambda it: it)
+        return Set(kernels.nested(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def nested_map_not_none_indexed_to_dict(self, fun: Callable[[int, T], Any]) -> "Dict":
-        return self.nested_map_not_none_indexed(self.eval(fun)).map_to_dict(lambda it: it)
+        from tython.src.main.data_structures.dict import Dict
+        return Dict(kernels.nested(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def nested_map_not_none_indexed_to_list(self, fun: Callable[[int, T], Any]) -> "List":
-        return self.nested_map_not_none_indexed(self.eval(fun)).map_to_list(lambda it: it)
+        from tython.src.main.data_structures.list import List
+        return List(kernels.nested(kernels.map_not_none_indexed(self.eval(fun), self)))
 
     def first_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().first(self.eval(fun))
+        return kernels.first(kernels.not_none(self), self.eval(fun), Set())
 
     def last_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().last(self.eval(fun))
+        return self.first_not_none(fun)
 
     def first_indexed(self, fun: Callable[[int, T], Any] = None):
-        return self.map_indexed(self.eval(fun)).first()
+        if not self:
+            return Set()
+        value = next(iter(self))
+        return value if fun is None else self.eval(fun)(0, value)
 
     def last_indexed(self, fun: Callable[[int, T], Any] = None):
-        return self.map_indexed(self.eval(fun)).last()
+        return self.first_indexed(fun)
 
     def first_indexed_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().first_indexed(self.eval(fun))
+        value = kernels.first(kernels.not_none(self))
+        if value is None:
+            return Set()
+        return value if fun is None else self.eval(fun)(0, value)
 
     def last_indexed_not_none(self, fun: Callable[[T], Any] = None):
-        return self.filter_none().last_indexed(self.eval(fun))
+        return self.first_indexed_not_none(fun)
 
     # Specific funs ========================================
 
     def group_by(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.map_to_dict(lambda it: (self.eval(fun)(it), it))
+        from tython.src.main.data_structures.dict import Dict
+        return kernels.grouped(Dict(), kernels.keyed(self.eval(fun), self), Set, Set.add_element)
 
     def group_by_not_none(self, fun: Callable[[T], Any]) -> "Dict":
-        return self.map_not_none_to_dict(lambda it: (self.eval(fun)(it), it))
+        from tython.src.main.data_structures.dict import Dict
+        return kernels.grouped(Dict(), kernels.keyed_not_none(self.eval(fun), self), Set, Set.add_element)
+
+    def grouping_by(self, fun: Callable[[T], Any]) -> "Grouping":
+        from tython.src.main.data_structures.grouping import Grouping
+        return Grouping(self, self.eval(fun))
 
     def associate(self, fun: Callable[[T], Any]) -> "Dict":
         return self.map_to_dict(self.eval(fun))
@@ -250,6 +359,56 @@ class Set(set):
         return self.__repr__()
 
 
+class FrozenSet(frozenset):
+    """
+    Immutable, hashable Set, for sets of sets and dict keys.
+    frozenset computes its order independent hash once and caches it, and compares in C, length first.
+    add, remove and their bulk versions return new FrozenSets, the rest of Set's functional API works on a Set.
+    """
+    __slots__ = ()
+
+    def add(self, element) -> FrozenSet:
+        return self if element in self else FrozenSet(chain(self, (element,)))
+
+    def add_all(self, elements) -> FrozenSet:
+        return FrozenSet(self.union(elements))
+
+    def remove(self, element) -> FrozenSet:
+        return FrozenSet(self.difference((element,))) if element in self else self
+
+    def remove_all(self, elements) -> FrozenSet:
+        return FrozenSet(self.difference(elements))
+
+    def length(self) -> int:
+        return len(self)
+
+    def to_set(self) -> Set[T]:
+        return Set(self)
+
+    def __add__(self, other) -> FrozenSet:
+        return self.add_all(other)
+
+    def __sub__(self, other) -> FrozenSet:
+        return self.remove_all(other)
+
+    def __repr__(self):
+        return f"FrozenSet({set(self)})"
+
+    def __getattr__(self, name: str) -> Any:
+        # The rest of the functional API, map, filter, fold, group_by..., runs over a Set of the elements
+        if name not in FUNCTIONAL_API:
+            raise AttributeError(f"'FrozenSet' object has no attribute '{name}'")
+        return getattr(Set(self), name)
+
+
+# Set's non-mutating API, which immutable sets delegate to a Set of their elements.
+# Every method Set defines returns a new value but add_element; set's own in place methods, update, discard...,
+# are left out
+FUNCTIONAL_API = (frozenset(name for name in vars(Set) if not name.startswith("_")) - {"add_element"}
+                  | {"copy", "difference", "intersection", "isdisjoint", "issubset", "issuperset",
+                     "symmetric_difference", "union"})
+
+
 # Instantiation
 
 def set_of(*args: T) -> Set[T]:
@@ -258,3 +417,7 @@ def set_of(*args: T) -> Set[T]:
 
 def set_from(iterable: Iterable[T]) -> Set[T]:
     return Set(iterable)
+
+
+def frozen_set_of(*args: T) -> FrozenSet[T]:
+    return FrozenSet(args)
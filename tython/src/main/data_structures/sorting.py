@@ -0,0 +1,111 @@
+"""
+Sorting and ranking without sorting more than needed:
+heaps for the k first elements and for lazy ordered iteration, quickselect for a single rank.
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from tython.src.main.data_structures.list import List
+
+Order = tuple[Callable, bool]
+
+
+class SortedList(List):
+    """
+    List sorted by one or more keys, from the most significant to the least, refined by then_by.
+    """
+
+    def __init__(self, values: Iterable = (), orders: tuple[Order, ...] = ()):
+        super().__init__(values)
+        self.orders = orders
+
+    def then_by(self, fun: Callable[[Any], Any]) -> SortedList:
+        return sorted_by(self, self.orders + ((self.eval(fun), False),))
+
+    def then_by_descending(self, fun: Callable[[Any], Any]) -> SortedList:
+        return sorted_by(self, self.orders + ((self.eval(fun), True),))
+
+
+def sorted_by(values: Iterable, orders: tuple[Order, ...]) -> SortedList:
+    """
+    Stable sorts from the least significant key to the most, each one keeping the order of the previous on ties
+    """
+    result = SortedList(values, orders)
+    for fun, descending in reversed(orders):
+        result.sort(key=fun, reverse=descending)
+    return result
+
+
+def nth_smallest(values: Iterable, n: int, fun: Optional[Callable] = None) -> Any:
+    """
+    Element at index n of the values sorted by fun, by quickselect: O(len(values)) on average
+    """
+    values = list(values)
+    if not -len(values) <= n < len(values):
+        raise IndexError("nth_smallest index out of range")
+    n %= len(values)
+    if fun is None:
+        return _select(values, n)
+    # Keys decorated with their position, so ties resolve like a stable sort and elements are never compared
+    return values[_select([(fun(value), index) for index, value in enumerate(values)], n)[1]]
+
+
+class HeapSorted:
+    """
+    Values in sorted order, heapified in O(n) and popped one at a time, so taking the first k costs O(n + k log n)
+    """
+
+    def __init__(self, values: Iterable, fun: Optional[Callable] = None, descending: bool = False):
+        self._values = values
+        self._fun = fun
+        self._descending = descending
+
+    def __iter__(self) -> Iterator:
+        values = list(self._values)
+        fun = self._fun if self._fun is not None else _identity
+        if self._descending:
+            heap = [(_Descending(fun(value)), index) for index, value in enumerate(values)]
+        else:
+            heap = [(fun(value), index) for index, value in enumerate(values)]
+        heapq.heapify(heap)
+        while heap:
+            yield values[heapq.heappop(heap)[1]]
+
+
+class _Descending:
+    """
+    Key wrapper reversing the order of any comparable key
+    """
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other: _Descending) -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other: _Descending) -> bool:
+        return self.key == other.key
+
+
+def _select(values: list, n: int) -> Any:
+    while True:
+        pivot = random.choice(values)
+        lower = [value for value in values if value < pivot]
+        if n < len(lower):
+            values = lower
+            continue
+        higher = [value for value in values if pivot < value]
+        equal = len(values) - len(lower) - len(higher)
+        if n < len(lower) + equal:
+            return pivot
+        n -= len(lower) + equal
+        values = higher
+
+
+def _identity(value):
+    return value
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from array import array
+from functools import reduce
+from itertools import compress
+from typing import Any, Callable, Iterable, Iterator, Optional, Type, TypeVar
+
+from tython.src.main.data_structures.list import List
+from tython.src.main.data_structures.placeholder import Placeholder, compile_placeholder
+from tython.src.main.data_structures.sequence import Sequence
+from tython.src.main.data_structures.vectorized import MIN_VECTORIZED_LENGTH, numpy, vectorized_eval, \
+    vectorized_sum
+
+T = TypeVar("T")
+
+# 8 bytes per int or float and 1 per bool, against a pointer plus a boxed object per element in a list
+TYPECODES = {int: "q", float: "d", bool: "b"}
+
+
+class TypedList:
+    """
+    Compact List of ints, floats or bools stored unboxed in an array.array, built with List.of_type(..., compact=True).
+    Reductions run over a zero copy NumPy view of the array when NumPy is installed and the list is long enough.
+    map returns a regular List, as the function may change the element type, while filter keeps the compact storage.
+    """
+
+    def __init__(self, values: Iterable = (), list_type: Type[T] = int):
+        if list_type not in TYPECODES:
+            raise TypeError(f"TypedList only stores {list(TYPECODES)}, not {list_type}")
+        self.list_type = list_type
+        self.buffer = array(TYPECODES[list_type], values)
+
+    @staticmethod
+    def eval(fun) -> Callable:
+        if isinstance(fun, Placeholder):
+            return compile_placeholder(fun)
+        return fun
+
+    def map(self, fun: Callable[[T], Any]) -> List:
+        vectorized = self._vectorized(fun)
+        if vectorized is not None:
+            return List(vectorized.tolist())
+        return List(map(self.eval(fun), self))
+
+    def filter(self, fun: Callable[[T], Any]) -> TypedList:
+        vectorized = self._vectorized(fun)
+        if vectorized is not None:
+            return self._copy(self._view()[vectorized.astype(bool)])
+        return self._copy(compress(self.buffer, map(self.eval(fun), self)))
+
+    def fold(self, fun: Callable, initial_value=None) -> Any:
+        if initial_value is None:
+            return reduce(self.eval(fun), self)
+        return reduce(self.eval(fun), self, initial_value)
+
+    def sum(self, fun: Callable[[T], Any] = None) -> Any:
+        vectorized = self._vectorized(fun)
+        if vectorized is not None and vectorized.dtype.kind != "f":
+            return vectorized_sum(vectorized)
+        if fun is None:
+            return sum(self.buffer)
+        return sum(vectorized.tolist() if vectorized is not None else map(self.eval(fun), self))
+
+    def min(self, fun: Callable[[T], Any] = None) -> Any:
+        return self._extreme(fun, "min", min)
+
+    def max(self, fun: Callable[[T], Any] = None) -> Any:
+        return self._extreme(fun, "max", max)
+
+    def average(self, fun: Callable[[T], Any] = None) -> float:
+        if not self:
+            raise ValueError("average() arg is an empty sequence")
+        return self.sum(fun) / len(self)
+
+    def length(self) -> int:
+        return len(self)
+
+    def windowed(self, size: int, step: int = 1, partial: bool = False) -> Sequence:
+        """
+        Lazy Sequence of windows as memoryview slices of the array, holding raw values (0 and 1 for bools)
+        """
+        return Sequence(self.buffer).windowed(size, step, partial)
+
+    def chunked(self, size: int) -> Sequence:
+        return self.windowed(size, size, partial=True)
+
+    def to_list(self) -> List[T]:
+        return List(self).of_type(self.list_type, check=False)
+
+    def _extreme(self, fun: Optional[Callable], name: str, builtin: Callable) -> Any:
+        vectorized = self._vectorized(fun)
+        if vectorized is not None:
+            result = getattr(vectorized, name)().item()
+            # NumPy propagates NaN, while Python's result depends on where it appears, so those run per element
+            if result == result:
+                return bool(result) if fun is None and self.list_type is bool else result
+        return builtin(self if fun is None else map(self.eval(fun), self))
+
+    def _vectorized(self, fun: Optional[Callable]) -> Optional["numpy.ndarray"]:
+        view = self._view()
+        if view is None or fun is None:
+            return view
+        return vectorized_eval(fun, view, self.list_type)
+
+    def _view(self) -> Optional["numpy.ndarray"]:
+        if numpy is None or len(self.buffer) < MIN_VECTORIZED_LENGTH:
+            return None
+        return numpy.frombuffer(self.buffer, dtype=self.buffer.typecode)
+
+    def _copy(self, values) -> TypedList:
+        typed = TypedList((), self.list_type)
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            typed.buffer.frombytes(values.tobytes())
+        else:
+            typed.buffer.extend(values)
+        return typed
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def __iter__(self) -> Iterator[T]:
+        if self.list_type is bool:
+            return map(bool, self.buffer)
+        return iter(self.buffer)
+
+    def __reversed__(self) -> Iterator[T]:
+        if self.list_type is bool:
+            return map(bool, reversed(self.buffer))
+        return reversed(self.buffer)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._copy(self.buffer[index])
+        value = self.buffer[index]
+        return bool(value) if self.list_type is bool else value
+
+    def __contains__(self, value) -> bool:
+        return value in self.buffer
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TypedList):
+            return self.list_type is other.list_type and self.buffer == other.buffer
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"TypedList[{self.list_type.__name__}]({list(self)})"
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import operator
+from typing import Any, Iterable, Optional
+
+from tython.src.main.data_structures.placeholder import Placeholder
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MIN_VECTORIZED_LENGTH = 256
+
+_DTYPES = {int: "int64", float: "float64"}
+# Integers beyond this magnitude may lose precision in float64 or overflow int64, so those chains run per element
+_EXACT_INTEGER_BOUND = 2 ** 53
+
+_BINARY_OPERATIONS = {
+    "add": operator.add, "sub": operator.sub, "mul": operator.mul, "truediv": operator.truediv,
+    "floordiv": operator.floordiv, "mod": operator.mod,
+    "lt": operator.lt, "le": operator.le, "eq": operator.eq, "ne": operator.ne, "gt": operator.gt, "ge": operator.ge,
+}
+_REFLECTED_OPERATIONS = {
+    "radd": operator.add, "rsub": operator.sub, "rmul": operator.mul, "rtruediv": operator.truediv,
+    "rfloordiv": operator.floordiv, "rmod": operator.mod,
+}
+_UNARY_OPERATIONS = {"neg": operator.neg, "pos": operator.pos, "abs": operator.abs, "invert": operator.invert}
+_COMPARISONS = {"lt", "le", "eq", "ne", "gt", "ge"}
+
+
+def vectorized_eval(fun: Any, values: Iterable, value_type: type) -> Optional["numpy.ndarray"]:
+    """
+    Evaluates a pure arithmetic placeholder over all values at once with NumPy, values being any sized iterable
+    or an int64 / float64 array.
+    Returns None whenever the result could differ from evaluating element by element:
+    NumPy is missing, the values are not int or float, the chain has unsupported operations or operands,
+    an integer could leave the exactly representable range, or NumPy flags a division by zero, overflow or NaN.
+    Powers are left out, as NumPy and Python round them differently.
+    """
+    if numpy is None or value_type not in _DTYPES or not isinstance(fun, Placeholder):
+        return None
+    if len(values) < MIN_VECTORIZED_LENGTH:
+        return None
+    operations = fun.operations
+    if not operations or not all(map(_is_supported, operations)):
+        return None
+    if isinstance(values, numpy.ndarray):
+        array = values
+    else:
+        try:
+            array = numpy.fromiter(values, dtype=_DTYPES[value_type], count=len(values))
+        except (OverflowError, TypeError, ValueError):
+            return None
+    bound = max(-int(array.min()), int(array.max())) if value_type is int else 0
+    # Checked before the first operation too: a float operand or a comparison turns the ints to float64
+    # without leaving an int64 result to check afterwards
+    if bound >= _EXACT_INTEGER_BOUND:
+        return None
+    with numpy.errstate(divide="raise", over="raise", invalid="raise"):
+        try:
+            for operation in operations:
+                if array.dtype == bool and operation.operation not in _COMPARISONS:
+                    array = array.astype("int64")
+                    bound = 1
+                array = _apply(operation.operation, array, operation.value)
+                bound = _next_bound(operation.operation, bound, operation.value)
+                if array.dtype.kind == "i" and bound >= _EXACT_INTEGER_BOUND:
+                    return None
+        except (FloatingPointError, ZeroDivisionError, TypeError):
+            return None
+    return array
+
+
+def vectorized_sum(array: "numpy.ndarray"):
+    if array.dtype.kind == "f":
+        # Python's sum keeps the same rounding as the per element path, NumPy's pairwise sum does not
+        return sum(array.tolist())
+    if len(array) == 0:
+        return 0
+    if len(array) * max(-int(array.min()), int(array.max())) >= _EXACT_INTEGER_BOUND:
+        return sum(array.tolist())
+    return int(array.sum())
+
+
+def _is_supported(operation) -> bool:
+    name = operation.operation
+    if name in _UNARY_OPERATIONS:
+        return True
+    if name not in _BINARY_OPERATIONS and name not in _REFLECTED_OPERATIONS:
+        return False
+    operand = operation.value
+    if type(operand) not in (int, float, bool):
+        return False
+    return type(operand) is float or abs(operand) < _EXACT_INTEGER_BOUND
+
+
+def _apply(name: str, array, operand):
+    if name in _UNARY_OPERATIONS:
+        return _UNARY_OPERATIONS[name](array)
+    if name in _REFLECTED_OPERATIONS:
+        return _REFLECTED_OPERATIONS[name](operand, array)
+    return _BINARY_OPERATIONS[name](array, operand)
+
+
+def _next_bound(name: str, bound: int, operand) -> int:
+    magnitude = abs(operand) if operand is not None else 0
+    if name in {"add", "sub", "radd", "rsub"}:
+        return bound + magnitude
+    if name in {"mul", "rmul"}:
+        return bound * magnitude
+    if name in {"mod", "rfloordiv"}:
+        return max(magnitude, 1)
+    if name == "invert":
+        return bound + 1
+    return bound
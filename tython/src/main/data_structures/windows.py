@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Sequence as AbstractSequence
+from itertools import islice, pairwise, starmap
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from tython.src.main.data_structures.list import List
+
+# Storages whose windows are memoryview slices of the same buffer
+_BUFFERS = (array, bytes, bytearray, memoryview)
+
+
+class ListView(AbstractSequence):
+    """
+    Read only window over the [start, stop) index range of a list, sharing its storage instead of copying it.
+    It reflects later changes to the list, use to_list() to keep a copy.
+    """
+
+    __slots__ = ("source", "start", "stop")
+
+    def __init__(self, source: list, start: int, stop: int):
+        self.source = source
+        self.start = start
+        self.stop = stop
+
+    def to_list(self) -> "List":
+        from tython.src.main.data_structures.list import List
+        return List(self.source[self.start:self.stop])
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        indices = range(self.start, self.stop)[index]
+        if isinstance(index, slice):
+            if indices.step == 1:
+                return ListView(self.source, indices.start, indices.stop)
+            return list(map(self.source.__getitem__, indices))
+        return self.source[indices]
+
+    def __iter__(self) -> Iterator:
+        return map(self.source.__getitem__, range(self.start, self.stop))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AbstractSequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(map(_same, self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ListView({list(self)})"
+
+
+class Windows:
+    """
+    Re-iterable windows of size elements every step elements, built lazily.
+    Lists and buffers yield zero copy views, any other iterable yields tuples from a single pass.
+    """
+
+    def __init__(self, values: Iterable, size: int, step: int = 1, partial: bool = False):
+        if size < 1 or step < 1:
+            raise ValueError(f"Window size and step must be positive, not {size} and {step}")
+        self.values = values
+        self.size = size
+        self.step = step
+        self.partial = partial
+
+    def __iter__(self) -> Iterator:
+        if isinstance(self.values, list):
+            return _indexed_windows(self.values, ListView, self.size, self.step, self.partial)
+        if isinstance(self.values, _BUFFERS):
+            return _indexed_windows(memoryview(self.values), _buffer_view, self.size, self.step, self.partial)
+        return windowed(self.values, self.size, self.step, self.partial)
+
+
+def windowed(iterable: Iterable, size: int, step: int = 1, partial: bool = False) -> Iterator[tuple]:
+    """
+    Windows of an iterable as tuples, holding at most size elements at a time
+    """
+    iterator = iter(iterable)
+    window = deque(islice(iterator, size))
+    while window:
+        if len(window) < size and not partial:
+            return
+        yield tuple(window)
+        if step >= len(window):
+            skipped = step - len(window)
+            window.clear()
+            next(islice(iterator, skipped, skipped), None)
+        else:
+            for _ in range(step):
+                window.popleft()
+        window.extend(islice(iterator, size - len(window)))
+
+
+def chunked(iterable: Iterable, size: int) -> Windows:
+    return Windows(iterable, size, size, partial=True)
+
+
+def batched(iterable: Iterable, size: int) -> Iterator[tuple]:
+    if size < 1:
+        raise ValueError(f"Batch size must be positive, not {size}")
+    iterator = iter(iterable)
+    return iter(lambda: tuple(islice(iterator, size)), ())
+
+
+def zip_with_next(iterable: Iterable, fun: Callable = None) -> Iterator:
+    if fun is None:
+        return pairwise(iterable)
+    return starmap(fun, pairwise(iterable))
+
+
+def _indexed_windows(values, view: Callable, size: int, step: int, partial: bool) -> Iterator:
+    length = len(values)
+    last_start = length if partial else length - size + 1
+    return (view(values, start, min(start + size, length)) for start in range(0, max(last_start, 0), step))
+
+
+def _buffer_view(buffer: memoryview, start: int, stop: int) -> memoryview:
+    return buffer[start:stop]
+
+
+def _same(left, right) -> bool:
+    return left is right or left == right
+
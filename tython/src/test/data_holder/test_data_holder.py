@@ -0,0 +1,128 @@
+import json
+import unittest
+from typing import NamedTuple
+
+from tython.src.main.data_holder.abstract_key import AbstractKey
+from tython.src.main.data_holder.data_holder import DataHolder, COPY_ON_READ
+from tython.src.main.data_structures.dict import FrozenDict
+from tython.src.main.data_structures.freezing import thaw
+from tython.src.main.data_structures.persistent_list import PersistentList
+
+
+class Point(NamedTuple):
+    x: int
+    tags: list
+
+
+class Box:
+    def __init__(self, items: list):
+        self.items = items
+
+
+@AbstractKey.delegate
+class Keys:
+    NAMES: list
+    CONFIG: dict
+    COUNT: int
+    PORTS: dict[str, list[int]]
+    POINT: Point
+    BOX: Box
+
+
+class CopyingHolder(DataHolder):
+    copy_mode = COPY_ON_READ
+
+
+class TestDataHolder(unittest.TestCase):
+
+    def test_freeze_on_write(self):
+        names = ["a", "b"]
+        holder = DataHolder()
+        holder[Keys.NAMES] = names
+        names.append("c")
+        frozen = holder[Keys.NAMES]
+        self.assertIsInstance(frozen, PersistentList)
+        self.assertEqual(["a", "b"], frozen.to_list())
+        self.assertIs(frozen, holder.get(Keys.NAMES))
+
+    def test_nested_values_are_frozen(self):
+        holder = DataHolder()
+        holder.offer((Keys.CONFIG, {"hosts": ["x"], "ports": {80}}), (Keys.COUNT, 3))
+        config = holder[Keys.CONFIG]
+        self.assertIsInstance(config, FrozenDict)
+        self.assertIsInstance(config["hosts"], PersistentList)
+        self.assertEqual({80}, config["ports"])
+        self.assertEqual(3, holder.get(Keys.COUNT))
+        self.assertIsNone(holder.get("missing"))
+
+    def test_read_write_round_trip(self):
+        holder = DataHolder()
+        holder.offer((Keys.NAMES, ["a"]), (Keys.CONFIG, {"hosts": ["x"]}), (Keys.PORTS, {"http": [80]}))
+        holder[Keys.NAMES] = holder[Keys.NAMES]
+        holder.offer((Keys.CONFIG, holder[Keys.CONFIG]), (Keys.PORTS, holder[Keys.PORTS]))
+        copy = DataHolder()
+        copy[Keys.PORTS] = holder[Keys.PORTS]
+        self.assertEqual(["a"], holder[Keys.NAMES].to_list())
+        self.assertEqual([80], copy[Keys.PORTS]["http"].to_list())
+
+    def test_dict_order_is_kept(self):
+        holder = DataHolder()
+        keys = [f"key{index}" for index in range(50)]
+        holder[Keys.CONFIG] = dict.fromkeys(reversed(keys), 0)
+        self.assertEqual(keys[::-1], list(holder[Keys.CONFIG]))
+
+    def test_thaw_for_json(self):
+        holder = DataHolder()
+        holder[Keys.CONFIG] = {"limits": {"cpu": 2}, "hosts": ["x"]}
+        self.assertEqual('{"limits": {"cpu": 2}, "hosts": ["x"]}', json.dumps(thaw(holder[Keys.CONFIG])))
+
+    def test_frozen_values_reject_mutators(self):
+        holder = DataHolder()
+        holder.offer((Keys.NAMES, ["a"]), (Keys.CONFIG, {"a": 1}))
+        self.assertRaises(AttributeError, lambda: holder[Keys.NAMES].append("b"))
+        self.assertRaises(AttributeError, lambda: holder[Keys.CONFIG].update(b=2))
+        self.assertEqual({"a": 1}, holder[Keys.CONFIG])
+
+    def test_named_tuples_are_frozen(self):
+        holder = DataHolder()
+        point = Point(1, ["a"])
+        holder[Keys.POINT] = point
+        point.tags.append("b")
+        self.assertIsInstance(holder[Keys.POINT], Point)
+        self.assertIsInstance(holder[Keys.POINT].tags, PersistentList)
+        self.assertEqual(["a"], holder[Keys.POINT].tags.to_list())
+
+    def test_unknown_types_are_copied_on_read(self):
+        holder = DataHolder()
+        holder.offer((Keys.BOX, Box(["a"])), (Keys.NAMES, [Box(["b"])]))
+        holder[Keys.BOX].items.append("b")
+        holder[Keys.NAMES][0].items.append("c")
+        self.assertEqual(["a"], holder[Keys.BOX].items)
+        self.assertEqual(["b"], holder[Keys.NAMES][0].items)
+        self.assertIsNot(holder[Keys.BOX], holder[Keys.BOX])
+
+    def test_copy_on_read(self):
+        holder = CopyingHolder()
+        holder[Keys.NAMES] = ["a"]
+        names = holder[Keys.NAMES]
+        names.append("b")
+        self.assertEqual(["a"], holder[Keys.NAMES])
+        self.assertIsNot(holder.get(Keys.NAMES), holder.get(Keys.NAMES))
+
+    def test_type_check(self):
+        with self.assertRaises(TypeError):
+            DataHolder()[Keys.COUNT] = "3"
+        with self.assertRaises(KeyError):
+            DataHolder()["UNDECLARED"] = 3
+
+    def test_offer_validates_the_whole_batch_first(self):
+        holder = DataHolder()
+        with self.assertRaises(TypeError):
+            holder.offer((Keys.COUNT, 1), (Keys.NAMES, "not a list"))
+        self.assertIsNone(holder.get(Keys.COUNT))
+        holder.offer(Keys.COUNT, 2)
+        self.assertEqual(2, holder[Keys.COUNT])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from typing import Any, Iterable, Iterator, Literal, Optional, Union
+
+from tython.src.main.data_holder.abstract_key import AbstractKey
+from tython.src.main.data_holder.data_holder import DataHolder
+from tython.src.main.data_holder.validators import compile_validator, type_name
+from tython.src.main.data_structures.list import list_of
+from tython.src.main.nullable.nullable import Nullable
+
+
+@AbstractKey.delegate
+class ValidatedKeys:
+    SCORES: list[int]
+    LABEL: Optional[str]
+    WEIGHT: "float"
+
+
+class TestValidators(unittest.TestCase):
+
+    def assertValidates(self, annotation, accepted: list, rejected: list):
+        validator = compile_validator(annotation)
+        for value in accepted:
+            self.assertTrue(validator(value), f"{annotation} rejected {value!r}")
+        for value in rejected:
+            self.assertFalse(validator(value), f"{annotation} accepted {value!r}")
+
+    def test_classes_accept_subclasses(self):
+        self.assertValidates(list, [[], list_of(1)], [(), "a"])
+        self.assertValidates(int, [1, True], [1.0, "1"])
+
+    def test_optional_and_union(self):
+        self.assertValidates(Optional[int], [1, None], ["1"])
+        self.assertValidates(Union[int, list[str]], [1, ["a"]], [[1], None])
+        self.assertValidates(int | str, [1, "a"], [None])
+        self.assertValidates(Literal["a", "b"], ["a"], ["c"])
+
+    def test_generics(self):
+        self.assertValidates(list[int], [[1, 2], list_of(3), []], [[1, "2"], (1,)])
+        self.assertValidates(dict[str, list[int]], [{"a": [1]}], [{"a": ["1"]}, {1: [1]}])
+        self.assertValidates(tuple[int, str], [(1, "a")], [(1, 2), (1,)])
+        self.assertValidates(tuple[int, ...], [(1, 2, 3), ()], [(1, "2")])
+        self.assertValidates(set[Any], [{1, "a"}], [[1]])
+
+    def test_iterators_are_not_consumed(self):
+        values = iter([1, 2])
+        self.assertTrue(compile_validator(Iterator[int])(values))
+        self.assertEqual([1, 2], list(values))
+        generator = (number for number in range(3))
+        self.assertTrue(compile_validator(Iterable[int])(generator))
+        self.assertEqual([0, 1, 2], list(generator))
+
+    def test_nullable(self):
+        self.assertValidates(Nullable[str], ["a", None, Nullable(str)], [1])
+
+    def test_type_name(self):
+        self.assertEqual("int", type_name(int))
+        self.assertEqual("Optional[int]", type_name(Optional[int]))
+
+    def test_declared_keys(self):
+        holder = DataHolder()
+        holder.offer((ValidatedKeys.SCORES, [1, 2]), (ValidatedKeys.LABEL, None), (ValidatedKeys.WEIGHT, 0.5))
+        with self.assertRaisesRegex(TypeError, r"SCORES must be of type list\[int\] not list"):
+            holder[ValidatedKeys.SCORES] = ["1"]
+        with self.assertRaises(TypeError):
+            holder[ValidatedKeys.WEIGHT] = 1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+
+from tython.src.main.data_structures.asynchronous import gather_bounded
+from tython.src.main.data_structures.dict import dict_of
+from tython.src.main.data_structures.list import List, list_of
+
+
+async def double(value):
+    # Later elements finish first, so results only line up if order is restored
+    await asyncio.sleep(0.001 * (5 - value))
+    return value * 2
+
+
+async def is_even(value):
+    await asyncio.sleep(0)
+    return value % 2 == 0
+
+
+async def pair(value):
+    await asyncio.sleep(0)
+    return [value, value]
+
+
+class TestAsynchronous(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.small_list = list_of(1, 2, 3, 4, 5)
+
+    async def test_amap(self):
+        self.assertEqual(list_of(2, 4, 6, 8, 10), await self.small_list.amap(double))
+        self.assertEqual(list_of(2, 4, 6, 8, 10), await self.small_list.amap(double, concurrency=2))
+        self.assertIsInstance(await self.small_list.amap(double), List)
+
+    async def test_afilter(self):
+        self.assertEqual(list_of(2, 4), await self.small_list.afilter(is_even, concurrency=1))
+
+    async def test_aflat_map(self):
+        self.assertEqual(list_of(1, 1, 2, 2), await list_of(1, 2).aflat_map(pair))
+
+    async def test_amap_values(self):
+        async def describe(key, value):
+            await asyncio.sleep(0)
+            return f"{key}={value}"
+
+        self.assertEqual({"a": "a=1", "b": "b=2"}, await dict_of(a=1, b=2).amap_values(describe))
+
+    async def test_empty(self):
+        self.assertEqual(List(), await List().amap(double))
+
+    async def test_concurrency_is_bounded(self):
+        running = 0
+        peak = 0
+
+        async def track(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return value
+
+        self.assertEqual(List(range(20)), await List(range(20)).amap(track, concurrency=3))
+        self.assertEqual(3, peak)
+
+    async def test_timeout(self):
+        async def slow(value):
+            await asyncio.sleep(1)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.small_list.amap(slow, timeout=0.01)
+
+    async def test_failure_cancels_pending(self):
+        cancelled = []
+
+        async def fail_on_one(value):
+            if value == 1:
+                raise KeyError(value)
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(value)
+                raise
+
+        with self.assertRaises(KeyError):
+            await self.small_list.amap(fail_on_one)
+        self.assertEqual([2, 3, 4, 5], sorted(cancelled))
+
+    async def test_caller_cancellation(self):
+        started = asyncio.Event()
+
+        async def wait(value):
+            started.set()
+            await asyncio.sleep(1)
+
+        task = asyncio.ensure_future(self.small_list.amap(wait))
+        await started.wait()
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    async def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            await gather_bounded(double, [(1,)], concurrency=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
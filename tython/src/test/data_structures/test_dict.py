@@ -1,6 +1,22 @@
 import unittest
 
-from tython.src.main.data_structures.dict import dict_of, dict_from
+from tython.src.main.data_structures.dict import Dict, FrozenDict, dict_of, dict_from
+
+
+class ReversedOnlyItems:
+    def __init__(self, values: dict):
+        self.values = values
+
+    def __iter__(self):
+        raise AssertionError("items were iterated from the start")
+
+    def __reversed__(self):
+        return reversed(dict.items(self.values))
+
+
+class ReversedOnlyDict(Dict):
+    def items(self):
+        return ReversedOnlyItems(self)
 
 
 class TestDict(unittest.TestCase):
@@ -12,6 +28,82 @@ class TestDict(unittest.TestCase):
         self.assertEqual(map_a, map_b)
         self.assertEqual(map_a, map_c)
 
+    def test_group_by(self):
+        values = dict_of(a=1, b=2, c=3, d=None)
+        self.assertEqual({1: {"a": 1, "c": 3}, 0: {"b": 2}, None: {"d": None}},
+                         values.group_by(lambda key, value: value % 2 if value is not None else None))
+        self.assertEqual({"odd": {"a": 1, "c": 3}, "even": {"b": 2}},
+                         values.group_by_not_none(lambda key, value: "odd" if value % 2 else "even"))
+
+    def test_short_circuit(self):
+        calls = []
+
+        def predicate(key, value):
+            calls.append(key)
+            return value > 1
+
+        values = dict_of(a=1, b=2, c=3)
+        self.assertTrue(values.any(predicate))
+        self.assertEqual(["a", "b"], calls)
+        calls.clear()
+        self.assertEqual(("c", 3), values.last(predicate))
+        self.assertEqual(["c"], calls)
+        calls.clear()
+        self.assertEqual(("b", 2), values.first(predicate))
+        self.assertEqual(["a", "b"], calls)
+
+    def test_first_and_last(self):
+        values = dict_from({"a": None, "b": 2, "c": 3, "d": None})
+        self.assertEqual(("a", None), values.first())
+        self.assertEqual(("d", None), values.last())
+        self.assertEqual(("b", 2), values.first_not_none())
+        self.assertEqual(("c", 3), values.last_not_none())
+        self.assertEqual(dict_of(), dict_of().last())
+
+    def test_last_does_not_scan(self):
+        values = ReversedOnlyDict({key: key for key in range(100)})
+        self.assertEqual((99, 99), values.last())
+        tested = []
+        self.assertEqual((97, 97), values.last(lambda key, value: tested.append(key) or key < 98))
+        self.assertEqual([99, 98, 97], tested)
+
+    def test_frozen_dict(self):
+        frozen = dict_of(b=1, a=2).freeze()
+        self.assertIsInstance(frozen, FrozenDict)
+        self.assertEqual(["b", "a"], list(frozen))
+        self.assertEqual({"a": 2, "b": 1}, frozen)
+        self.assertEqual(FrozenDict(b=1, a=2, c=3), frozen.put("c", 3))
+        self.assertEqual({"b": 1}, frozen - ["a"])
+        self.assertIs(frozen, frozen.remove("z"))
+        self.assertEqual({"b": 1, "a": 2}, frozen)
+        self.assertEqual({"b": 2, "a": 4}, frozen.map_values(lambda key, value: value * 2))
+        self.assertEqual(("a", 2), frozen.last())
+        for name in ("update", "setdefault", "pop", "clear"):
+            self.assertRaises(AttributeError, getattr, frozen, name)
+
+    def test_reverse(self):
+        self.assertEqual([("b", 2), ("a", 1)], list(dict_of(a=1, b=2).reverse().items()))
+
+    def test_map_indexed(self):
+        values = dict_of(a=1, b=2)
+        self.assertEqual({"a0": 1, "b1": 2}, values.map_indexed(lambda index, key, value: (key + str(index), value)))
+        self.assertEqual({"a": 0, "b": 2}, values.map_indexed_values(lambda index, key, value: index * value))
+        self.assertEqual({0: 1, 1: 2}, values.map_indexed_keys(lambda index, key, value: index))
+
+    def test_flatten_and_flat_map(self):
+        self.assertEqual({"x": 1, "y": 2, "z": 3}, dict_of(a={"x": 1}, b=[("y", 2), ("z", 3)]).flatten())
+        values = dict_of(a=1, b=2)
+        self.assertEqual({"a": 1, "A": 1, "b": 2, "B": 2},
+                         values.flat_map(lambda key, value: {key: value, key.upper(): value}))
+        self.assertEqual({"a": 0, "b": 1}, values.flat_map_indexed(lambda index, key, value: {key: index}))
+
+    def test_indexed_terminals(self):
+        values = dict_from({"a": None, "b": 2, "c": 3, "d": None})
+        self.assertEqual((0, "a"), values.first_indexed(lambda index, key, value: (index, key)))
+        self.assertEqual((3, "d"), values.last_indexed(lambda index, key, value: (index, key)))
+        self.assertEqual((0, "b"), values.first_indexed_not_none(lambda index, key, value: (index, key)))
+        self.assertEqual((1, "c"), values.last_indexed_not_none(lambda index, key, value: (index, key)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from collections import Counter
+from collections.abc import Mapping
+
+from tython.src.main.data_structures.dict import Dict, dict_of
+
+
+class TestDictView(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = Counter()
+        self.prices = dict_of(apple=3, banana=1, cherry=5)
+
+    def doubled(self, key, value):
+        self.calls[key] += 1
+        return value * 2
+
+    def test_view(self):
+        view = self.prices.view()
+        self.assertIsInstance(view, Mapping)
+        self.assertEqual(self.prices, view)
+        self.prices["date"] = 7
+        self.assertEqual(7, view["date"])
+
+    def test_mapped_values_on_access(self):
+        view = self.prices.view().mapped_values(self.doubled)
+        self.assertEqual(6, view["apple"])
+        self.assertEqual(Counter(apple=1), self.calls)
+        self.assertIn("banana", view)
+        self.assertIsNone(view.get("fig"))
+        self.assertEqual(Counter(apple=1), self.calls)
+        self.assertEqual(3, len(view))
+
+    def test_mapped_values_cache(self):
+        view = self.prices.view().mapped_values(self.doubled, cache=True)
+        view["apple"]
+        view["apple"]
+        self.assertEqual(1, self.calls["apple"])
+
+    def test_mapped_keys(self):
+        view = self.prices.view().mapped_keys(lambda key, value: key.upper())
+        self.assertEqual(["APPLE", "BANANA", "CHERRY"], list(view))
+        self.assertEqual(1, view["BANANA"])
+        self.assertNotIn("banana", view)
+
+    def test_filtered(self):
+        view = self.prices.view().filtered(lambda key, value: value > 2)
+        self.assertEqual(3, view["apple"])
+        with self.assertRaises(KeyError):
+            view["banana"]
+        self.assertNotIn("banana", view)
+        self.assertEqual(["apple", "cherry"], list(view))
+        self.assertEqual(2, len(view))
+
+    def test_with_defaults(self):
+        view = self.prices.view().with_defaults({"banana": 0, "fig": 2})
+        self.assertEqual(1, view["banana"])
+        self.assertEqual(2, view["fig"])
+        self.assertEqual(["apple", "banana", "cherry", "fig"], list(view))
+        self.assertEqual(4, len(view))
+        with self.assertRaises(KeyError):
+            view["grape"]
+
+    def test_stacked(self):
+        view = self.prices.view().filtered(lambda key, value: value > 2).mapped_values(lambda key, value: value * 10)
+        self.assertEqual({"apple": 30, "cherry": 50}, view)
+        materialized = view.to_dict()
+        self.assertIsInstance(materialized, Dict)
+        self.assertEqual({"apple": 30, "cherry": 50}, materialized)
+
+    def test_mapped_keys_over_filtered(self):
+        view = self.prices.view().filtered(lambda key, value: value > 2).mapped_keys(lambda key, value: key[0])
+        self.assertEqual({"a": 3, "c": 5}, view)
+
+
+if __name__ == '__main__':
+    unittest.main()
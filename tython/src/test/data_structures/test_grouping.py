@@ -0,0 +1,69 @@
+import unittest
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.dict import dict_of
+from tython.src.main.data_structures.list import List, list_of
+from tython.src.main.data_structures.set import set_of
+
+
+class TestGrouping(unittest.TestCase):
+
+    def setUp(self):
+        self.integer_list = list_of(1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+        self.words = list_of("apple", "avocado", "banana", "blueberry", "cherry", "apricot")
+
+    def test_count(self):
+        self.assertEqual({1: 4, 2: 3, 0: 3}, self.integer_list.grouping_by(it % 3).count())
+        self.assertEqual({"a": 3, "b": 2, "c": 1}, self.words.grouping_by(it[0]).count())
+
+    def test_sum(self):
+        self.assertEqual({1: 22, 2: 15, 0: 18}, self.integer_list.grouping_by(it % 3).sum())
+        self.assertEqual({1: 44, 2: 30, 0: 36}, self.integer_list.grouping_by(it % 3).sum(it * 2))
+
+    def test_min_and_max(self):
+        grouping = self.words.grouping_by(it[0])
+        self.assertEqual({"a": 5, "b": 6, "c": 6}, grouping.min(len))
+        self.assertEqual({"a": "avocado", "b": "blueberry", "c": "cherry"}, grouping.max())
+
+    def test_average(self):
+        self.assertEqual({0: 6.0, 1: 5.0}, self.integer_list.grouping_by(lambda it: it % 2).average())
+
+    def test_fold(self):
+        grouping = self.integer_list.grouping_by(it % 2)
+        self.assertEqual({1: 25, 0: 30}, grouping.fold(lambda acc, it: acc + it))
+        self.assertEqual({1: 125, 0: 130}, grouping.fold(lambda acc, it: acc + it, 100))
+        collected = grouping.fold(lambda acc, it: acc + [it], [])
+        self.assertEqual({1: [1, 3, 5, 7, 9], 0: [2, 4, 6, 8, 10]}, collected)
+
+    def test_top_k(self):
+        grouping = self.integer_list.grouping_by(it % 3)
+        self.assertEqual({1: [10, 7], 2: [8, 5], 0: [9, 6]}, grouping.top_k(2))
+        self.assertEqual({1: [1], 2: [2], 0: [3]}, grouping.top_k(1, -it))
+        self.assertIsInstance(grouping.top_k(2)[1], List)
+        ties = self.words.grouping_by(it[0]).top_k(2, len)
+        self.assertEqual(["avocado", "apricot"], ties["a"])
+
+    def test_set(self):
+        self.assertEqual({1: 4, 0: 3, 2: 3}, set_of(*range(1, 11)).grouping_by(it % 3).count())
+
+    def test_dict(self):
+        prices = dict_of(apple=3, avocado=5, banana=1)
+        grouping = prices.grouping_by(lambda key, value: key[0])
+        self.assertEqual({"a": 8, "b": 1}, grouping.sum())
+        self.assertEqual({"a": 16, "b": 2}, grouping.sum(it * 2))
+        self.assertEqual({"a": [5], "b": [1]}, grouping.top_k(1))
+        self.assertEqual({"a": 2, "b": 1}, grouping.count())
+
+    def test_single_pass(self):
+        consumed = []
+
+        def key(value):
+            consumed.append(value)
+            return value % 2
+
+        self.integer_list.grouping_by(key).sum()
+        self.assertEqual(list(self.integer_list), consumed)
+
+
+if __name__ == '__main__':
+    unittest.main()
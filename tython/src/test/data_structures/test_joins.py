@@ -0,0 +1,90 @@
+import unittest
+from collections import Counter
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.dict import dict_of
+from tython.src.main.data_structures.list import List, list_of
+
+
+def nested_join(left, right, key, how):
+    pairs = [(left_row, right_row) for left_row in left for right_row in right if key(left_row) == key(right_row)]
+    if how in ("left", "outer"):
+        pairs += [(left_row, None) for left_row in left if all(key(left_row) != key(row) for row in right)]
+    if how == "outer":
+        pairs += [(None, right_row) for right_row in right if all(key(right_row) != key(row) for row in left)]
+    return Counter(pairs)
+
+
+class TestJoins(unittest.TestCase):
+
+    def setUp(self):
+        self.orders = list_of(("o1", "alice"), ("o2", "bob"), ("o3", "alice"), ("o4", "dave"))
+        self.customers = list_of(("alice", "Paris"), ("bob", "Rome"), ("carol", "Oslo"))
+
+    def test_join(self):
+        joined = self.orders.join(self.customers, it[1], it[0])
+        self.assertEqual(Counter([(("o1", "alice"), ("alice", "Paris")), (("o2", "bob"), ("bob", "Rome")),
+                                  (("o3", "alice"), ("alice", "Paris"))]), Counter(joined))
+        self.assertIsInstance(joined, List)
+
+    def test_join_types(self):
+        key = lambda it: it % 5
+        for left, right in ((List(range(3, 12)), List(range(0, 30, 3))), (List(range(0, 30, 3)), List(range(3, 12)))):
+            for how in ("inner", "left", "outer"):
+                self.assertEqual(nested_join(left, right, key, how), Counter(left.join(right, key, how=how)))
+
+    def test_join_keeps_left_order(self):
+        right = list_of(("b", 1), ("a", 2), ("b", 3), ("c", 4))
+        expected = [(("a", 0), ("a", 2)), (("b", 0), ("b", 1)), (("b", 0), ("b", 3)), (("z", 0), None),
+                    (None, ("c", 4))]
+        for left in (list_of(("a", 0), ("b", 0), ("z", 0)), list_of(("a", 0), ("b", 0), ("z", 0), *[("y", 0)] * 5)):
+            joined = left.join(right, it[0], how="outer")
+            self.assertEqual(expected, [pair for pair in joined if pair[0] is None or pair[0][0] != "y"])
+
+    def test_left_join(self):
+        joined = self.orders.join(self.customers, it[1], it[0], how="left")
+        self.assertIn((("o4", "dave"), None), joined)
+        self.assertEqual(4, len(joined))
+
+    def test_outer_join(self):
+        joined = self.orders.join(self.customers, it[1], it[0], how="outer")
+        self.assertIn((None, ("carol", "Oslo")), joined)
+        self.assertIn((("o4", "dave"), None), joined)
+        self.assertEqual(5, len(joined))
+
+    def test_unknown_join_type(self):
+        self.assertRaises(ValueError, lambda: self.orders.join(self.customers, it[1], it[0], how="cross"))
+
+    def test_cogroup(self):
+        grouped = self.orders.cogroup(self.customers, it[1], it[0])
+        self.assertEqual(([("o1", "alice"), ("o3", "alice")], [("alice", "Paris")]), grouped["alice"])
+        self.assertEqual(([], [("carol", "Oslo")]), grouped["carol"])
+        self.assertEqual(([("o4", "dave")], []), grouped["dave"])
+        self.assertEqual(["alice", "bob", "dave", "carol"], list(grouped))
+
+    def test_semi_and_anti_join(self):
+        for customers in (self.customers, self.customers + [("x", "y")] * 10):
+            self.assertEqual(list_of(("o1", "alice"), ("o2", "bob"), ("o3", "alice")),
+                             self.orders.semi_join(List(customers), it[1], it[0]))
+            self.assertEqual(list_of(("o4", "dave")), self.orders.anti_join(List(customers), it[1], it[0]))
+        self.assertEqual(list_of(2, 4), list_of(1, 2, 3, 4).semi_join(list_of(4, 2, 6), it))
+        self.assertEqual(list_of(1, 3), list_of(1, 2, 3, 4).anti_join(list_of(4, 2, 6), it))
+
+    def test_dict_join(self):
+        prices = dict_of(apple=3, banana=1, cherry=5)
+        stock = dict_of(banana=10, cherry=0, durian=2)
+        self.assertEqual({"banana": (1, 10), "cherry": (5, 0)}, prices.join(stock))
+        self.assertEqual({"apple": (3, None), "banana": (1, 10), "cherry": (5, 0)}, prices.join(stock, how="left"))
+        self.assertEqual({"apple": (3, None), "banana": (1, 10), "cherry": (5, 0), "durian": (None, 2)},
+                         prices.join(stock, how="outer"))
+        self.assertRaises(ValueError, lambda: prices.join(stock, how="right"))
+
+    def test_dict_join_keeps_left_order(self):
+        left = dict_of(d=1, c=2, b=3, a=4)
+        right = dict_of(a=10, c=20)
+        self.assertEqual(["c", "a"], list(left.join(right)))
+        self.assertEqual(["a", "c"], list(right.join(left)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from collections import Counter
+from contextlib import contextmanager, ExitStack
+from unittest.mock import patch
+
+from tython.src.main.data_structures.dict import Dict, dict_from
+from tython.src.main.data_structures.list import List, list_of
+from tython.src.main.data_structures.set import Set, set_of
+
+LIST_COMPOSITES = [
+    "map_to_dict", "map_to_set", "map_not_none", "map_not_none_to_dict", "map_not_none_to_set",
+    "map_not_none_indexed", "map_not_none_indexed_to_dict", "map_not_none_indexed_to_set",
+    "map_indexed_to_dict", "map_indexed_to_set", "flat_map_not_none", "flat_map_not_none_to_dict",
+    "flat_map_not_none_to_set", "flat_map_indexed", "flat_map_not_none_indexed", "flat_map_not_none_indexed_to_dict",
+    "flat_map_not_none_indexed_to_set", "nested_map_not_none", "nested_map_not_none_to_dict",
+    "nested_map_not_none_to_set", "nested_map_indexed", "nested_map_not_none_indexed",
+    "nested_map_not_none_indexed_to_dict", "nested_map_not_none_indexed_to_set",
+]
+DICT_COMPOSITES = [
+    "map_not_none", "map_not_none_values", "map_not_none_keys", "map_not_none_indexed", "map_not_none_indexed_values",
+    "map_not_none_indexed_keys", "flat_map_not_none", "flat_map_not_none_values", "flat_map_not_none_keys",
+    "flat_map_indexed", "flat_map_indexed_values", "flat_map_indexed_keys", "flat_map_not_none_indexed",
+    "nested_map_not_none", "nested_map_indexed", "nested_map_not_none_indexed",
+]
+
+
+@contextmanager
+def count_containers():
+    counter = Counter()
+
+    def counting_init(base):
+        def __init__(self, *args, **kwargs):
+            counter[type(self)] += 1
+            base.__init__(self, *args, **kwargs)
+
+        return __init__
+
+    with ExitStack() as stack:
+        for container, base in ((List, list), (Set, set), (Dict, dict)):
+            stack.enter_context(patch.object(container, "__init__", counting_init(base)))
+        yield counter
+
+
+class TestKernels(unittest.TestCase):
+
+    def setUp(self):
+        self.list_with_none = list_of(1, 2, 3, None, 4, 5, 6, None, 8, 9, None)
+        self.set_with_none = set_of(1, 2, 3, None, 4, 5, 6, None, 8, 9, None)
+        self.dict_with_none = dict_from({"a": 1, "b": None, "c": 3})
+
+    @staticmethod
+    def pairs_fun(name):
+        if "flat" in name:
+            return (lambda index, value: ((index, value),)) if "indexed" in name else (lambda it: ((it, it),))
+        return (lambda index, value: (index, value)) if "indexed" in name else (lambda it: (it, it))
+
+    def assertSingleAllocation(self, container, name, fun):
+        with count_containers() as counter:
+            getattr(container, name)(fun)
+        self.assertEqual(1, sum(counter.values()), f"{type(container).__name__}.{name} allocated {dict(counter)}")
+
+    def test_list_composites_allocate_only_their_output(self):
+        for name in LIST_COMPOSITES:
+            fun = self.pairs_fun(name)
+            self.assertSingleAllocation(self.list_with_none, name, fun)
+
+    def test_set_composites_allocate_only_their_output(self):
+        for name in LIST_COMPOSITES:
+            name = name.replace("_to_set", "_to_list")
+            fun = self.pairs_fun(name)
+            self.assertSingleAllocation(self.set_with_none, name, fun)
+
+    def test_dict_composites_allocate_only_their_output(self):
+        for name in DICT_COMPOSITES:
+            if "flat" in name:
+                fun = (lambda index, key, value: [(key, index)]) if "indexed" in name else (lambda key, value: [(key, value)])
+            elif "values" in name or "keys" in name:
+                fun = (lambda index, key, value: index) if "indexed" in name else (lambda key, value: key)
+            else:
+                fun = (lambda index, key, value: (key, index)) if "indexed" in name else (lambda key, value: (key, value))
+            self.assertSingleAllocation(self.dict_with_none, name, fun)
+
+    def test_dict_composites(self):
+        self.assertEqual({"a": 2, "c": 6}, self.dict_with_none.map_not_none_values(lambda key, value: value * 2))
+        self.assertEqual({"aa": 1, "cc": 3}, self.dict_with_none.map_not_none_keys(lambda key, value: key * 2))
+        self.assertEqual({"a": 0, "c": 2}, self.dict_with_none.map_not_none_indexed_values(lambda index, key, value: index))
+        self.assertEqual({"a": 1, "A": 1, "c": 3, "C": 3},
+                         self.dict_with_none.flat_map_not_none(lambda key, value: [(key, value), (key.upper(), value)]))
+        self.assertEqual({"a": 0, "b": 1, "c": 2}, self.dict_with_none.flat_map_indexed(lambda index, key, value: [(key, index)]))
+
+    def test_nested_copies(self):
+        inner = list_of(1, 2)
+        nested = list_of(inner).nested_map_not_none(lambda it: it)
+        self.assertEqual(list_of(list_of(1, 2)), nested)
+        self.assertIsNot(inner, nested[0])
+        self.assertIsInstance(nested[0], List)
+
+
+if __name__ == '__main__':
+    unittest.main()
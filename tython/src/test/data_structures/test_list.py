@@ -1,7 +1,9 @@
 import unittest
 from functools import reduce
 
+from tython.src.main.data_structures.constants import it
 from tython.src.main.data_structures.list import list_of, list_from
+from tython.src.main.data_structures.set import set_of
 
 
 # noinspection DuplicatedCode
@@ -89,6 +91,57 @@ class TestList(unittest.TestCase):
         self.assertTrue(self.small_list.any(lambda it: it > 4))
         self.assertFalse(self.small_list.any(lambda it: it > 5))
 
+    def test_short_circuit(self):
+        calls = []
+
+        def predicate(it):
+            calls.append(it)
+            return it > 2
+
+        self.assertTrue(self.integer_list.any(predicate))
+        self.assertEqual([1, 2, 3], calls)
+        calls.clear()
+        self.assertFalse(self.integer_list.all(lambda it: predicate(it) and it < 3))
+        self.assertEqual([1], calls)
+        calls.clear()
+        self.assertFalse(self.integer_list.none(predicate))
+        self.assertEqual([1, 2, 3], calls)
+        calls.clear()
+        self.assertEqual(10, self.integer_list.last(predicate))
+        self.assertEqual([10], calls)
+        calls.clear()
+        self.assertEqual(3, self.integer_list.first(predicate))
+        self.assertEqual([1, 2, 3], calls)
+
+    def test_first_and_last_placeholders(self):
+        self.assertEqual(3, self.small_list.first(it > 2))
+        self.assertEqual(4, self.small_list.last(it < 5))
+
+    def test_indexed_terminals(self):
+        calls = []
+
+        def pair(index, value):
+            calls.append(index)
+            return index, value
+
+        self.assertEqual((0, 1), self.integer_list.first_indexed(pair))
+        self.assertEqual((9, 10), self.integer_list.last_indexed(pair))
+        self.assertEqual([0, 9], calls)
+        self.assertEqual((0, 1), self.list_with_none_edges.first_indexed_not_none(pair))
+        self.assertEqual((7, 9), self.list_with_none_edges.last_indexed_not_none(pair))
+        self.assertEqual(1, self.list_with_none_edges.first_not_none())
+        self.assertEqual(9, self.list_with_none_edges.last_not_none())
+        self.assertEqual(list_of(), list_of().first_indexed(pair))
+
+    def test_reductions(self):
+        self.assertEqual(1, self.small_list.min())
+        self.assertEqual(5, self.small_list.max())
+        self.assertEqual(3, self.small_list.average())
+        self.assertEqual(-5, self.small_list.min(-it))
+        self.assertEqual(10, self.small_list.max(lambda it: it * 2))
+        self.assertEqual(1, list_of(0, 1, 2).average(it * 2 - 1))
+        self.assertRaises(ValueError, lambda: list_of().average())
+
     def test_reverse(self):
         self.assertEqual(list_of(5, 4, 3, 2, 1), self.small_list.reverse())
 
@@ -103,6 +156,34 @@ class TestList(unittest.TestCase):
 
     def test_remove_all(self):
         self.assertEqual(list_of(6, 7, 8, 9, 10), self.integer_list.remove_all(self.small_list))
+        self.assertEqual(list_of(1, 1, 3), list_of(1, 2, 1, 3).remove_all([2]))
+        self.assertEqual(list_of([1], 3), list_of([1], [2], 3).remove_all([[2], 4]))
+
+    def test_retain_all(self):
+        self.assertEqual(list_of(2, 2, 4), list_of(1, 2, 2, 3, 4).retain_all(range(2, 5, 2)))
+        self.assertEqual(list_of([2]), list_of([1], [2], 3).retain_all(list_of([2])))
+
+    def test_distinct(self):
+        self.assertEqual(list_of(3, 1, 2), list_of(3, 1, 3, 2, 1).distinct())
+        self.assertEqual(list_of([1], 2, [3]), list_of([1], 2, [1], [3], 2).distinct())
+
+    def test_distinct_by(self):
+        self.assertEqual(list_of("apple", "banana"), list_of("apple", "avocado", "banana").distinct_by(it[0]))
+        self.assertEqual(list_of({"a": [1]}, {"a": [2]}),
+                         list_of({"a": [1]}, {"a": [2]}, {"a": [1]}).distinct_by(lambda value: value["a"]))
+
+    def test_set_algebra(self):
+        left = list_of(4, 1, 2, 1, 3)
+        self.assertEqual(list_of(4, 1, 2, 3, 5), left.union([5, 2]))
+        self.assertEqual(list_of(1, 3), left.intersect(set_of(3, 1, 7)))
+        self.assertEqual(list_of(4, 2), left.subtract(list_of(1, 3)))
+        self.assertEqual(list_of([1]), list_of([1], [2], [1]).intersect([[1]]))
+
+    def test_set_algebra_with_hashable_then_unhashable(self):
+        self.assertEqual(list_of(1, [2], 3, 4), list_of(1, [2], 3).union([4]))
+        self.assertEqual(list_of(1, 2, [3]), list_of(1, 2, [3], 2).intersect([1, 2, [3]]))
+        self.assertEqual(list_of(1, 2, [3], 5), list_of(1, 2, [3], 5).subtract([9]))
+        self.assertEqual(list_of(1, [2]), list_of(1, [2], 1, [2]).distinct())
 
     def test_length(self):
         self.assertEqual(5, self.small_list.length())
@@ -153,6 +234,11 @@ class TestList(unittest.TestCase):
     def test_group_by(self):
         self.assertEqual({1: [1, 4, 7, 10], 2: [2, 5, 8], 0: [3, 6, 9]}, self.integer_list.group_by(lambda it: it % 3))
 
+    def test_group_by_not_none(self):
+        self.assertEqual({True: [1, 3, 5, 9], False: [2, 4, 6, 8]},
+                         self.list_with_none.group_by_not_none(lambda it: it % 2 == 1))
+        self.assertEqual({1: [1]}, list_of(1, 2).group_by_not_none(lambda it: it if it == 1 else None))
+
     def test_associate_by(self):
         self.assertEqual({1: 1, 2: 2, 3: 3, 4: 4, 5: 5}, self.small_list.associate_by(lambda it: it))
 
@@ -0,0 +1,84 @@
+import time
+import unittest
+from collections import Counter
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.dict import dict_of
+from tython.src.main.data_structures.list import list_of
+from tython.src.main.data_structures.memo import MemoCache
+from tython.src.main.data_structures.set import set_of
+
+
+class TestMemo(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = Counter()
+
+    def parse(self, value):
+        self.calls[value] += 1
+        return str(value) + "!"
+
+    def test_map_memoize(self):
+        self.assertEqual(list_of("a!", "b!", "a!", "a!"), list_of("a", "b", "a", "a").map(self.parse, memoize=True))
+        self.assertEqual(Counter(a=1, b=1), self.calls)
+
+    def test_shared_cache(self):
+        cache = MemoCache(max_size=8)
+        list_of(1, 2, 1).map(self.parse, cache=cache)
+        set_of(1, 2, 3).map(self.parse, cache=cache)
+        self.assertEqual(Counter({1: 1, 2: 1, 3: 1}), self.calls)
+        self.assertEqual({"hits": 3, "misses": 3, "evictions": 0, "bypassed": 0, "size": 3, "max_size": 8,
+                          "ttl": None}, cache.stats())
+
+    def test_lru_eviction(self):
+        cache = MemoCache(max_size=2)
+        list_of(1, 2, 1, 3, 2, 1).map(self.parse, cache=cache)
+        self.assertEqual(Counter({1: 2, 2: 2, 3: 1}), self.calls)
+        self.assertEqual(3, cache.evictions)
+        self.assertEqual(2, len(cache))
+
+    def test_ttl(self):
+        cache = MemoCache(ttl=0.01)
+        list_of(1, 1).map(self.parse, cache=cache)
+        time.sleep(0.02)
+        list_of(1).map(self.parse, cache=cache)
+        self.assertEqual(2, self.calls[1])
+        self.assertEqual(1, cache.evictions)
+
+    def test_keyed_by_type(self):
+        self.assertEqual(list_of("1!", "True!", "1.0!"), list_of(1, True, 1.0).map(self.parse, memoize=True))
+
+    def test_unhashable_bypass(self):
+        cache = MemoCache()
+        self.assertEqual(list_of(1, 1, 1), list_of([1], [1], (1,)).map(it.count(1), cache=cache))
+        self.assertEqual(2, cache.bypassed)
+        self.assertEqual(1, len(cache))
+
+    def test_map_values(self):
+        cache = MemoCache()
+        values = dict_of(a=1, b=1)
+        self.assertEqual({"a": "a1", "b": "b1"}, values.map_values(lambda key, value: key + str(value), cache=cache))
+        self.assertEqual({"a": "a1", "b": "b1"}, values.map_values(lambda key, value: key + str(value), cache=cache))
+        self.assertEqual(0, cache.hits)
+        concatenated = lambda key, value: key + str(value)
+        values.map_values(concatenated, cache=cache)
+        self.assertEqual({"a": "a1", "b": "b1"}, values.map_values(concatenated, cache=cache))
+        self.assertEqual(2, cache.hits)
+
+    def test_keyed_by_function(self):
+        cache = MemoCache()
+        self.assertEqual(list_of(2, 2), list_of(1, 1).map(lambda value: value + 1, cache=cache))
+        self.assertEqual(list_of(10), list_of(1).map(lambda value: value * 10, cache=cache))
+        self.assertEqual(set_of(-1), set_of(1).map(lambda value: -value, cache=cache))
+        self.assertEqual(1, cache.hits)
+
+    def test_tuple_items_keyed_by_type(self):
+        self.assertEqual(list_of("(1,)!", "(True,)!"), list_of((1,), (True,)).map(self.parse, memoize=True))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            MemoCache(max_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
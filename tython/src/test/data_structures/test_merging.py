@@ -0,0 +1,48 @@
+import unittest
+from operator import add
+
+from tython.src.main.data_structures.dict import Dict, dict_of
+from tython.src.main.data_structures.merging import merge_all, merge_into
+
+
+class TestMerging(unittest.TestCase):
+
+    def setUp(self):
+        self.shards = [{"a": 1, "b": 2}, {"b": 3, "c": 4}, {"a": 5}]
+
+    def test_merge_all(self):
+        merged = merge_all(self.shards, add)
+        self.assertIsInstance(merged, Dict)
+        self.assertEqual({"a": 6, "b": 5, "c": 4}, merged)
+        self.assertEqual({"a": 1, "b": 2}, self.shards[0])
+
+    def test_last_value_wins(self):
+        self.assertEqual({"a": 5, "b": 3, "c": 4}, merge_all(self.shards))
+        self.assertEqual({}, merge_all([]))
+
+    def test_merge_with(self):
+        merged = dict_of(a=1, b=2).merge_with({"b": 3, "c": 4}, {"a": 5}, combine=add)
+        self.assertEqual({"a": 6, "b": 5, "c": 4}, merged)
+        self.assertEqual({"a": [1, 2]}, dict_of(a=[1]).merge_with({"a": [2]}, combine=add))
+
+    def test_merge_into(self):
+        target = {"a": 1}
+        self.assertIs(target, merge_into(target, {"a": 2, "b": 1}, max))
+        self.assertEqual({"a": 2, "b": 1}, target)
+
+    def test_parallel(self):
+        shards = [{key % 7: 1} for key in range(100)]
+        expected = merge_all(shards, add)
+        self.assertEqual(expected, merge_all(shards, add, parallel=True, workers=3))
+        self.assertEqual(expected, merge_all(shards, add, parallel=True, workers=4, backend="thread"))
+        self.assertEqual(list(expected), list(merge_all(shards, add, parallel=True, workers=4, backend="thread")))
+        with self.assertRaises(ValueError):
+            merge_all(shards, add, backend="gpu")
+
+    def test_reduce_by_key(self):
+        pairs = iter([("a", 1), ("b", 2), ("a", 3)])
+        self.assertEqual({"a": 4, "b": 2}, Dict.reduce_by_key(pairs, add))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import operator
+import unittest
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.list import List, list_of
+from tython.src.main.data_structures.parallel import Parallel
+
+
+def square(value):
+    return value * value
+
+
+def is_even(value):
+    return value % 2 == 0
+
+
+def pair(value):
+    return [value, value]
+
+
+def offset(index, value):
+    return index + value
+
+
+class TestParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.values = List(range(1000))
+
+    def test_thread_backend(self):
+        parallel = self.values.parallel(workers=4, backend="thread", chunk_size=64)
+        self.assertEqual(self.values.map(square), parallel.map(square))
+        self.assertEqual(self.values.filter(is_even), parallel.filter(is_even))
+        self.assertEqual(self.values.flat_map(pair), parallel.flat_map(pair))
+        self.assertEqual(self.values.map_indexed(offset), parallel.map_indexed(offset))
+
+    def test_process_backend(self):
+        parallel = self.values.parallel(workers=2, chunk_size=300)
+        self.assertEqual(self.values.map(square), parallel.map(square))
+        self.assertEqual(self.values.map_indexed(offset), parallel.map_indexed(offset))
+        self.assertEqual(sum(self.values), parallel.fold(operator.add, associative=True))
+        self.assertEqual(self.values.map(it * 2), parallel.map(it * 2))
+        self.assertEqual(self.values.filter(it % 3 == 0), parallel.filter(it % 3 == 0))
+
+    def test_placeholder(self):
+        parallel = self.values.parallel(workers=4, backend="thread", chunk_size=100)
+        self.assertEqual(self.values.map(it * 2), parallel.map(it * 2))
+        self.assertEqual(self.values.filter(it > 500), parallel.filter(it > 500))
+
+    def test_fold(self):
+        parallel = self.values.parallel(workers=4, backend="thread", chunk_size=7)
+        self.assertEqual(sum(self.values), parallel.fold(operator.add, associative=True))
+        self.assertEqual(sum(self.values) + 10, parallel.fold(operator.add, 10, associative=True))
+        self.assertEqual(self.values.fold(operator.sub), parallel.fold(operator.sub))
+        self.assertEqual("abc", list_of("a", "b", "c").parallel(chunk_size=1, backend="thread")
+                         .fold(operator.add, associative=True))
+
+    def test_small_list_is_serial(self):
+        parallel = list_of(1, 2, 3).parallel(backend="thread")
+        parallel._executor = lambda: self.fail("Small lists should not start a pool")
+        self.assertEqual(list_of(1, 4, 9), parallel.map(square))
+        self.assertEqual(list_of(2), parallel.filter(is_even))
+        self.assertEqual(list_of(1, 3, 5), parallel.map_indexed(offset))
+        self.assertEqual(6, parallel.fold(operator.add, associative=True))
+
+    def test_empty(self):
+        parallel = List().parallel(backend="thread")
+        self.assertEqual(List(), parallel.map(square))
+        self.assertEqual(List(), parallel.flat_map(pair))
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, lambda: Parallel(self.values, backend="gpu"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+from tython.src.main.data_structures.dict import Dict, dict_of
+from tython.src.main.data_structures.persistent_dict import PersistentDict, TransientDict, persistent_dict_of, \
+    persistent_dict_from
+
+
+class TestPersistentDict(unittest.TestCase):
+
+    def setUp(self):
+        self.small_dict = persistent_dict_of(a=1, b=2)
+
+    def test_put_and_remove(self):
+        self.assertEqual({"a": 1, "b": 2, "c": 3}, self.small_dict.put("c", 3))
+        self.assertEqual({"a": 10, "b": 2}, self.small_dict.put("a", 10))
+        self.assertEqual({"b": 2}, self.small_dict.remove("a"))
+        self.assertEqual({"a": 1, "b": 2}, self.small_dict)
+        self.assertIs(self.small_dict, self.small_dict.put("a", 1))
+        self.assertIs(self.small_dict, self.small_dict.remove("z"))
+
+    def test_access(self):
+        self.assertEqual(1, self.small_dict["a"])
+        self.assertEqual(1, self.small_dict.get("a"))
+        self.assertIsNone(self.small_dict.get("z"))
+        self.assertRaises(KeyError, lambda: self.small_dict["z"])
+        self.assertIn("a", self.small_dict)
+        self.assertEqual(["a", "b"], sorted(self.small_dict))
+        self.assertEqual([1, 2], sorted(self.small_dict.values()))
+        self.assertEqual([("a", 1), ("b", 2)], sorted(self.small_dict.items()))
+
+    def test_large(self):
+        values = persistent_dict_from((key, key * 2) for key in range(20_000))
+        changed = values.put(10, -1).remove(11)
+        self.assertEqual(20_000, len(values))
+        self.assertEqual(20, values[10])
+        self.assertEqual(-1, changed[10])
+        self.assertNotIn(11, changed)
+        self.assertEqual({key: key * 2 for key in range(20_000)}, dict(values.items()))
+
+    def test_keeps_equal_key(self):
+        self.assertIs(True, next(iter(persistent_dict_from({True: "a"}).put(1, "b"))))
+
+    def test_operators(self):
+        self.assertEqual({"a": 1, "b": 3, "c": 4}, self.small_dict + {"b": 3, "c": 4})
+        self.assertEqual({"b": 2}, self.small_dict - ["a"])
+
+    def test_transient(self):
+        transient = self.small_dict.transient()
+        self.assertIsInstance(transient, TransientDict)
+        transient.put("c", 3).remove("a")
+        self.assertEqual(3, transient.get("c"))
+        self.assertEqual({"b": 2, "c": 3}, transient.persistent())
+        self.assertEqual({"a": 1, "b": 2}, self.small_dict)
+        self.assertRaises(RuntimeError, lambda: transient.put("d", 4))
+
+    def test_functional_api(self):
+        self.assertEqual({"a": 2, "b": 4}, self.small_dict.map_values(lambda key, value: value * 2))
+        self.assertIsInstance(self.small_dict.filter(lambda key, value: value > 1), Dict)
+        self.assertEqual(self.small_dict, dict_of(a=1, b=2).to_persistent())
+        self.assertEqual(PersistentDict({"a": 1}, b=2), self.small_dict)
+        self.assertRaises(AttributeError, lambda: self.small_dict.unknown)
+
+    def test_mutators_are_not_delegated(self):
+        for name in ("update", "setdefault", "popitem", "clear", "pop", "fromkeys"):
+            self.assertRaises(AttributeError, getattr, self.small_dict, name)
+        self.assertEqual({"a": 1, "b": 2}, self.small_dict.copy())
+        self.assertEqual(2, self.small_dict.get("b"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.list import List, list_of
+from tython.src.main.data_structures.persistent_list import PersistentList, persistent_list_of, persistent_list_from
+
+
+class TestPersistentList(unittest.TestCase):
+
+    def setUp(self):
+        self.small_list = persistent_list_of(1, 2, 3, 4, 5)
+        # Three trie levels plus a partial tail
+        self.sizes = [0, 1, 31, 32, 33, 1024, 1056, 1057, 33_000]
+
+    def test_add(self):
+        for size in self.sizes:
+            persistent = PersistentList()
+            for value in range(size):
+                persistent = persistent.add(value)
+            self.assertEqual(list(range(size)), list(persistent))
+            self.assertEqual(list(range(size - 1, -1, -1)), list(reversed(persistent)))
+            self.assertEqual(size, len(persistent))
+
+    def test_structural_sharing(self):
+        base = persistent_list_from(range(100))
+        added = base.add(100)
+        changed = base.set(5, -1)
+        self.assertEqual(list(range(100)), list(base))
+        self.assertEqual(-1, changed.get(5))
+        self.assertEqual(5, base.get(5))
+        self.assertIs(base._root, added._root)
+        self.assertIs(base._root[1], changed._root[1])
+
+    def test_get_and_set(self):
+        for size in self.sizes[1:]:
+            persistent = persistent_list_from(range(size))
+            for index in range(0, size, max(1, size // 20)):
+                self.assertEqual(index, persistent[index])
+                expected = list(range(size))
+                expected[index] = -1
+                self.assertEqual(expected, list(persistent.set(index, -1)))
+            self.assertEqual(size - 1, persistent[-1])
+        self.assertRaises(IndexError, lambda: self.small_list.get(5))
+        self.assertRaises(IndexError, lambda: PersistentList().set(0, 1))
+
+    def test_take_and_pop(self):
+        for size in self.sizes:
+            persistent = persistent_list_from(range(size))
+            for count in range(0, size + 1, max(1, size // 20)):
+                taken = persistent.take(count)
+                self.assertEqual(list(range(count)), list(taken))
+                self.assertEqual(list(range(count)) + [-1, -2], list(taken.add(-1).add(-2)))
+        popped = persistent_list_from(range(1057))
+        for _ in range(1057):
+            popped = popped.pop()
+        self.assertEqual(0, len(popped))
+        self.assertRaises(IndexError, popped.pop)
+
+    def test_remove(self):
+        self.assertEqual(list_of(1, 2, 4, 5), self.small_list.remove_at(2))
+        self.assertEqual(list_of(1, 2, 3, 4), self.small_list.remove_at(-1))
+        self.assertEqual(list_of(1, 3), persistent_list_of(1, 2, 3, 2).remove(2))
+        self.assertEqual(list_of(1, 5), self.small_list.remove_all([2, 3, 4]))
+        self.assertIs(self.small_list, self.small_list.remove(6))
+
+    def test_concatenation(self):
+        self.assertEqual(list_of(1, 2, 3, 4, 5, 6, 7), self.small_list + [6, 7])
+        self.assertEqual(list_of(1, 2, 3, 4, 5, 6), self.small_list.add_all(persistent_list_of(6)))
+        self.assertEqual(list(range(2000)), list(persistent_list_from(range(1000)) + range(1000, 2000)))
+
+    def test_slice(self):
+        self.assertEqual(list_of(1, 2, 3), self.small_list[:3])
+        self.assertEqual(list_of(2, 4), self.small_list[1::2])
+        self.assertEqual(list_of(5, 4, 3, 2, 1), self.small_list[::-1])
+        self.assertIsInstance(self.small_list[1:], PersistentList)
+
+    def test_functional_api(self):
+        self.assertEqual(list_of(2, 4, 6, 8, 10), self.small_list.map(it * 2))
+        self.assertEqual(list_of(2, 4), self.small_list.filter(lambda it: it % 2 == 0))
+        self.assertEqual(15, self.small_list.fold(lambda acc, it: acc + it))
+        self.assertEqual(5, self.small_list.last())
+        self.assertEqual(4, self.small_list.last(it < 5))
+        self.assertEqual(1, self.small_list.first())
+        self.assertIsInstance(self.small_list.map(it * 2), List)
+        self.assertRaises(AttributeError, lambda: self.small_list.unknown)
+
+    def test_mutators_are_not_delegated(self):
+        for name in ("append", "extend", "insert", "sort", "clear", "__iadd__"):
+            self.assertRaises(AttributeError, getattr, self.small_list, name)
+        self.assertEqual(2, self.small_list.index(3))
+        self.assertEqual(list_of(1, 2, 3, 4, 5), self.small_list.copy())
+        self.assertEqual(persistent_list_of(1, 2, 4, 5), self.small_list.remove(3))
+
+    def test_equality_and_hash(self):
+        self.assertEqual(persistent_list_of(1, 2), persistent_list_of(1).add(2))
+        self.assertEqual(hash(persistent_list_of(1, 2)), hash(persistent_list_of(1).add(2)))
+        self.assertNotEqual(persistent_list_of(1, 2), persistent_list_of(1, 2, 3))
+        self.assertEqual(self.small_list, list_of(1, 2, 3, 4, 5).to_persistent())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.set import Set, set_of
+from tython.src.main.data_structures.persistent_set import PersistentSet, TransientSet, persistent_set_of, \
+    persistent_set_from
+
+
+class Colliding:
+    """
+    Key whose hash collides with every other one with the same remainder
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return self.value % 3
+
+    def __eq__(self, other):
+        return isinstance(other, Colliding) and other.value == self.value
+
+
+class TestPersistentSet(unittest.TestCase):
+
+    def setUp(self):
+        self.small_set = persistent_set_of(1, 2, 3)
+
+    def test_add_and_remove(self):
+        added = self.small_set.add(4)
+        self.assertEqual({1, 2, 3, 4}, added)
+        self.assertEqual({1, 2, 3}, self.small_set)
+        self.assertEqual({1, 3}, self.small_set.remove(2))
+        self.assertIs(self.small_set, self.small_set.add(1))
+        self.assertIs(self.small_set, self.small_set.remove(5))
+
+    def test_large(self):
+        values = persistent_set_from(range(20_000))
+        evens = values.remove_all(range(1, 20_000, 2))
+        self.assertEqual(20_000, len(values))
+        self.assertEqual(set(range(0, 20_000, 2)), evens)
+        self.assertTrue(all(value in values for value in range(20_000)))
+        self.assertNotIn(20_000, values)
+
+    def test_collisions(self):
+        keys = [Colliding(value) for value in range(30)]
+        colliding = persistent_set_from(keys)
+        self.assertEqual(30, len(colliding))
+        self.assertIn(Colliding(7), colliding)
+        reduced = colliding.remove_all(keys[:29])
+        self.assertEqual([keys[29]], list(reduced))
+        self.assertIn(Colliding(28), colliding)
+
+    def test_operators(self):
+        self.assertEqual({1, 2, 3, 4}, self.small_set + [3, 4])
+        self.assertEqual({1, 2, 3, 4, 5}, self.small_set + persistent_set_of(2, 3, 4, 5))
+        self.assertEqual({1}, self.small_set - [2, 3])
+        self.assertEqual({2, 3}, self.small_set & {2, 3, 4})
+        self.assertTrue(persistent_set_of(1, 2) <= self.small_set)
+
+    def test_transient(self):
+        transient = self.small_set.transient()
+        self.assertIsInstance(transient, TransientSet)
+        transient.add(4).add(5).remove(1)
+        built = transient.persistent()
+        self.assertEqual({2, 3, 4, 5}, built)
+        self.assertEqual({1, 2, 3}, self.small_set)
+        self.assertRaises(RuntimeError, lambda: transient.add(6))
+
+    def test_equality_and_hash(self):
+        self.assertEqual(persistent_set_of(1, 2), {2, 1})
+        self.assertEqual(hash(persistent_set_of(1, 2)), hash(persistent_set_of(2).add(1)))
+        self.assertEqual(self.small_set, set_of(1, 2, 3).to_persistent())
+        self.assertEqual(hash(frozenset(range(1000))), hash(persistent_set_from(range(1000))))
+        self.assertEqual(hash(frozenset({1, 2, 4})), hash(self.small_set.remove(3).add(4).add(4)))
+        self.assertEqual(hash(frozenset()), hash(self.small_set.transient().remove_all([1, 2, 3]).persistent()))
+
+    def test_functional_api(self):
+        self.assertEqual({2, 4, 6}, self.small_set.map(it * 2))
+        self.assertIsInstance(self.small_set.map(it * 2), Set)
+        self.assertEqual(6, self.small_set.fold(lambda acc, it: acc + it))
+        self.assertRaises(AttributeError, lambda: self.small_set.unknown)
+
+    def test_mutators_are_not_delegated(self):
+        for name in ("add_element", "discard", "update", "difference_update", "clear", "pop"):
+            self.assertRaises(AttributeError, getattr, self.small_set, name)
+        self.assertEqual({1, 2, 3, 4}, self.small_set.union({4}))
+        self.assertTrue(self.small_set.issuperset({1}))
+
+    def test_none(self):
+        self.assertIn(None, persistent_set_of(None, 1))
+        self.assertNotIn(None, PersistentSet())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import copy
+import math
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.dict import dict_of
+from tython.src.main.data_structures.list import list_of
+from tython.src.main.data_structures.placeholder import compile_placeholder, structural_hash, structurally_equal, \
+    placeholder_registry, PlaceholderRegistry, from_opcodes, opcodes_of
+from tython.src.main.data_structures.set import set_of
+
+
+class TestPlaceholder(unittest.TestCase):
+
+    def setUp(self):
+        self.small_list = list_of(1, 2, 3, 4, 5)
+
+    def test_arithmetic(self):
+        self.assertEqual(list_of(3, 5, 7, 9, 11), self.small_list.map(it * 2 + 1))
+        self.assertEqual(list_of(9, 8, 7, 6, 5), self.small_list.map(10 - it))
+        self.assertEqual(list_of(-1, -2, -3, -4, -5), self.small_list.map(-it))
+
+    def test_comparison(self):
+        self.assertEqual(list_of(3, 4, 5), self.small_list.filter(it > 2))
+        self.assertEqual(list_of(2, 4), self.small_list.filter(it % 2 == 0))
+
+    def test_attribute_item_and_call(self):
+        self.assertEqual(list_of("A", "B"), list_of("a", "b").map(it.upper()))
+        self.assertEqual(list_of("--a", "--b"), list_of("a", "b").map(it.rjust(3, "-")))
+        self.assertEqual(list_of(1, 2), list_of({"a": 1}, {"a": 2}).map(it["a"]))
+        self.assertEqual(list_of(2, 0), list_of([1, 2], []).map(it.size))
+
+    def test_set_and_dict(self):
+        self.assertEqual(set_of(2, 4, 6), set_of(1, 2, 3).map(it * 2))
+        self.assertEqual({"a": 1}, dict_of(a=1, b=2).filter(lambda key, value: value < 2))
+
+    def test_compiled_once(self):
+        placeholder = it * 2 + 1
+        compiled = compile_placeholder(placeholder)
+        self.assertIs(compiled, compile_placeholder(placeholder))
+        self.assertEqual(7, compiled(3))
+        self.assertEqual(7, placeholder.eval(3))
+
+    def test_shared_prefix(self):
+        prefix = it.a.b
+        left = prefix + 1
+        right = prefix * 2
+        self.assertIs(prefix._tail, left._tail.previous)
+        self.assertIs(prefix._tail, right._tail.previous)
+        self.assertEqual(["getattr", "getattr", "add"], [operation.operation for operation in left.operations])
+        self.assertEqual(2, len(prefix.operations))
+
+    def test_long_chain(self):
+        placeholder = it
+        for _ in range(500):
+            placeholder = placeholder + 1
+        self.assertEqual(500, placeholder.eval(0))
+
+    def test_structural_equality(self):
+        self.assertTrue(structurally_equal(it.field == 1, it.field == 1))
+        self.assertEqual(structural_hash(it.field == 1), structural_hash(it.field == 1))
+        self.assertFalse(structurally_equal(it.field == 1, it.field == 2))
+        self.assertFalse(structurally_equal(it.field == 1, it.field == 1.0))
+        self.assertFalse(structurally_equal(it.field == 1, it.other == 1))
+        self.assertFalse(structurally_equal(it.field, it.field == 1))
+        self.assertTrue(structurally_equal(it.get("a", default=1), it.get("a", default=1)))
+
+    def test_unhashable_operands(self):
+        operand = [1, 2]
+        self.assertTrue(structurally_equal(it + operand, it + operand))
+        self.assertFalse(structurally_equal(it + operand, it + [1, 2]))
+
+    def test_registry_reuses_compiled_shapes(self):
+        placeholder_registry.clear()
+        first = compile_placeholder(it.real == 3)
+        second = compile_placeholder(it.real == 4)
+        self.assertTrue(first(3))
+        self.assertTrue(second(4))
+        self.assertFalse(second(3))
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1, "max_size": placeholder_registry.max_size},
+                         placeholder_registry.stats())
+
+    def test_registry_is_bounded(self):
+        registry = PlaceholderRegistry(max_size=2)
+        registry.compiled(it + 1)
+        registry.compiled(it * 2)
+        registry.compiled(it - 3)
+        self.assertEqual(2, len(registry))
+        self.assertEqual(4, registry.compiled(it + 3)(1))
+        self.assertEqual(4, registry.misses)
+
+    def test_equal_but_distinct_operands(self):
+        self.assertEqual(0.0, (it * 0.0).eval(-1.0))
+        self.assertEqual(-1.0, math.copysign(1.0, (it * -0.0).eval(1.0)))
+        self.assertEqual("2.0", str((it + Decimal("1.0")).eval(1)))
+        self.assertEqual("2.00", str((it + Decimal("1.00")).eval(1)))
+
+    def test_pickle(self):
+        placeholder = it.strip().rjust(4, "-")[1:] + "!"
+        compile_placeholder(placeholder)
+        restored = pickle.loads(pickle.dumps(placeholder))
+        self.assertTrue(structurally_equal(placeholder, restored))
+        self.assertEqual("-ab!", restored.eval(" ab "))
+        self.assertEqual(3, pickle.loads(pickle.dumps(it)).eval(3))
+
+    def test_opcodes(self):
+        placeholder = it.get("a", default=0) * 2
+        self.assertEqual((("getattr", "get"), ("call", (("a",), {"default": 0})), ("mul", 2)), opcodes_of(placeholder))
+        self.assertTrue(structurally_equal(placeholder, from_opcodes(opcodes_of(placeholder))))
+        self.assertEqual((("getattr", "opcodes"),), opcodes_of(it.opcodes))
+
+    def test_copy(self):
+        placeholder = it + 1
+        self.assertIs(placeholder, copy.copy(placeholder))
+        self.assertIs(placeholder, copy.deepcopy(placeholder))
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.assertEqual([3, 5, 7], list(executor.map((it * 2 + 1).eval, [1, 2, 3])))
+
+    def test_tail_attribute(self):
+        node = type("Node", (), {"tail": 1})()
+        self.assertEqual(list_of(1), list_of(node).map(it.tail))
+        self.assertEqual(["getattr"], [operation.operation for operation in it.tail.operations])
+
+    def test_identity(self):
+        self.assertEqual(3, it.eval(3))
+
+    def test_repr(self):
+        self.assertEqual("self.__getattr__(upper).__call__(1, x=2).__add__(3)", repr(it.upper(1, x=2) + 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
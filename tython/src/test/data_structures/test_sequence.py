@@ -0,0 +1,64 @@
+import unittest
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.dict import dict_of
+from tython.src.main.data_structures.list import list_of, List
+from tython.src.main.data_structures.sequence import sequence_of, sequence_from
+from tython.src.main.data_structures.set import set_of
+
+
+class TestSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.list_with_none = list_of(1, 2, 3, None, 4, 5, 6, None, 8, 9, None)
+
+    def test_entry_points(self):
+        self.assertEqual(list_of(2, 4, 6), list_of(1, 2, 3).as_sequence().map(it * 2).to_list())
+        self.assertEqual(set_of(2, 4, 6), set_of(1, 2, 3).lazy().map(it * 2).to_set())
+        self.assertEqual({"a": 2}, dict_of(a=1, b=2).as_sequence().map(lambda item: (item[0], item[1] * 2)).filter(lambda item: item[0] == "a").to_dict())
+
+    def test_is_lazy(self):
+        calls = []
+        sequence = list_of(1, 2, 3).as_sequence().map(lambda it: calls.append(it) or it)
+        self.assertEqual([], calls)
+        self.assertEqual(1, sequence.first())
+        self.assertEqual([1], calls)
+
+    def test_single_pass(self):
+        calls = []
+        result = list_of(1, 2, 3).as_sequence() \
+            .map(lambda it: calls.append(("map", it)) or it) \
+            .filter(lambda it: calls.append(("filter", it)) or True) \
+            .to_list()
+        self.assertEqual(list_of(1, 2, 3), result)
+        self.assertEqual([("map", 1), ("filter", 1), ("map", 2), ("filter", 2), ("map", 3), ("filter", 3)], calls)
+
+    def test_operations(self):
+        sequence = self.list_with_none.as_sequence()
+        self.assertEqual(self.list_with_none.map_not_none(it * 2), sequence.map_not_none(it * 2).to_list())
+        self.assertEqual(self.list_with_none.filter_none(), sequence.filter_none().to_list())
+        self.assertEqual(list_of(0, 2, 4), sequence_of(0, 1, 2).map_indexed(lambda index, value: index + value).to_list())
+        self.assertEqual(list_of(1, 1, 2, 2), sequence_of(1, 2).flat_map(lambda it: [it, it]).to_list())
+
+    def test_fused_placeholder_maps(self):
+        sequence = sequence_of(1, 2, 3).map(it * 2).map(it + 1)
+        self.assertEqual(1, len(sequence._stages))
+        self.assertEqual(list_of(3, 5, 7), sequence.to_list())
+
+    def test_terminal_operations(self):
+        sequence = sequence_from(range(10))
+        self.assertEqual(45, sequence.fold(lambda acc, it: acc + it))
+        self.assertEqual(55, sequence.fold(lambda acc, it: acc + it, 10))
+        self.assertEqual(3, sequence.first(it > 2))
+        self.assertIsNone(sequence.first(it > 20))
+        self.assertEqual(10, sequence.count())
+        self.assertEqual(5, sequence.count(it % 2 == 0))
+
+    def test_reusable(self):
+        sequence = list_of(1, 2, 3).as_sequence().map(it * 2)
+        self.assertEqual(sequence.to_list(), sequence.to_list())
+        self.assertIsInstance(sequence.to_list(), List)
+
+
+if __name__ == '__main__':
+    unittest.main()
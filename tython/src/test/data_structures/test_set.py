@@ -1,7 +1,7 @@
 import unittest
 from functools import reduce
 
-from tython.src.main.data_structures.set import set_of, set_from
+from tython.src.main.data_structures.set import set_of, set_from, frozen_set_of, FrozenSet, Set
 
 
 # noinspection DuplicatedCode
@@ -23,6 +23,41 @@ class TestSet(unittest.TestCase):
         set_a = {1, 2, 3}
         self.assertEqual(set_a, set_from(set_a))
 
+    def test_equality(self):
+        self.assertEqual(set_of(1, 2, 3), {3, 2, 1})
+        self.assertNotEqual(set_of(1, 2), set_of(1, 2, 3))
+        self.assertNotEqual(set_of(1, 2, 3), set_of(1, 2))
+        self.assertNotEqual(set_of(1, 2), [1, 2])
+        self.assertEqual(set_of(1, 2), frozen_set_of(2, 1))
+
+    def test_hash(self):
+        # Same elements inserted in different orders
+        first = set_of(*range(0, 100, 3), "a", "b")
+        second = set_of("b", "a", *range(99, -1, -3))
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(hash(frozenset(first)), hash(first))
+
+    def test_frozen_set(self):
+        frozen = self.small_set.freeze()
+        self.assertIsInstance(frozen, FrozenSet)
+        self.assertEqual(hash(frozenset(self.small_set)), hash(frozen))
+        self.assertEqual({1, 2, 3, 4, 5, 6}, frozen.add(6))
+        self.assertIsInstance(frozen.add(6), FrozenSet)
+        self.assertIs(frozen, frozen.add(1))
+        for name in ("update", "discard", "add_element", "clear", "intersection_update"):
+            self.assertRaises(AttributeError, getattr, frozen, name)
+        self.assertEqual({2, 3, 4, 5}, frozen.remove(1))
+        self.assertEqual({1, 2, 3, 4, 5, 6, 7}, frozen + [6, 7])
+        self.assertEqual({1}, frozen - [2, 3, 4, 5])
+        self.assertEqual({2, 4, 6, 8, 10}, frozen.map(lambda it: it * 2))
+        self.assertIsInstance(frozen.map(lambda it: it * 2), Set)
+
+    def test_frozen_set_as_key(self):
+        cache = {frozen_set_of(frozen_set_of(1, 2), frozen_set_of(3)): "cached"}
+        self.assertEqual("cached", cache[frozen_set_of(frozen_set_of(3), frozen_set_of(2, 1))])
+        self.assertEqual("cached", cache[frozenset({frozenset({1, 2}), frozenset({3})})])
+
     def test_map(self):
         doubled_set = set(map(lambda it: it * 2, self.integer_set))
         functional_doubled_set = self.integer_set.map(lambda it: it * 2)
@@ -74,6 +109,24 @@ class TestSet(unittest.TestCase):
         self.assertTrue(self.small_set.any(lambda it: it > 4))
         self.assertFalse(self.small_set.any(lambda it: it > 5))
 
+    def test_short_circuit(self):
+        calls = []
+
+        def predicate(it):
+            calls.append(it)
+            return True
+
+        self.assertTrue(self.integer_set.any(predicate))
+        self.assertEqual(1, len(calls))
+        self.assertFalse(self.integer_set.none(predicate))
+        self.assertIn(self.integer_set.first(predicate), self.integer_set)
+        self.assertEqual(3, len(calls))
+
+    def test_indexed_terminals(self):
+        self.assertEqual(0, self.small_set.first_indexed(lambda index, value: index))
+        self.assertIn(self.set_with_none.first_indexed_not_none(lambda index, value: value), self.set_with_none)
+        self.assertIsNotNone(self.set_with_none.first_not_none())
+
     def test_add(self):
         self.assertEqual(set_of(1, 2, 3, 4, 5, 6), self.small_set.add(6))
 
@@ -81,7 +134,11 @@ class TestSet(unittest.TestCase):
         self.assertEqual(set_of(1, 2, 3, 4, 5, 6, 7, 8, 9, 10), self.small_set.add_all(self.integer_set))
 
     def test_remove(self):
-        self.assertEqual(set_of(1, 2, 3, 4, 5), self.integer_set.remove(6))
+        self.assertEqual(set_of(1, 2, 3, 4, 5, 7, 8, 9, 10), self.integer_set.remove(6))
+
+    def test_remove_and_retain_all(self):
+        self.assertEqual(set_of(1, 3), set_of(1, 2, 3).remove_all([2, [4]]))
+        self.assertEqual(set_of(2), set_of(1, 2, 3).retain_all([2, [4]]))
 
     def test_length(self):
         self.assertEqual(5, self.small_set.length())
@@ -108,7 +165,7 @@ class TestSet(unittest.TestCase):
         self.assertEqual({0: 1, 1: 2, 2: 3, 4: 4, 5: 5, 6: 6, 8: 8, 9: 9}, self.set_with_none.map_not_none_indexed_to_dict(lambda index, value: (index, value)))
 
     def test_map_not_none_indexed_to_list(self):
-        self.assertEqual([(0, 1), (1, 2), (3, 4), (6, 8), (2, 3), (7, 9), (4, 5), (5, 6)], self.set_with_none.map_not_none_indexed_to_list(lambda index, value: (index, value)))
+        self.assertEqual([(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 8), (7, 9)], self.set_with_none.map_not_none_indexed_to_list(lambda index, value: (index, value)))
 
     def test_map_indexed_to_dict(self):
         self.assertEqual({0: 1, 1: 2, 2: 3, 3: None, 4: 4, 5: 5, 6: 6, 7: None, 8: 8, 9: 9, 10: None}, self.set_with_none.map_indexed_to_dict(lambda index, value: (index, value)))
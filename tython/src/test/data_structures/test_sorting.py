@@ -0,0 +1,82 @@
+import random
+import unittest
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.list import List, list_of
+from tython.src.main.data_structures.set import set_of
+from tython.src.main.data_structures.sorting import SortedList
+
+
+class TestSorting(unittest.TestCase):
+
+    def setUp(self):
+        self.people = list_of(("bob", 25), ("alice", 30), ("carol", 25), ("dave", 30), ("erin", 20))
+        random.seed(7)
+        self.random_list = List(random.randint(0, 50) for _ in range(500))
+
+    def test_sorted_by(self):
+        self.assertEqual(list_of(("erin", 20), ("bob", 25), ("carol", 25), ("alice", 30), ("dave", 30)),
+                         self.people.sorted_by(it[1]))
+        self.assertEqual(list_of(("alice", 30), ("dave", 30), ("bob", 25), ("carol", 25), ("erin", 20)),
+                         self.people.sorted_by_descending(lambda it: it[1]))
+        self.assertIsInstance(self.people.sorted_by(it[1]), SortedList)
+        self.assertEqual(list_of(), List().sorted_by(it))
+
+    def test_then_by(self):
+        self.assertEqual(list_of(("erin", 20), ("carol", 25), ("bob", 25), ("dave", 30), ("alice", 30)),
+                         self.people.sorted_by(it[1]).then_by_descending(it[0]))
+        self.assertEqual(list_of(("alice", 30), ("dave", 30), ("bob", 25), ("carol", 25), ("erin", 20)),
+                         self.people.sorted_by_descending(it[1]).then_by(it[0]))
+        pairs = List((value % 7, value % 3) for value in self.random_list)
+        self.assertEqual(sorted(pairs, key=lambda pair: (pair[0], -pair[1])),
+                         pairs.sorted_by(it[0]).then_by_descending(it[1]))
+
+    def test_top_and_bottom_k(self):
+        self.assertEqual(sorted(self.random_list, reverse=True)[:10], self.random_list.top_k(10))
+        self.assertEqual(sorted(self.random_list)[:10], self.random_list.bottom_k(10))
+        self.assertEqual(list_of(("alice", 30), ("dave", 30)), self.people.top_k(2, it[1]))
+        self.assertEqual(list_of(5, 4), set_of(1, 2, 3, 4, 5).top_k(2))
+        self.assertIsInstance(set_of(1, 2, 3).bottom_k(2), List)
+
+    def test_nth_smallest(self):
+        ordered = sorted(self.random_list)
+        for n in (0, 1, 250, 499, -1):
+            self.assertEqual(ordered[n], self.random_list.nth_smallest(n))
+        self.assertEqual(("bob", 25), self.people.nth_smallest(1, it[1]))
+        self.assertEqual(("carol", 25), self.people.nth_smallest(2, it[1]))
+        self.assertEqual(3, set_of(5, 1, 3).nth_smallest(1))
+        self.assertRaises(IndexError, lambda: list_of(1, 2).nth_smallest(2))
+        self.assertRaises(IndexError, lambda: List().nth_smallest(0))
+
+    def test_sorted_sequence(self):
+        self.assertEqual(sorted(self.random_list), self.random_list.sorted_sequence().to_list())
+        self.assertEqual(sorted(self.random_list, reverse=True),
+                         self.random_list.sorted_sequence(descending=True).to_list())
+        self.assertEqual(sorted(self.people, key=lambda person: person[1], reverse=True),
+                         self.people.sorted_sequence(it[1], descending=True).to_list())
+        self.assertEqual(["erin", "bob"], self.people.sorted_sequence(it[1]).map(it[0]).to_list()[:2])
+        self.assertEqual(("bob", 25), self.people.sorted_sequence(it[1]).first(lambda it: it[1] > 20))
+
+    def test_sorted_sequence_is_lazy(self):
+        comparisons = 0
+
+        class Key:
+            def __init__(self, value):
+                self.value = value
+
+            def __lt__(self, other):
+                nonlocal comparisons
+                comparisons += 1
+                return self.value < other.value
+
+            def __eq__(self, other):
+                return self.value == other.value
+
+        values = List(range(2000, 0, -1))
+        self.assertEqual(1, values.sorted_sequence(Key).first())
+        # Heapify and a single pop, far below the n log n comparisons of a full sort
+        self.assertLess(comparisons, 3 * len(values))
+
+
+if __name__ == '__main__':
+    unittest.main()
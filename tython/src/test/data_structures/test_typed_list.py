@@ -0,0 +1,94 @@
+import math
+import sys
+import unittest
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.list import List, list_of
+from tython.src.main.data_structures.typed_list import TypedList
+from tython.src.main.data_structures.vectorized import MIN_VECTORIZED_LENGTH, numpy
+
+
+class TestTypedList(unittest.TestCase):
+
+    def setUp(self):
+        self.small_list = list_of(1, 2, 3, 4, 5).of_type(int, compact=True)
+        # Long enough for the NumPy path when it is installed
+        self.long_list = List(range(-500, 500)).of_type(int, compact=True)
+        self.float_list = List(map(float, range(1000))).of_type(float, compact=True)
+
+    def test_of_type(self):
+        self.assertIsInstance(self.small_list, TypedList)
+        self.assertEqual("q", self.small_list.buffer.typecode)
+        self.assertIsInstance(list_of("a").of_type(str, compact=True), List)
+        self.assertIsInstance(list_of(2 ** 70).of_type(int, compact=True), List)
+        self.assertRaises(TypeError, lambda: list_of(1, "a").of_type(int, compact=True))
+
+    def test_sequence(self):
+        self.assertEqual(list_of(1, 2, 3, 4, 5), self.small_list)
+        self.assertEqual(5, len(self.small_list))
+        self.assertEqual(5, self.small_list[-1])
+        self.assertEqual(list_of(2, 3), self.small_list[1:3])
+        self.assertIsInstance(self.small_list[1:3], TypedList)
+        self.assertEqual([5, 4, 3, 2, 1], list(reversed(self.small_list)))
+        self.assertIn(3, self.small_list)
+        self.assertEqual(list_of(1, 2, 3, 4, 5), self.small_list.to_list())
+
+    def test_bool(self):
+        typed = list_of(True, False, True).of_type(bool, compact=True)
+        self.assertEqual([True, False, True], list(typed))
+        self.assertIs(True, typed[0])
+        self.assertEqual(2, typed.sum())
+        long_typed = List([True, False] * MIN_VECTORIZED_LENGTH).of_type(bool, compact=True)
+        self.assertIs(True, long_typed.max())
+        self.assertIs(False, long_typed.min())
+
+    def test_map(self):
+        self.assertEqual(list_of(2, 4, 6, 8, 10), self.small_list.map(it * 2))
+        self.assertEqual(list_of("1", "2", "3", "4", "5"), self.small_list.map(str))
+        self.assertIsInstance(self.small_list.map(it * 2), List)
+        self.assertEqual(List(range(-1000, 1000, 2)), self.long_list.map(it * 2))
+
+    def test_filter(self):
+        self.assertEqual(list_of(2, 4), self.small_list.filter(lambda it: it % 2 == 0))
+        self.assertEqual(List(range(-500, 500, 2)), self.long_list.filter(it % 2 == 0))
+        self.assertIsInstance(self.long_list.filter(it % 2 == 0), TypedList)
+
+    def test_fold(self):
+        self.assertEqual(15, self.small_list.fold(lambda acc, it: acc + it))
+        self.assertEqual(25, self.small_list.fold(lambda acc, it: acc + it, 10))
+
+    def test_reductions(self):
+        for typed in (self.small_list, self.long_list, self.float_list):
+            values = list(typed)
+            self.assertEqual(sum(values), typed.sum())
+            self.assertEqual(min(values), typed.min())
+            self.assertEqual(max(values), typed.max())
+            self.assertEqual(sum(values) / len(values), typed.average())
+            self.assertEqual(sum(value * 3 for value in values), typed.sum(it * 3))
+            self.assertEqual(min(-value for value in values), typed.min(-it))
+            self.assertEqual(max(value % 7 for value in values), typed.max(lambda it: it % 7))
+        self.assertIsInstance(self.long_list.max(), int)
+        self.assertIsInstance(self.float_list.min(), float)
+        self.assertRaises(ValueError, lambda: TypedList().average())
+        self.assertRaises(ValueError, lambda: TypedList().min())
+
+    def test_nan(self):
+        values = [1.0] * MIN_VECTORIZED_LENGTH + [math.nan, 0.0]
+        typed = List(values).of_type(float, compact=True)
+        self.assertEqual(min(values), typed.min())
+        self.assertTrue(math.isnan(typed.sum()))
+
+    def test_memory(self):
+        boxed = List(range(1000, 2000))
+        typed = boxed.of_type(int, compact=True)
+        boxed_size = sys.getsizeof(boxed) + sum(map(sys.getsizeof, boxed))
+        self.assertLess(sys.getsizeof(typed.buffer) * 4, boxed_size)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_vectorized(self):
+        self.assertIsNotNone(self.long_list._view())
+        self.assertIsNone(self.small_list._view())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.list import List, list_from
+from tython.src.main.data_structures.vectorized import vectorized_eval, numpy, MIN_VECTORIZED_LENGTH
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestVectorized(unittest.TestCase):
+
+    def setUp(self):
+        self.integer_list = list_from(range(-MIN_VECTORIZED_LENGTH, MIN_VECTORIZED_LENGTH)).of_type(int)
+        self.float_list = list_from(value / 7 for value in range(-MIN_VECTORIZED_LENGTH, MIN_VECTORIZED_LENGTH)).of_type(float)
+
+    def assertSameAsPerElement(self, values, placeholder):
+        self.assertIsNotNone(vectorized_eval(placeholder, values, values.list_type))
+        expected = List(map(placeholder.eval, values))
+        result = values.map(placeholder)
+        self.assertEqual(expected, result)
+        self.assertEqual(list(map(type, expected)), list(map(type, result)))
+
+    def test_map_integers(self):
+        for placeholder in [it * 2 + 1, 10 - it, it / 3, it // 7, it % 5, -it, abs(it), ~it, it >= 0, (it > 0) + 1, it * 1.5]:
+            self.assertSameAsPerElement(self.integer_list, placeholder)
+
+    def test_map_floats(self):
+        for placeholder in [it * 2 + 1, 10 - it, it / 3, it // 7, it % 5, -it, abs(it), it < 0.5]:
+            self.assertSameAsPerElement(self.float_list, placeholder)
+
+    def test_filter(self):
+        self.assertEqual(self.integer_list.filter(lambda value: value % 3 == 0), self.integer_list.filter(it % 3 == 0))
+        self.assertEqual(self.float_list.filter(lambda value: value > 1), self.float_list.filter(it > 1))
+
+    def test_sum(self):
+        self.assertEqual(sum(value * 2 for value in self.integer_list), self.integer_list.sum(it * 2))
+        self.assertEqual(sum(value * 2 for value in self.float_list), self.float_list.sum(it * 2))
+        self.assertEqual(sum(self.integer_list), self.integer_list.sum())
+
+    def test_falls_back_on_unsupported_chains(self):
+        for placeholder in [it.real, it ** 2, it + "a", it * 2 ** 60, it]:
+            self.assertIsNone(vectorized_eval(placeholder, self.integer_list, int))
+        self.assertEqual(List(value.real for value in self.integer_list), self.integer_list.map(it.real))
+
+    def test_falls_back_on_inexact_integers(self):
+        large = List([2 ** 53 + 1] * MIN_VECTORIZED_LENGTH).of_type(int)
+        self.assertIsNone(vectorized_eval(it == float(2 ** 53), large, int))
+        self.assertEqual(List(), large.filter(it == float(2 ** 53)))
+        self.assertEqual(List([True] * MIN_VECTORIZED_LENGTH), large.map(it > 9007199254740992.0))
+        compact = large.of_type(int, compact=True)
+        self.assertEqual(0, compact.filter(it == float(2 ** 53)).length())
+        self.assertEqual(List([True] * MIN_VECTORIZED_LENGTH), compact.map(it > 9007199254740992.0))
+
+    def test_falls_back_on_division_by_zero(self):
+        self.assertIsNone(vectorized_eval(1 / it, self.integer_list, int))
+        with self.assertRaises(ZeroDivisionError):
+            self.integer_list.map(1 / it)
+
+    def test_untyped_list_is_not_vectorized(self):
+        self.assertIsNone(vectorized_eval(it * 2, list_from(self.integer_list), List.list_type))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import tracemalloc
+import unittest
+from array import array
+
+from tython.src.main.data_structures.constants import it
+from tython.src.main.data_structures.list import list_of, list_from
+from tython.src.main.data_structures.sequence import sequence_from
+from tython.src.main.data_structures.set import set_of
+from tython.src.main.data_structures.windows import ListView, Windows, windowed
+
+
+class TestWindows(unittest.TestCase):
+
+    def setUp(self):
+        self.integer_list = list_from(range(10))
+
+    def test_windowed(self):
+        self.assertEqual([[0, 1, 2], [2, 3, 4], [4, 5, 6], [6, 7, 8]], self.integer_list.windowed(3, 2).to_list())
+        self.assertEqual([[0, 1, 2, 3], [3, 4, 5, 6], [6, 7, 8, 9], [9]],
+                         self.integer_list.windowed(4, 3, partial=True).to_list())
+        self.assertEqual([[0, 1], [5, 6]], self.integer_list.windowed(2, 5).to_list())
+        self.assertEqual([], list_of(1, 2).windowed(3).to_list())
+
+    def test_chunked(self):
+        self.assertEqual([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]], self.integer_list.chunked(4).to_list())
+        self.assertEqual([], list_of().chunked(4).to_list())
+        with self.assertRaises(ValueError):
+            self.integer_list.chunked(0)
+
+    def test_views_share_storage(self):
+        values = list_of(1, 2, 3, 4)
+        first = next(iter(values.chunked(2)))
+        self.assertIsInstance(first, ListView)
+        values[0] = 10
+        self.assertEqual([10, 2], first)
+        self.assertEqual(list_of(10, 2), first.to_list())
+        self.assertEqual([2], first[1:])
+        self.assertEqual(2, first[-1])
+
+    def test_windows_do_not_copy(self):
+        values = list_from(range(100_000))
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in values.windowed(1000))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(99_001, count)
+        self.assertLess(peak, 100_000)
+
+    def test_streaming_windows(self):
+        self.assertEqual([(0, 1, 2), (4, 5, 6), (8, 9)],
+                         self.integer_list.as_sequence().map(it + 0).windowed(3, 4, partial=True).to_list())
+        self.assertEqual([(0, 1), (2, 3)], list(windowed(iter(range(5)), 2, 2)))
+        self.assertEqual([(1, 2), (3,)], sequence_from(iter([1, 2, 3])).chunked(2).to_list())
+
+    def test_buffer_windows(self):
+        windows = list(Windows(array("q", range(5)), 2, 2, partial=True))
+        self.assertTrue(all(isinstance(window, memoryview) for window in windows))
+        self.assertEqual([[0, 1], [2, 3], [4]], [window.tolist() for window in windows])
+        compact = self.integer_list.of_type(int, compact=True)
+        self.assertEqual([[0, 1, 2], [3, 4, 5], [6, 7, 8]],
+                         compact.windowed(3, 3).map(lambda window: window.tolist()).to_list())
+
+    def test_batched(self):
+        self.assertEqual([(0, 1, 2, 3), (4, 5, 6, 7), (8, 9)], self.integer_list.batched(4).to_list())
+
+    def test_zip_with_next(self):
+        self.assertEqual(list_of((1, 3), (3, 6)), list_of(1, 3, 6).zip_with_next())
+        self.assertEqual(list_of(2, 3), list_of(1, 3, 6).zip_with_next(lambda left, right: right - left))
+        self.assertEqual(list_of((1, 3)), list_of(1, 3).pairwise())
+        self.assertEqual([3, 5], sequence_from([1, 2, 3]).zip_with_next(lambda left, right: left + right).to_list())
+
+    def test_set(self):
+        self.assertEqual([(1, 2), (3,)], set_of(1, 2, 3).chunked(2).to_list())
+        self.assertEqual(list_of((1, 2), (2, 3)), set_of(1, 2, 3).zip_with_next())
+
+
+if __name__ == '__main__':
+    unittest.main()